@@ -2,95 +2,94 @@
 """
 다크모드 클래스 자동 추가 스크립트
 주요 컴포넌트에 다크모드 Tailwind 클래스를 추가합니다.
+매핑은 codemods/darkmode.json 팔레트 정책에서 만듭니다 (--policy).
 """
 
-import os
-import re
+import argparse
+import sys
+from functools import partial
 from pathlib import Path
 
-# 다크모드 매핑
-DARK_MODE_MAP = {
-    # 배경색
-    r'bg-white(?![a-z-])': 'bg-white dark:bg-gray-800',
-    r'bg-gray-50(?![a-z0-9-])': 'bg-gray-50 dark:bg-gray-900',
-    r'bg-gray-100(?![a-z0-9-])': 'bg-gray-100 dark:bg-gray-800',
-
-    # 텍스트 색상
-    r'text-gray-900(?![a-z0-9-])': 'text-gray-900 dark:text-gray-100',
-    r'text-gray-800(?![a-z0-9-])': 'text-gray-800 dark:text-gray-200',
-    r'text-gray-700(?![a-z0-9-])': 'text-gray-700 dark:text-gray-300',
-    r'text-gray-600(?![a-z0-9-])': 'text-gray-600 dark:text-gray-400',
-    r'text-gray-500(?![a-z0-9-])': 'text-gray-500 dark:text-gray-400',
-
-    # 보더
-    r'border-gray-200(?![a-z0-9-])': 'border-gray-200 dark:border-gray-700',
-    r'border-gray-300(?![a-z0-9-])': 'border-gray-300 dark:border-gray-600',
-}
-
-def add_dark_mode_to_file(filepath):
+from codemods.cache import add_cache_argument, open_manifest
+from codemods.converge import converge
+from codemods.darkmode import DEFAULT_POLICY_PATH, load_engine, load_policy
+from codemods.discover import walk_files
+from codemods.fileio import read_source, write_source
+from codemods.gitfiles import add_git_arguments, find_project_root, select_files
+from codemods.guard import add_budget_argument
+from codemods.journal import Transaction, add_undo_argument, undo_last_run
+from codemods.lexer import lex
+from codemods.patch import add_dry_run_arguments, open_preview
+from codemods.runner import add_jobs_argument, run_files
+from codemods.stats import add_stats_arguments, open_stats
+from codemods.tokenindex import add_index_argument, open_index, token_patterns
+
+def add_dark_mode_to_file(filepath, policy_path=DEFAULT_POLICY_PATH):
     """파일에 다크모드 클래스 추가"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        original_content = content
-        modified = False
-
-        # 각 패턴에 대해 변경
-        for pattern, replacement in DARK_MODE_MAP.items():
-            # 이미 dark: 클래스가 있는 경우 스킵
-            if 'dark:' in pattern:
-                continue
+    content = read_source(filepath)
+    engine = load_engine(policy_path)
 
-            # 패턴 찾기
-            matches = list(re.finditer(pattern, content))
-            if not matches:
-                continue
+    # className 토큰마다 정책 테이블을 한 번씩 조회하고 한 번의 join으로 재조립
+    # 같은 className에 이미 dark: 형제가 있는 토큰은 스킵, 더 바뀌지 않을 때까지 반복
+    content, modified, _ = converge(lambda text: engine.apply(text, lex(text)), content)
 
-            # 이미 dark 모드가 적용된 경우 스킵
-            for match in matches:
-                start, end = match.span()
-                # 앞뒤 50자 확인
-                context = content[max(0, start-50):min(len(content), end+50)]
-                if 'dark:' in context and pattern.split('(?')[0] in context:
-                    continue
-
-                # 변경
-                content = content[:start] + replacement + content[end:]
-                modified = True
-                # 오프셋 조정
-                offset = len(replacement) - (end - start)
-                for i in range(len(matches)):
-                    if matches[i].start() > start:
-                        matches[i] = re.search(pattern, content[matches[i].start() + offset:])
-
-        # 변경사항이 있으면 파일 저장
-        if modified and content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
-            return True
-    except Exception as e:
-        print(f"❌ Error processing {filepath}: {e}")
+    # 변경사항이 있으면 파일 저장
+    if modified:
+        write_source(filepath, content)
+        return True
 
     return False
 
 def main():
     """메인 함수"""
-    components_dir = Path("/Users/choihyodong/bs-learning-app-main/src/components")
+    parser = argparse.ArgumentParser(description='다크모드 클래스 자동 추가')
+    parser.add_argument('--policy', type=Path, default=DEFAULT_POLICY_PATH,
+                        help=f'다크모드 정책 파일 (기본: codemods/{DEFAULT_POLICY_PATH.name})')
+    add_jobs_argument(parser)
+    add_budget_argument(parser)
+    add_cache_argument(parser)
+    add_index_argument(parser)
+    add_git_arguments(parser)
+    add_stats_arguments(parser)
+    add_undo_argument(parser)
+    add_dry_run_arguments(parser)
+    args = parser.parse_args()
+
+    project_root = find_project_root()
+    if args.undo:
+        return undo_last_run(project_root, 'dark-mode')
+    components_dir = project_root / 'src' / 'components'
+    policy_path = args.policy.resolve()
+    policy = load_policy(policy_path)
+    manifest = open_manifest(args, project_root, 'dark-mode', __file__, policy)
+    run_stats = open_stats(args, project_root, 'dark-mode')
+    transaction = Transaction(project_root, 'dark-mode')
+    preview = open_preview(args, project_root)
 
     print("🌙 다크모드 클래스 자동 추가 시작...")
     print(f"📁 디렉토리: {components_dir}")
+    print(f"🎨 정책: {policy_path.name} ({len(load_engine(policy_path))}개 토큰 매핑)")
     print()
 
     total = 0
     modified = 0
 
-    # 모든 .tsx 파일 찾기
-    for tsx_file in components_dir.rglob("*.tsx"):
+    # 모든 .tsx 파일 찾기 (탐색하면서 바로 처리)
+    with run_stats.phase('discover'):
+        tsx_files = select_files(args, project_root, components_dir, {'.tsx'},
+                                 lambda: walk_files(components_dir, {'.tsx'}, project_root))
+        index = open_index(args, project_root, token_patterns(load_engine(policy_path).table))
+
+    for result in run_files(partial(add_dark_mode_to_file, policy_path=policy_path), tsx_files, jobs=args.jobs,
+                            manifest=manifest, cacheable=lambda changed: not changed,
+                            stats=run_stats, transaction=transaction, preview=preview, index=index,
+                            budget=args.rule_budget):
         total += 1
-        if add_dark_mode_to_file(tsx_file):
+        if result.error:
+            print(f"❌ Error processing {result.path}: {result.error}")
+        elif result.value:
             modified += 1
-            print(f"✅ {tsx_file.name}")
+            print(f"✅ {result.path.name}")
 
     print()
     print("📊 완료!")
@@ -99,5 +98,10 @@ def main():
     print()
     print("⚠️  주의: 일부 파일은 수동 검토가 필요할 수 있습니다.")
 
+    if preview is not None:
+        preview.finish()
+    transaction.report(sys.argv[0])
+    run_stats.finish()
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+스타일 가이드 규칙 일괄 적용
+- codemods/rules.json의 활성 규칙(버튼, 카드, 다크모드)을 한 번에 적용
+- 파일마다 한 번 읽고, 한 번 변환하고, 바뀐 경우에만 한 번 씁니다
+"""
+
+import argparse
+import sys
+from collections import Counter
+from functools import partial
+from pathlib import Path
+
+from codemods.cache import add_cache_argument, open_manifest
+from codemods.converge import converge
+from codemods.discover import walk_files
+from codemods.fileio import read_source, write_source
+from codemods.gitfiles import add_git_arguments, find_project_root, select_files
+from codemods.guard import add_budget_argument, lint_rules
+from codemods.journal import Transaction, add_undo_argument, undo_last_run
+from codemods.lexer import lex
+from codemods.rules import DEFAULT_RULES_PATH, load_rules, load_ruleset
+from codemods.patch import add_dry_run_arguments, open_preview
+from codemods.runner import add_jobs_argument, run_files
+from codemods.selectors import project_path
+from codemods.stats import add_stats_arguments, open_stats
+from codemods.tokenindex import add_index_argument, open_index, rule_patterns
+
+def process_file(filepath, rules_path=DEFAULT_RULES_PATH, root=None):
+    """파일 처리 - 규칙별 변경 수 반환 (변경 없으면 None)"""
+    original_content = read_source(filepath)
+    path = project_path(filepath, root)
+
+    ruleset = load_ruleset(rules_path)
+    # 규칙 결과에 다시 규칙이 걸리지 않을 때까지 반복 (한 번 실행으로 최종 상태)
+    modified_content, counts, _ = converge(
+        lambda content: ruleset.apply(content, lex(content), path), original_content)
+
+    if modified_content != original_content:
+        write_source(filepath, modified_content)
+        return dict(counts)
+
+    return None
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='스타일 가이드 규칙 일괄 적용')
+    parser.add_argument('--rules', type=Path, default=DEFAULT_RULES_PATH, help='규칙 파일 (JSON)')
+    add_jobs_argument(parser)
+    add_budget_argument(parser)
+    add_cache_argument(parser)
+    add_index_argument(parser)
+    add_git_arguments(parser)
+    add_stats_arguments(parser)
+    add_undo_argument(parser)
+    add_dry_run_arguments(parser)
+    args = parser.parse_args()
+
+    rules_path = args.rules.resolve()
+    rules = load_rules(rules_path)
+    active = [rule['id'] for rule in rules['rules'] if rule.get('enabled', True)]
+    for rule_id, pattern, message in lint_rules(rules):
+        print(f"⚠️  규칙 {rule_id}: {pattern!r} {message}")
+
+    project_root = find_project_root()
+    if args.undo:
+        return undo_last_run(project_root, 'style-rules')
+    src_path = project_root / 'src'
+    manifest = open_manifest(args, project_root, 'style-rules', __file__, rules)
+    run_stats = open_stats(args, project_root, 'style-rules')
+    transaction = Transaction(project_root, 'style-rules')
+    preview = open_preview(args, project_root)
+
+    print("🔧 스타일 가이드 규칙 적용...")
+    print(f"📋 활성 규칙: {', '.join(active)}")
+    print("=" * 80)
+
+    # node_modules, .next, .gitignore 대상은 내려가지 않음
+    suffixes = {'.tsx', '.jsx', '.ts', '.js'}
+    with run_stats.phase('discover'):
+        all_files = select_files(args, project_root, src_path, suffixes,
+                                 lambda: walk_files(src_path, suffixes, project_root))
+        index = open_index(args, project_root,
+                           rule_patterns(rule for rule in rules['rules'] if rule.get('enabled', True)))
+
+    print(f"\n📁 {src_path} 검사 중...\n")
+
+    checked = 0
+    modified_files = []
+    totals = Counter()
+
+    for result in run_files(partial(process_file, rules_path=rules_path, root=project_root), all_files, jobs=args.jobs,
+                            manifest=manifest, cacheable=lambda counts: not counts,
+                            stats=run_stats, transaction=transaction, preview=preview, index=index,
+                            budget=args.rule_budget):
+        checked += 1
+        if result.error:
+            print(f"❌ 오류 ({result.path}): {result.error}")
+        elif result.value:
+            rel_path = result.path.relative_to(project_root)
+            modified_files.append(str(rel_path))
+            totals.update(result.value)
+            print(f"✅ {rel_path}")
+            for rule_id, count in result.value.items():
+                print(f"  - {rule_id}: {count}개 변경")
+
+    print("\n" + "=" * 80)
+    print(f"✨ 완료: {checked}개 파일 중 {len(modified_files)}개 파일 수정됨")
+
+    if totals:
+        print("\n규칙별 변경:")
+        for rule_id in active:
+            if totals[rule_id]:
+                print(f"  - {rule_id}: {totals[rule_id]}개")
+
+    if preview is not None:
+        preview.finish()
+    transaction.report(sys.argv[0])
+    run_stats.finish()
+
+if __name__ == '__main__':
+    sys.exit(main())
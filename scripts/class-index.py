@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+className 사용처 인덱스와 질의
+- update: 바뀐 파일만 다시 색인 (.codemod-cache/class-index.sqlite3)
+- query: 요소 단위 질의 (질의 전에 증분 갱신)
+- clusters: 거의 같은 className 목록을 MinHash/LSH로 묶어 컴포넌트 추출 후보 보고
+
+예:
+  python3 scripts/class-index.py query --tag div --has rounded-2xl
+  python3 scripts/class-index.py query --tag button --missing-variant dark:
+  python3 scripts/class-index.py clusters --tag button --threshold 0.8
+  python3 scripts/class-index.py query --sql "SELECT utility, COUNT(*) FROM tokens GROUP BY 1 ORDER BY 2 DESC LIMIT 20"
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+from collections import Counter
+
+from codemods.classindex import ClassIndex, build_query
+from codemods.discover import walk_files
+from codemods.gitfiles import find_project_root
+from codemods.minhash import DEFAULT_NUM_PERM, cluster_sets, consensus
+from codemods.runner import add_jobs_argument
+from codemods.stats import add_stats_arguments, open_stats
+
+SUFFIXES = ('.tsx', '.ts', '.jsx', '.js')
+
+
+def update_index(index, args, run_stats):
+    """src 전체를 훑어 인덱스 갱신 (stat이 같은 파일은 열지 않음)"""
+    src_path = index.root / 'src'
+    started = time.perf_counter()
+    with run_stats.phase('discover'):
+        files = list(walk_files(src_path, SUFFIXES, index.root))
+    indexed, removed, errors = index.update(files, jobs=args.jobs, stats=run_stats)
+    for path, error in errors:
+        print(f"❌ 오류 발생 ({path}): {error}", file=sys.stderr)
+    return indexed, removed, time.perf_counter() - started
+
+
+def print_rows(rows, as_json, columns=None):
+    if as_json:
+        if columns is None:
+            columns = ('path', 'line', 'tag', 'classes')
+        for row in rows:
+            print(json.dumps(dict(zip(columns, row)), ensure_ascii=False))
+        return
+    for row in rows:
+        if columns is None:
+            path, line, tag, classes = row
+            print(f"{path}:{line}  <{tag or 'cn()'}>  {classes}")
+        else:
+            print('\t'.join('' if value is None else str(value) for value in row))
+
+
+def run_query(index, args):
+    """질의 실행 후 결과 수 반환"""
+    started = time.perf_counter()
+    if args.sql:
+        try:
+            cursor = index.conn.execute(args.sql)
+        except sqlite3.Error as e:
+            print(f"❌ SQL 오류: {e}", file=sys.stderr)
+            return None
+        columns = [description[0] for description in cursor.description or ()]
+    else:
+        sql, params = build_query(tags=args.tag, has=args.has, lacks=args.lacks,
+                                  missing_variant=args.missing_variant,
+                                  kind=args.kind, path=args.path)
+        if args.limit:
+            sql += f' LIMIT {int(args.limit)}'
+        cursor = index.conn.execute(sql, params)
+        columns = None
+    rows = cursor.fetchall()
+    elapsed = time.perf_counter() - started
+
+    if args.count:
+        print(len(rows))
+    else:
+        if args.sql and not args.json and columns:
+            print('\t'.join(columns))
+        print_rows(rows, args.json, columns)
+    if not args.json and not args.count:
+        print(f"\n🔎 {len(rows)}개 결과 ({elapsed * 1000:.1f}ms)", file=sys.stderr)
+    return len(rows)
+
+
+def find_clusters(index, args):
+    """근사 중복 클러스터 목록 (출현 횟수가 많은 순)"""
+    # 같은 토큰 집합은 하나로: 집합 -> [첫 토큰 순서, 태그 Counter, [(경로, 줄)]]
+    groups = {}
+    for path, line, tag, tokens in index.elements(tags=args.tag, path=args.path):
+        key = frozenset(tokens)
+        if len(key) < args.min_tokens:
+            continue
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = [tokens, Counter(), []]
+        group[1][tag or 'cn()'] += 1
+        group[2].append((path, line))
+
+    sets = list(groups)
+    clusters = []
+    weights = [len(groups[key][2]) for key in sets]
+    for members in cluster_sets(sets, args.threshold, args.num_perm, weights=weights):
+        member_groups = [groups[sets[i]] for i in members]
+        occurrences = sum(len(group[2]) for group in member_groups)
+        if occurrences < args.min_size or len(members) < 2 and not args.include_exact:
+            continue
+        tags = sum((group[1] for group in member_groups), Counter())
+        locations = [location for group in member_groups for location in group[2]]
+        clusters.append({
+            'occurrences': occurrences,
+            'variants': len(members),
+            'files': len({path for path, _ in locations}),
+            'tags': dict(tags.most_common()),
+            'consensus': ' '.join(consensus([(group[0], len(group[2])) for group in member_groups])),
+            'members': sorted(
+                ({'classes': ' '.join(group[0]), 'count': len(group[2]),
+                  'locations': [f'{path}:{line}' for path, line in group[2]]}
+                 for group in member_groups),
+                key=lambda member: -member['count']),
+        })
+    clusters.sort(key=lambda cluster: (-cluster['occurrences'], cluster['consensus']))
+    return clusters, len(groups)
+
+
+def print_clusters(clusters, distinct, args, elapsed):
+    if args.json:
+        for cluster in clusters[:args.top]:
+            print(json.dumps(cluster, ensure_ascii=False))
+        return
+
+    for rank, cluster in enumerate(clusters[:args.top], 1):
+        tags = ', '.join(f'<{tag}> {count}' for tag, count in cluster['tags'].items())
+        print(f"\n#{rank} {cluster['occurrences']}회 사용, {cluster['variants']}가지 변형, "
+              f"{cluster['files']}개 파일 ({tags})")
+        print(f"  공통 클래스: {cluster['consensus']}")
+        for member in cluster['members'][:args.members]:
+            where = ', '.join(member['locations'][:2])
+            more = f" 외 {len(member['locations']) - 2}곳" if len(member['locations']) > 2 else ''
+            print(f"  - {member['count']}회  {member['classes']}")
+            print(f"      {where}{more}")
+        if len(cluster['members']) > args.members:
+            print(f"  ... 외 {len(cluster['members']) - args.members}가지 변형")
+
+    print(f"\n🧩 {distinct}개 고유 className 목록에서 {len(clusters)}개 클러스터 "
+          f"(유사도 ≥ {args.threshold}, {elapsed * 1000:.0f}ms)", file=sys.stderr)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='className 사용처 인덱스')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    update = sub.add_parser('update', help='바뀐 파일만 다시 색인')
+    add_jobs_argument(update)
+    add_stats_arguments(update)
+
+    query = sub.add_parser('query', help='요소 단위 질의')
+    add_jobs_argument(query)
+    add_stats_arguments(query)
+    query.add_argument('--tag', action='append', default=[], help='요소 태그 (여러 번 지정하면 하나라도 일치)')
+    query.add_argument('--has', action='append', default=[], metavar='CLASS',
+                       help='요소가 가진 클래스 (변형 없이 쓰면 모든 변형과 일치, 여러 번 지정하면 모두)')
+    query.add_argument('--lacks', action='append', default=[], metavar='CLASS',
+                       help='요소에 없어야 하는 클래스')
+    query.add_argument('--missing-variant', metavar='VARIANT',
+                       help='이 변형이 붙은 클래스가 하나도 없는 요소 (예: dark:)')
+    query.add_argument('--kind', choices=('literal', 'template', 'expr', 'call'), help='className 종류')
+    query.add_argument('--path', metavar='GLOB', help='상대 경로 glob (예: "src/components/admin/*")')
+    query.add_argument('--sql', help='인덱스에 직접 SQL 실행 (테이블: files, spans, tokens)')
+    query.add_argument('--limit', type=int, help='최대 결과 수')
+    query.add_argument('--count', action='store_true', help='결과 수만 출력')
+    query.add_argument('--json', action='store_true', help='결과를 한 줄에 하나씩 JSON으로 출력')
+    query.add_argument('--no-update', action='store_true', help='질의 전에 인덱스를 갱신하지 않음')
+
+    clusters = sub.add_parser('clusters', help='근사 중복 className 목록 클러스터링 (컴포넌트 추출 후보)')
+    add_jobs_argument(clusters)
+    add_stats_arguments(clusters)
+    clusters.add_argument('--tag', action='append', default=[], help='요소 태그 (여러 번 지정 가능)')
+    clusters.add_argument('--path', metavar='GLOB', help='상대 경로 glob')
+    clusters.add_argument('--threshold', type=float, default=0.7, help='Jaccard 유사도 임계값 (기본: 0.7)')
+    clusters.add_argument('--num-perm', type=int, default=DEFAULT_NUM_PERM, help='MinHash 해시 함수 수')
+    clusters.add_argument('--min-tokens', type=int, default=3, help='이보다 클래스가 적은 목록은 제외 (기본: 3)')
+    clusters.add_argument('--min-size', type=int, default=5, help='이보다 적게 쓰인 클러스터는 제외 (기본: 5)')
+    clusters.add_argument('--include-exact', action='store_true',
+                          help='변형 없이 똑같은 목록만 반복되는 클러스터도 보고')
+    clusters.add_argument('--top', type=int, default=20, help='출력할 클러스터 수 (기본: 20)')
+    clusters.add_argument('--members', type=int, default=5, help='클러스터별로 보여줄 변형 수 (기본: 5)')
+    clusters.add_argument('--json', action='store_true', help='클러스터를 한 줄에 하나씩 JSON으로 출력')
+    clusters.add_argument('--no-update', action='store_true', help='분석 전에 인덱스를 갱신하지 않음')
+    args = parser.parse_args()
+
+    project_root = find_project_root()
+    run_stats = open_stats(args, project_root, 'class-index')
+    index = ClassIndex(project_root)
+    try:
+        if args.command == 'update':
+            print("🗂️  className 인덱스 갱신...")
+            indexed, removed, elapsed = update_index(index, args, run_stats)
+            files, spans = index.conn.execute(
+                'SELECT (SELECT COUNT(*) FROM files), (SELECT COUNT(*) FROM spans)').fetchone()
+            print(f"✨ 완료: {indexed}개 파일 색인, {removed}개 삭제 ({elapsed:.2f}초)")
+            print(f"📊 {files}개 파일, {spans}개 className")
+            result = 0
+        elif args.command == 'clusters':
+            if not args.no_update:
+                update_index(index, args, run_stats)
+            started = time.perf_counter()
+            found, distinct = find_clusters(index, args)
+            print_clusters(found, distinct, args, time.perf_counter() - started)
+            result = 0
+        else:
+            if not args.no_update:
+                update_index(index, args, run_stats)
+            result = 0 if run_query(index, args) is not None else 1
+    finally:
+        index.close()
+
+    run_stats.finish()
+    return result
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,33 @@
+"""
+scripts/*.py 코드모드 공용 모듈 (python3 -m codemods: 통합 CLI)
+- scanner: JSX 여는 태그와 속성 범위를 선형 시간에 찾습니다
+- lexer: TSX/JSX 파일을 한 번만 스캔해 className 스팬 목록을 만듭니다
+- edits: 스팬 단위 편집을 한 번에 적용합니다
+- darkmode: darkmode.json 팔레트 정책을 토큰 조회 테이블로 컴파일한 다크모드 치환 엔진
+- discover: os.scandir 한 번으로 .gitignore와 node_modules를 건너뛰며 파일을 찾습니다
+- watch: inotify(없으면 폴링)로 저장된 파일 묶음을 내보냅니다 (--watch)
+- cli: audit / fix buttons|cards|all / dark-mode 하위 명령과 --root를 가진 통합 진입점 (엔진은 필요할 때 import)
+- tasks: 통합 CLI의 파일별 작업 (워커에서만 엔진 모듈을 읽음)
+- runner: 파일별 함수를 프로세스 풀로 병렬 실행하고 결과를 입력 순서대로 바로 스트리밍합니다
+- cache: 내용 해시 manifest로 바뀌지 않은 파일을 건너뛰고, 컴파일된 규칙을 pickle로 재사용합니다
+- gitfiles: git 저장소 루트와 변경된 파일 목록 (pre-commit 용)
+- rules: rules.json의 선언적 규칙을 하나의 조회 테이블로 컴파일합니다
+- selectors: 'section button', 'Card > div[role]' 같은 요소 선택자와 파일 glob을 파일당 한 번 만든 JSX 요소 트리로 판정합니다
+- normalize: 바뀐 className의 충돌/중복 클래스를 tailwind-merge 방식으로 정리합니다 (LRU 캐시)
+- converge: 변환을 바뀌지 않을 때까지 반복하고 진동/미수렴 파일을 오류로 보고합니다
+- fileio: 소스 파일 읽기/쓰기 (통계 기록 지점)
+- journal: 쓰기를 스테이징했다가 한꺼번에 반영하고, 저널로 마지막 실행을 되돌립니다 (--undo)
+- patch: 기록된 편집으로 unified patch나 JSON 편집 목록을 만듭니다 (--dry-run / --diff)
+- tokenindex: 클래스/태그 -> 파일 id 역색인(array posting list)으로 규칙이 걸릴 수 있는 파일만 고릅니다 (--no-index)
+- classindex: className 사용처를 SQLite에 색인해 디자인 시스템 질의에 바로 답합니다 (class-index.py)
+- minhash: MinHash/LSH로 거의 같은 className 목록을 묶습니다 (class-index.py clusters)
+- lsp: 규칙 위반을 편집기 진단과 code action으로 제공하는 stdio LSP 서버 (style-lsp.py)
+- report: 감사 결과를 파일마다 바로 NDJSON/SARIF로 씁니다 (--format)
+- stats: 단계별/파일별/규칙별 실행 통계와 cProfile (--stats / --profile)
+- guard: 규칙 블록마다 시간 예산을 걸어 백트래킹 폭주 파일만 오류로 보고하고, 위험한 정규식을 경고합니다 (--rule-budget)
+- bench: 합성 TSX 코퍼스로 코드모드 처리량을 측정합니다 (python3 -m codemods.bench)
+- lspcheck: LSP 서버를 stdio로 띄워 진단/증분 편집/fixAll을 점검합니다 (python3 -m codemods.lspcheck)
+- normcheck: className 정규화가 충돌만 지우고 함께 쓸 수 있는 클래스는 남기는지 점검합니다 (python3 -m codemods.normcheck)
+- patchcheck: --diff 패치가 U+2028 같은 줄 구분 문자가 든 파일에도 git apply로 적용되는지 점검합니다 (python3 -m codemods.patchcheck)
+- reportcheck: SARIF artifactLocation.uri가 [id] 같은 라우트 경로도 퍼센트 인코딩한 상대 URI인지 점검합니다 (python3 -m codemods.reportcheck)
+"""
@@ -0,0 +1,7 @@
+"""python3 -m codemods - 통합 코드모드 CLI (codemods.cli)"""
+
+import sys
+
+from codemods.cli import main
+
+sys.exit(main())
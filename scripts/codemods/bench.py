@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+코드모드 벤치마크
+합성 TSX 컴포넌트 트리를 만들어 각 코드모드 함수의 처리량(files/s, MB/s)을 측정하고,
+저장된 기준치보다 느려지면 실패합니다. scripts/ 최적화의 기준으로 사용합니다.
+
+    cd scripts
+    python3 -m codemods.bench --files 1000                  # 측정
+    python3 -m codemods.bench --files 1000 --save-baseline  # 기준치 저장
+    python3 -m codemods.bench --files 100000 --classnames 120 --multiline 0.5
+
+bench_baseline.json은 저장소에 포함된 기준치로, 기본 코퍼스(--files 1000, 나머지 기본값)를
+개발 머신에서 측정한 값입니다. 처리량은 머신마다 다르고 같은 머신에서도 실행마다 10~20% 흔들리므로,
+다른 머신에서의 비교는 참고용입니다. 회귀 판정에 쓰려면 그 머신에서 먼저 --save-baseline으로
+기준치를 다시 저장(또는 --baseline으로 로컬 파일 지정)하고 같은 머신에서 비교하세요.
+기준치에 없는 코퍼스 조건은 비교하지 않고 통과합니다.
+"""
+
+import argparse
+import importlib.util
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from codemods.bench_scanner import CASES as PATHOLOGICAL_CASES
+from codemods.lexer import lex
+from codemods.rules import load_ruleset
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_BASELINE = Path(__file__).with_name('bench_baseline.json')
+
+TAGS = ('div', 'div', 'div', 'span', 'button', 'section', 'article', 'p', 'h3')
+
+CLASSES = (
+    'flex', 'items-center', 'justify-between', 'gap-2', 'gap-4', 'p-4', 'p-6', 'px-4', 'py-2', 'mb-4',
+    'text-sm', 'font-medium', 'font-bold', 'transition-colors', 'shadow-sm', 'border', 'w-full',
+    'bg-white', 'bg-gray-50', 'bg-gray-100', 'text-gray-500', 'text-gray-600', 'text-gray-700',
+    'text-gray-900', 'border-gray-200', 'border-gray-300', 'rounded', 'rounded-md', 'rounded-lg',
+    'rounded-xl', 'rounded-2xl', 'rounded-full', 'hover:bg-gray-50', 'dark:bg-gray-800',
+    'dark:text-gray-100', 'md:flex-row', 'bg-blue-600', 'text-white', 'hover:bg-blue-700',
+)
+
+
+def load_script(filename):
+    """하이픈이 들어간 scripts/*.py를 모듈로 불러오기"""
+    name = filename[:-3].replace('-', '_')
+    spec = importlib.util.spec_from_file_location(name, SCRIPTS_DIR / filename)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _class_list(rng, count=None):
+    return ' '.join(rng.sample(CLASSES, count or rng.randint(3, 9)))
+
+
+def _element(rng, args):
+    """합성 JSX 요소 하나"""
+    tag = rng.choice(TAGS)
+    roll = rng.random()
+    if roll < args.templates:
+        cls = (f'className={{`{_class_list(rng)} ${{active ? \'{_class_list(rng, 2)}\' '
+               f': \'{_class_list(rng, 2)}\'}}`}}')
+    elif roll < args.templates + 0.03:
+        cls = f"className={{cn('{_class_list(rng)}', active && '{_class_list(rng, 2)}')}}"
+    else:
+        cls = f'className="{_class_list(rng)}"'
+
+    if rng.random() < args.multiline:
+        attrs = f'\n      onClick={{() => setOpen(count > 1)}}\n      {cls}\n    '
+    else:
+        attrs = f' {cls}'
+    return f'    <{tag}{attrs}>\n      {{label}}\n    </{tag}>\n'
+
+
+def generate_file(rng, index, args):
+    """합성 컴포넌트 파일 하나의 내용"""
+    if rng.random() < args.pathological:
+        make = rng.choice(list(PATHOLOGICAL_CASES.values()))
+        return make(max(1, args.classnames // 4))
+
+    body = ''.join(_element(rng, args) for _ in range(args.classnames))
+    return (
+        "import React, { useState } from 'react';\n"
+        "import { cn } from '@/lib/utils';\n\n"
+        f"export default function Component{index}({{ label }}: {{ label: string }}) {{\n"
+        "  const [open, setOpen] = useState<boolean>(false);\n"
+        "  const active = open;\n"
+        "  const count = 2;\n"
+        "  return (\n"
+        "    <>\n"
+        f"{body}"
+        "    </>\n"
+        "  );\n"
+        "}\n"
+    )
+
+
+def generate_corpus(root, args):
+    """root 아래에 합성 컴포넌트 트리 생성 (디렉토리당 100개 파일)"""
+    rng = random.Random(args.seed)
+    files = []
+    for index in range(args.files):
+        directory = Path(root) / 'src' / 'components' / f'feature{index // 100:04d}'
+        if index % 100 == 0:
+            directory.mkdir(parents=True, exist_ok=True)
+        path = directory / f'Component{index}.tsx'
+        path.write_text(generate_file(rng, index, args), encoding='utf-8')
+        files.append(path)
+    return files
+
+
+def _apply_rules(ruleset, content, filepath):
+    return ruleset.apply(content, lex(content), filepath)
+
+
+def build_benchmarks():
+    """(이름, 파일 경로를 받는 함수) 목록"""
+    fix_all_buttons_final = load_script('fix-all-buttons-final.py')
+    fix_card_rounding = load_script('fix-card-rounding.py')
+    add_dark_mode = load_script('add_dark_mode.py')
+    final_button_audit = load_script('final-button-audit.py')
+    ruleset = load_ruleset()
+
+    def read(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    return [
+        ('lex', lambda path: lex(read(path))),
+        ('audit_button_styles', final_button_audit.audit_button_styles),
+        ('fix_button_styles', lambda path: fix_all_buttons_final.fix_button_styles(read(path), str(path))),
+        ('fix_card_rounding', lambda path: fix_card_rounding.fix_card_rounding(read(path))),
+        ('style_rules (fused)', lambda path: _apply_rules(ruleset, read(path), str(path))),
+        # 파일을 실제로 수정 (반복 사이에 run_benchmark가 복원)
+        ('add_dark_mode_to_file', add_dark_mode.add_dark_mode_to_file),
+    ]
+
+
+def run_benchmark(func, files, originals, repeat):
+    """repeat번 실행한 최소 시간 (실행 사이에 코퍼스를 원래 내용으로 되돌림)"""
+    best = float('inf')
+    for _ in range(repeat):
+        for path, content in zip(files, originals):
+            path.write_text(content, encoding='utf-8')
+        start = time.perf_counter()
+        for path in files:
+            func(path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def corpus_key(args):
+    """기준치를 비교할 수 있는 코퍼스 조건"""
+    return (f"files={args.files},classnames={args.classnames},multiline={args.multiline},"
+            f"templates={args.templates},pathological={args.pathological},seed={args.seed}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='코드모드 벤치마크')
+    parser.add_argument('--files', type=int, default=1000, help='합성 파일 수 (1k ~ 100k)')
+    parser.add_argument('--classnames', type=int, default=60, help='파일당 className 수')
+    parser.add_argument('--multiline', type=float, default=0.3, help='여러 줄 태그 비율')
+    parser.add_argument('--templates', type=float, default=0.05, help='템플릿 리터럴 className 비율')
+    parser.add_argument('--pathological', type=float, default=0.01, help='병적 입력 파일 비율')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3, help='벤치마크당 반복 횟수 (최소 시간 사용)')
+    parser.add_argument('--corpus', type=Path, help='코퍼스 디렉토리 (기본: 임시 디렉토리, 실행 후 삭제)')
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help='기준치 파일 (기본: 저장소에 포함된 개발 머신 기준치 - 다른 머신에서는 참고용)')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준치로 저장')
+    parser.add_argument('--tolerance', type=float, default=0.2, help='허용하는 처리량 감소 비율')
+    args = parser.parse_args()
+
+    corpus = args.corpus or Path(tempfile.mkdtemp(prefix='codemod-bench-'))
+
+    print("⏱️  코드모드 벤치마크")
+    print("=" * 80)
+
+    try:
+        start = time.perf_counter()
+        files = generate_corpus(corpus, args)
+        originals = [path.read_text(encoding='utf-8') for path in files]
+        total_bytes = sum(path.stat().st_size for path in files)
+        megabytes = total_bytes / (1024 * 1024)
+        print(f"📁 코퍼스: {len(files):,}개 파일, {megabytes:.1f} MB "
+              f"({time.perf_counter() - start:.1f}s 생성) - {corpus}")
+        print()
+
+        results = {}
+        print(f"{'benchmark':<24} {'seconds':>9} {'files/s':>11} {'MB/s':>8}  baseline")
+        print("-" * 80)
+
+        baselines = {}
+        if args.baseline.exists():
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baselines = json.load(f).get(corpus_key(args), {})
+
+        failures = []
+        for name, func in build_benchmarks():
+            elapsed = run_benchmark(func, files, originals, args.repeat)
+            files_per_sec = len(files) / elapsed
+            results[name] = {'files_per_sec': files_per_sec, 'mb_per_sec': megabytes / elapsed}
+
+            note = '-'
+            baseline = baselines.get(name)
+            if baseline:
+                ratio = files_per_sec / baseline['files_per_sec']
+                note = f"{(ratio - 1) * 100:+.0f}%"
+                if ratio < 1 - args.tolerance:
+                    note += ' ❌'
+                    failures.append(f"{name}: {baseline['files_per_sec']:.0f} -> {files_per_sec:.0f} files/s")
+
+            print(f"{name:<24} {elapsed:>9.2f} {files_per_sec:>11,.0f} {megabytes / elapsed:>8.2f}  {note}")
+    finally:
+        if args.corpus is None:
+            shutil.rmtree(corpus, ignore_errors=True)
+
+    print("=" * 80)
+
+    if args.save_baseline:
+        stored = {}
+        if args.baseline.exists():
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+        stored[corpus_key(args)] = results
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(stored, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"💾 기준치 저장: {args.baseline}")
+        return 0
+
+    if failures:
+        print(f"❌ 처리량 감소 ({args.tolerance:.0%} 초과):")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    if not baselines:
+        print("ℹ️  비교할 기준치가 없습니다 (--save-baseline으로 저장)")
+    else:
+        print("✅ 기준치 대비 회귀 없음")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
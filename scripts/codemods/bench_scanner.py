@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+요소 스캐너 회귀 벤치마크 (병적 입력)
+입력 크기를 두 배씩 늘려 scan_elements/lex 시간이 선형으로 증가하는지 확인합니다.
+이전 정규식(<button[^>]*>.*?</button>, 카드 패턴)의 시간도 참고용으로 함께 출력합니다.
+
+    cd scripts && python3 -m codemods.bench_scanner
+"""
+
+import argparse
+import re
+import sys
+import time
+
+from codemods.lexer import lex
+from codemods.scanner import scan_elements
+
+# 예전 fix-admin-buttons-final.py / fix-card-rounding.py의 패턴
+LEGACY_PATTERNS = {
+    'button DOTALL': (re.compile(r'<button[^>]*>.*?</button>', re.DOTALL), 'x'),
+    'card rounded-2xl': (re.compile(r'(<div[^>]*className="[^"]*)\brounded-2xl\b([^"]*"[^>]*>)'), r'\1rounded-lg\2'),
+}
+
+# 크기를 두 배로 늘렸을 때 허용하는 최대 시간 배율 (선형이면 약 2)
+MAX_GROWTH = 3.0
+
+
+def unterminated_buttons(n):
+    """닫히지 않은 <button 태그 반복 (DOTALL 정규식이 매 위치마다 끝까지 스캔)"""
+    return '<button className="px-4 rounded-lg" onClick={() => go()}\n' * n
+
+
+def arrow_functions(n):
+    """속성 안의 '>' (onClick={() => a > b})"""
+    return ''.join(
+        f'<button onClick={{() => count > {i} && setOpen(a => !a)}} className="px-4 rounded-lg">go</button>\n'
+        for i in range(n)
+    )
+
+
+def unclosed_class(n):
+    """따옴표가 닫히지 않은 긴 className (카드 패턴의 [^"]* 백트래킹)"""
+    return '<div className="' + 'rounded-2xl p-4 ' * n + '\n'
+
+
+def nested_icons(n):
+    """속성 표현식 안의 JSX 중첩"""
+    return ''.join(
+        f'<Section title="t{i}" icon={{<Icon className="h-5 w-5" label={{<span>{i}</span>}} />}}>\n'
+        f'  <div className="rounded-2xl p-4">x</div>\n</Section>\n'
+        for i in range(n)
+    )
+
+
+def template_heavy(n):
+    """템플릿 리터럴과 삼항 연산자가 많은 className"""
+    return ''.join(
+        f'<button className={{`px-4 rounded-md ${{a > {i} ? \'bg-white\' : `text-gray-{i % 9 + 1}00`}}`}}>b</button>\n'
+        for i in range(n)
+    )
+
+
+CASES = {
+    'unterminated <button': unterminated_buttons,
+    'arrow functions': arrow_functions,
+    'unclosed className': unclosed_class,
+    'nested JSX in attributes': nested_icons,
+    'template literals': template_heavy,
+}
+
+
+def best_time(func, arg, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def scan_and_lex(content):
+    scan_elements(content)
+    lex(content)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='요소 스캐너 회귀 벤치마크')
+    parser.add_argument('--size', type=int, default=2000, help='가장 작은 입력의 반복 수')
+    parser.add_argument('--steps', type=int, default=4, help='두 배로 늘리는 단계 수')
+    parser.add_argument('--legacy', action='store_true', help='예전 정규식 시간도 측정 (느림)')
+    args = parser.parse_args()
+
+    print("⏱️  요소 스캐너 회귀 벤치마크")
+    print("=" * 80)
+
+    failures = []
+
+    for name, make in CASES.items():
+        print(f"\n📄 {name}")
+        sizes = [args.size * 2 ** step for step in range(args.steps)]
+        times = []
+        for size in sizes:
+            content = make(size)
+            elapsed = best_time(scan_and_lex, content)
+            times.append(elapsed)
+            line = f"  {len(content):>10,} bytes  scanner {elapsed * 1000:8.2f} ms"
+
+            if args.legacy and size <= args.size * 2:
+                for legacy_name, (pattern, repl) in LEGACY_PATTERNS.items():
+                    legacy = best_time(lambda text: pattern.sub(repl, text), content, repeat=1)
+                    line += f"  | {legacy_name} {legacy * 1000:9.2f} ms"
+            print(line)
+
+        for (small, t_small), (large, t_large) in zip(zip(sizes, times), zip(sizes[1:], times[1:])):
+            growth = t_large / max(t_small, 1e-6)
+            if growth > MAX_GROWTH:
+                failures.append(f"{name}: {small} -> {large} 에서 {growth:.1f}배 증가")
+
+    print("\n" + "=" * 80)
+    if failures:
+        print("❌ 선형 시간 위반:")
+        for failure in failures:
+            print(f"  - {failure}")
+        return 1
+
+    print("✅ 모든 입력에서 선형 시간")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
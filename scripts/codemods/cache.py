@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+증분 캐시 (content-hash manifest)
+도구와 규칙 세트별로 파일의 (size, mtime, sha256)과 결과를 기록해
+다시 실행할 때 바뀌지 않은 파일은 열지 않고 건너뜁니다.
+
+- 감사: 파일별 감사 결과를 기록
+- 수정: 변경이 없었던 파일(이미 고정점)만 기록
+- 규칙 정의(다크모드 정책, rounded 패턴 등)나 엔진 코드가 바뀌면
+  fingerprint가 달라져 새 manifest를 사용합니다
+- 컴파일된 규칙(RuleSet, 다크모드 테이블)도 같은 fingerprint로 pickle해 워커마다 재사용합니다
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+CACHE_DIR_NAME = '.codemod-cache'
+
+# 결과에 영향을 주는 공용 엔진 모듈
+_ENGINE_MODULES = ('scanner.py', 'lexer.py', 'edits.py', 'normalize.py', 'converge.py', 'darkmode.py', 'rules.py',
+                   'selectors.py', 'tasks.py')
+
+# 프로세스 안에서 읽은 컴파일 결과 (pickle 경로 -> 객체)
+_artifacts = {}
+
+
+def add_cache_argument(parser):
+    """--no-cache 옵션 추가"""
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='증분 캐시를 사용하지 않고 모든 파일을 다시 검사',
+    )
+
+
+def content_digest(data):
+    """파일 내용(bytes)의 해시"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def rules_fingerprint(script, *rules):
+    """규칙 정의, 스크립트 소스, 엔진 소스로 만든 fingerprint"""
+    h = hashlib.sha256()
+    h.update(json.dumps(rules, sort_keys=True, default=sorted, ensure_ascii=False).encode('utf-8'))
+    h.update(Path(script).read_bytes())
+    engine_dir = Path(__file__).parent
+    for name in _ENGINE_MODULES:
+        h.update((engine_dir / name).read_bytes())
+    return h.hexdigest()[:16]
+
+
+def open_manifest(args, root, tool, script, *rules):
+    """--no-cache가 아니면 도구/규칙 세트용 Manifest 반환"""
+    if getattr(args, 'no_cache', False):
+        return None
+    return Manifest(root, tool, rules_fingerprint(script, *rules))
+
+
+class Manifest:
+    """도구 하나, 규칙 세트 하나에 대한 on-disk manifest"""
+
+    def __init__(self, root, tool, fingerprint):
+        self.dir = Path(root) / CACHE_DIR_NAME
+        self.tool = tool
+        self.path = self.dir / f'{tool}-{fingerprint}.json'
+        self.entries = {}
+        self.dirty = False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    @staticmethod
+    def key(path):
+        return os.path.abspath(path)
+
+    def lookup(self, path):
+        """stat만으로 확인: (hit 여부, 캐시된 결과 또는 캐시된 해시)
+
+        size와 mtime이 같으면 (True, result), 다르면 (False, 이전 해시)
+        """
+        entry = self.entries.get(self.key(path))
+        if entry is None:
+            return False, None
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False, None
+        if st.st_size == entry['size'] and st.st_mtime_ns == entry['mtime_ns']:
+            return True, entry['result']
+        return False, entry['sha256']
+
+    def digest(self, path):
+        entry = self.entries.get(self.key(path))
+        return entry['sha256'] if entry else None
+
+    def cached_result(self, path):
+        entry = self.entries.get(self.key(path))
+        return entry['result'] if entry else None
+
+    def record(self, path, stamp, result):
+        """stamp: (size, mtime_ns, sha256)"""
+        size, mtime_ns, digest = stamp
+        self.entries[self.key(path)] = {
+            'size': size,
+            'mtime_ns': mtime_ns,
+            'sha256': digest,
+            'result': result,
+        }
+        self.dirty = True
+
+    def forget(self, path):
+        if self.entries.pop(self.key(path), None) is not None:
+            self.dirty = True
+
+    def save(self):
+        """manifest 저장 (같은 도구의 이전 규칙 세트 manifest는 삭제)"""
+        if not self.dirty:
+            return
+        self.dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        for old in self.dir.glob(f'{self.tool}-' + '?' * 16 + '.json'):
+            if old != self.path:
+                old.unlink()
+        self.dirty = False
+
+
+def artifact_path(root, name, source, *options):
+    """규칙 파일(source)과 엔진 소스로 fingerprint한 컴파일 결과 pickle 경로"""
+    return Path(root) / CACHE_DIR_NAME / f'compiled-{name}-{rules_fingerprint(source, *options)}.pickle'
+
+
+def load_artifact(path, build):
+    """path의 pickle을 읽고, 없거나 깨졌으면 build() 결과를 저장 (프로세스당 한 번)"""
+    path = Path(path)
+    artifact = _artifacts.get(path)
+    if artifact is not None:
+        return artifact
+    import pickle
+    try:
+        with open(path, 'rb') as f:
+            artifact = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        artifact = build()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # 워커 여러 개가 동시에 만들 수 있으므로 프로세스별 임시 파일에 쓰고 교체
+            tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(artifact, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+            for old in path.parent.glob(path.name[:-len('0123456789abcdef.pickle')] + '?' * 16 + '.pickle'):
+                if old != path:
+                    old.unlink(missing_ok=True)
+        except OSError:
+            pass
+    _artifacts[path] = artifact
+    return artifact
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+className 사용처 인덱스 (SQLite)
+lexer가 찾은 className 스팬과 클래스 토큰을 파일/줄/요소 태그/종류와 함께 저장해
+디자인 시스템 질의("rounded-2xl을 쓰는 div", "dark: 변형이 없는 button")를
+전체 스캔 없이 인덱스 조회로 답합니다.
+
+- 갱신은 증분: (size, mtime)이 바뀐 파일만 다시 lex (워커 풀), 사라진 파일은 삭제
+- lexer/scanner 코드나 스키마가 바뀌면 인덱스를 처음부터 다시 만듦
+- 요소 단위 질의: 같은 여는 태그의 스팬(className 문자열 조각)을 하나로 묶어 판정
+
+위치: <root>/.codemod-cache/class-index.sqlite3
+"""
+
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+
+from codemods.cache import CACHE_DIR_NAME, content_digest
+from codemods.edits import split_variant
+from codemods.fileio import read_source
+from codemods.lexer import lex
+from codemods.patch import LineIndex
+from codemods.runner import run_files
+
+INDEX_FILE_NAME = 'class-index.sqlite3'
+
+SCHEMA_VERSION = 1
+
+_SCHEMA = '''
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,      -- 프로젝트 루트 기준 상대 경로
+    size INTEGER,
+    mtime_ns INTEGER,
+    sha256 TEXT
+);
+CREATE TABLE spans (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL,
+    element INTEGER NOT NULL,       -- 여는 태그 '<' 위치 (태그가 없으면 cn() 호출 위치)
+    line INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    tag TEXT,                       -- cn() 단독 호출이면 NULL
+    kind TEXT NOT NULL,             -- literal / template / expr / call
+    text TEXT NOT NULL
+);
+CREATE TABLE tokens (
+    span_id INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    token TEXT NOT NULL,            -- md:hover:rounded-lg
+    variant TEXT NOT NULL,          -- md:hover:
+    utility TEXT NOT NULL           -- rounded-lg
+);
+CREATE INDEX spans_element ON spans (file_id, element);
+CREATE INDEX spans_tag ON spans (tag);
+CREATE INDEX tokens_span ON tokens (span_id);
+CREATE INDEX tokens_utility ON tokens (utility);
+CREATE INDEX tokens_token ON tokens (token);
+CREATE INDEX tokens_variant ON tokens (variant);
+CREATE INDEX tokens_file ON tokens (file_id);
+'''
+
+
+def index_path(root):
+    return Path(root) / CACHE_DIR_NAME / INDEX_FILE_NAME
+
+
+def _fingerprint():
+    """스키마 버전과 lexer 엔진 소스의 해시 (바뀌면 재색인)"""
+    h = hashlib.sha256(str(SCHEMA_VERSION).encode())
+    engine_dir = Path(__file__).parent
+    for name in ('scanner.py', 'lexer.py', 'edits.py', 'classindex.py'):
+        h.update((engine_dir / name).read_bytes())
+    return h.hexdigest()[:16]
+
+
+def connect(root):
+    """인덱스 DB 열기 (없거나 엔진이 바뀌었으면 새로 만듦)"""
+    path = index_path(root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    fingerprint = _fingerprint()
+    try:
+        row = conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+    except sqlite3.DatabaseError:
+        row = None
+    if row is None or row[0] != fingerprint:
+        conn.close()
+        path.unlink(missing_ok=True)
+        conn = sqlite3.connect(path)
+        conn.executescript(_SCHEMA)
+        conn.execute("INSERT INTO meta VALUES ('fingerprint', ?)", (fingerprint,))
+        conn.commit()
+    return conn
+
+
+def index_file(filepath):
+    """파일 하나의 (stamp, 스팬 행 목록) - 워커에서 실행
+
+    스팬 행: (element, line, col, tag, kind, text, [(token, variant, utility)])
+    """
+    st = os.stat(filepath)
+    content = read_source(filepath)
+    stamp = (st.st_size, st.st_mtime_ns, content_digest(content.encode('utf-8')))
+
+    lines = LineIndex(content)
+    rows = []
+    for span in lex(content):
+        line = lines.line_of(span.start)
+        tokens = []
+        for token in span.text.split():
+            variant, utility = split_variant(token)
+            tokens.append((token, variant, utility))
+        element = span.tag_start if span.tag_start >= 0 else span.attr_start
+        rows.append((element, line + 1, span.start - lines.start(line) + 1,
+                     span.tag, span.kind, span.text, tokens))
+    return stamp, rows
+
+
+class ClassIndex:
+    """프로젝트 하나의 className 인덱스"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.conn = connect(root)
+
+    def close(self):
+        self.conn.close()
+
+    def _rel(self, path):
+        return Path(path).resolve().relative_to(self.root.resolve()).as_posix()
+
+    def stale_files(self, files):
+        """files 중 다시 색인할 파일 (stat이 다르거나 새 파일)과 사라진 파일의 id 목록"""
+        known = {path: (file_id, size, mtime_ns)
+                 for file_id, path, size, mtime_ns in self.conn.execute(
+                     'SELECT id, path, size, mtime_ns FROM files')}
+        stale = []
+        for path in files:
+            rel = self._rel(path)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue        # 탐색 후 사라진 파일은 아래에서 삭제
+            entry = known.pop(rel, None)
+            if entry is None or (st.st_size, st.st_mtime_ns) != entry[1:]:
+                stale.append(str(path))
+        removed = [file_id for file_id, _, _ in known.values()]
+        return stale, removed
+
+    def remove(self, file_ids):
+        self.conn.executemany('DELETE FROM tokens WHERE file_id = ?', ((i,) for i in file_ids))
+        self.conn.executemany('DELETE FROM spans WHERE file_id = ?', ((i,) for i in file_ids))
+        self.conn.executemany('DELETE FROM files WHERE id = ?', ((i,) for i in file_ids))
+
+    def store(self, path, stamp, rows):
+        """파일 하나의 색인 결과를 교체"""
+        rel = self._rel(path)
+        size, mtime_ns, digest = stamp
+        row = self.conn.execute('SELECT id, sha256 FROM files WHERE path = ?', (rel,)).fetchone()
+        if row is not None:
+            file_id, old_digest = row
+            self.conn.execute('UPDATE files SET size = ?, mtime_ns = ?, sha256 = ? WHERE id = ?',
+                              (size, mtime_ns, digest, file_id))
+            if old_digest == digest:
+                return      # 내용은 같고 mtime만 바뀜
+            self.conn.execute('DELETE FROM tokens WHERE file_id = ?', (file_id,))
+            self.conn.execute('DELETE FROM spans WHERE file_id = ?', (file_id,))
+        else:
+            file_id = self.conn.execute(
+                'INSERT INTO files (path, size, mtime_ns, sha256) VALUES (?, ?, ?, ?)',
+                (rel, size, mtime_ns, digest)).lastrowid
+
+        for element, line, col, tag, kind, text, tokens in rows:
+            span_id = self.conn.execute(
+                'INSERT INTO spans (file_id, element, line, col, tag, kind, text) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (file_id, element, line, col, tag, kind, text)).lastrowid
+            self.conn.executemany(
+                'INSERT INTO tokens (span_id, file_id, token, variant, utility) VALUES (?, ?, ?, ?, ?)',
+                ((span_id, file_id, token, variant, utility) for token, variant, utility in tokens))
+
+    def update(self, files, jobs=None, stats=None):
+        """files(전체 목록)로 인덱스를 맞춤: (다시 색인한 파일 수, 삭제한 파일 수, 오류 목록)"""
+        stale, removed = self.stale_files(files)
+        errors = []
+        indexed = 0
+        for result in run_files(index_file, stale, jobs=jobs, stats=stats):
+            if result.error:
+                errors.append((result.path, result.error))
+                continue
+            self.store(result.path, *result.value)
+            indexed += 1
+        self.remove(removed)
+        self.conn.commit()
+        return indexed, len(removed), errors
+
+    def elements(self, tags=(), path=None):
+        """요소별 (경로, 줄, 태그, 토큰 목록)을 파일/위치 순으로 yield"""
+        where = []
+        params = []
+        if tags:
+            where.append('s.tag IN ({})'.format(', '.join('?' * len(tags))))
+            params.extend(tags)
+        if path:
+            where.append('f.path GLOB ?')
+            params.append(path)
+        rows = self.conn.execute('''
+            SELECT s.file_id, s.element, f.path, s.line, s.tag, s.text
+            FROM spans s JOIN files f ON f.id = s.file_id
+            {}
+            ORDER BY s.file_id, s.element, s.id
+        '''.format('WHERE ' + ' AND '.join(where) if where else ''), params)
+
+        key = None
+        for file_id, element, rel, line, tag, text in rows:
+            if (file_id, element) != key:
+                if key is not None:
+                    yield current
+                key = (file_id, element)
+                current = (rel, line, tag, [])
+            current[3].extend(text.split())
+        if key is not None:
+            yield current
+
+
+def _token_condition(cls):
+    """'rounded-lg'는 변형과 관계없이 utility로, 'md:rounded-lg'처럼 변형을 주면 토큰 그대로 비교"""
+    return ('t.token = ?' if ':' in split_variant(cls)[0] else 't.utility = ?'), cls
+
+
+# 조건을 만족하는 토큰을 가진 요소 (토큰 인덱스에서 시작해 질의당 한 번만 계산됨)
+_ELEMENTS_WITH = '''
+    SELECT s2.file_id, s2.element FROM tokens t JOIN spans s2 ON s2.id = t.span_id WHERE {}
+'''
+
+# 후보 요소 하나의 토큰 중 조건을 만족하는 것이 있는지 (부정 조건용: 후보가 이미 걸러진 뒤라 저렴)
+# 조건 앞의 '+'는 토큰 인덱스 대신 요소 인덱스(spans_element)로 찾도록 플래너에 지시
+_ELEMENT_HAS = '''
+    SELECT 1 FROM spans s2 JOIN tokens t ON t.span_id = s2.id
+    WHERE s2.file_id = s.file_id AND s2.element = s.element AND +{}
+'''
+
+# 서로 다른 변형은 수십 개뿐이므로 변형 인덱스에서 일치하는 것을 먼저 고름
+_VARIANT_CONDITION = 't.variant IN (SELECT DISTINCT variant FROM tokens WHERE instr(variant, ?) > 0)'
+
+
+def build_query(tags=(), has=(), lacks=(), missing_variant=None, kind=None, path=None):
+    """요소 단위 질의 SQL과 파라미터
+
+    tags: 요소 태그 (하나라도 일치)
+    has / lacks: 모두 가져야 하는 / 하나도 없어야 하는 클래스
+    missing_variant: 이 변형(예: 'dark:')이 붙은 토큰이 하나도 없는 요소
+    kind: 스팬 종류 (literal / template / expr / call)
+    path: 상대 경로 glob (예: 'src/components/admin/*')
+    """
+    where = []
+    params = []
+    if tags:
+        where.append('s.tag IN ({})'.format(', '.join('?' * len(tags))))
+        params.extend(tags)
+    if kind:
+        where.append('s.kind = ?')
+        params.append(kind)
+    if path:
+        where.append('f.path GLOB ?')
+        params.append(path)
+    for cls in has:
+        condition, value = _token_condition(cls)
+        where.append('(s.file_id, s.element) IN (' + _ELEMENTS_WITH.format(condition) + ')')
+        params.append(value)
+    for cls in lacks:
+        condition, value = _token_condition(cls)
+        where.append('NOT EXISTS (' + _ELEMENT_HAS.format(condition) + ')')
+        params.append(value)
+    if missing_variant:
+        where.append('NOT EXISTS (' + _ELEMENT_HAS.format(_VARIANT_CONDITION) + ')')
+        params.append(missing_variant)
+
+    sql = '''
+        SELECT f.path, MIN(s.line), s.tag, group_concat(s.text, ' | ')
+        FROM spans s JOIN files f ON f.id = s.file_id
+        {}
+        GROUP BY s.file_id, s.element
+        ORDER BY f.path, MIN(s.line)
+    '''.format('WHERE ' + ' AND '.join(where) if where else '')
+    return sql, params
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+통합 코드모드 CLI (python3 -m codemods)
+스크립트마다 따로 있던 탐색/병렬 실행/캐시/쓰기 반영을 하나의 실행기로 묶은 진입점입니다.
+
+    cd scripts
+    python3 -m codemods audit [buttons|cards|all]     # 규칙 위반 보고 (수정하지 않음)
+    python3 -m codemods audit --format sarif          # CI/코드 스캐닝용 (ndjson도 가능)
+    python3 -m codemods fix buttons                   # rules.json의 button-* 규칙 적용
+    python3 -m codemods fix cards                     # card-* 규칙 적용
+    python3 -m codemods fix all                       # 활성 규칙 전체 적용
+    python3 -m codemods dark-mode                     # darkmode.json 정책 적용
+    python3 -m codemods --root ../other-app fix all   # 다른 프로젝트 (기본: 현재 git 저장소)
+
+빠른 시작:
+- 이 모듈은 argparse와 옵션 정의만 import합니다. 엔진(lexer, rules, darkmode)은 codemods.tasks에
+  있고, 처리할 파일(캐시 miss)이 생겼을 때 처음 import됩니다
+- 규칙 컴파일 결과는 .codemod-cache/compiled-*.pickle로 재사용합니다
+- 규칙이 걸릴 수 있는 파일만 .codemod-cache/token-index.pickle(클래스/태그 역색인)로 골라 엽니다
+- 규칙 하나가 파일 하나에서 --rule-budget(기본 5초)을 넘기면 그 파일만 오류로 보고하고 계속합니다
+- 바뀐 파일이 없는 --changed 실행이나 전부 캐시 hit인 실행은 엔진을 읽지 않고 끝납니다
+  (dark-mode는 색인 조건을 만들려고 정책 컴파일러 codemods.darkmode만 읽습니다)
+"""
+
+import argparse
+import json
+import sys
+from contextlib import nullcontext, redirect_stdout
+from functools import partial
+from pathlib import Path
+
+from codemods.cache import add_cache_argument
+from codemods.gitfiles import add_git_arguments
+from codemods.guard import add_budget_argument
+from codemods.journal import add_undo_argument
+from codemods.patch import add_dry_run_arguments
+from codemods.report import add_format_arguments, open_report
+from codemods.runner import add_jobs_argument
+from codemods.stats import add_stats_arguments
+from codemods.tokenindex import add_index_argument
+
+_CODEMODS_DIR = Path(__file__).resolve().parent
+
+DEFAULT_RULES_PATH = _CODEMODS_DIR / 'rules.json'
+DEFAULT_POLICY_PATH = _CODEMODS_DIR / 'darkmode.json'
+
+# fix/audit 대상 -> rules.json 규칙 id 접두사
+RULE_TARGETS = {'buttons': 'button-', 'cards': 'card-', 'all': ''}
+
+RULE_SUFFIXES = {'.tsx', '.jsx', '.ts', '.js'}
+DARK_MODE_SUFFIXES = {'.tsx'}
+
+# 감사 결과를 파일당 몇 개까지 보여줄지
+AUDIT_SHOW = 5
+
+
+def run_task(name, filepath, **kwargs):
+    """codemods.tasks의 파일별 작업 실행 (엔진 모듈은 여기서 처음 import)"""
+    from codemods import tasks
+    return getattr(tasks, name)(filepath, **kwargs)
+
+
+class Session:
+    """하위 명령 하나의 공용 실행 환경 (캐시, 통계, 트랜잭션, dry-run)"""
+
+    def __init__(self, args, root, tool, *rules, writes=True):
+        from codemods.cache import open_manifest
+        from codemods.gitfiles import reads_staged
+        from codemods.journal import Transaction
+        from codemods.patch import open_preview
+        from codemods.stats import open_stats
+
+        self.args = args
+        self.root = root
+        self.tool = tool
+        self.writes = writes
+        # --staged 감사: 작업 트리가 아닌 인덱스의 내용을 보므로 stat 기반 캐시와 색인은 쓰지 않음
+        self.staged = reads_staged(args, writes)
+        # manifest는 같은 이름의 옛 스크립트(add_dark_mode.py 등)와 fingerprint가 달라 서로 지우므로
+        # 이름을 따로 씀 (되돌리기 저널은 같은 tool 이름을 공유)
+        self.manifest = open_manifest(args, root, f'cli-{tool}', __file__, *rules) if not self.staged else None
+        self.stats = open_stats(args, root, tool)
+        self.transaction = Transaction(root, tool) if writes else None
+        self.preview = open_preview(args, root) if writes else None
+
+    def run(self, task, target, suffixes, patterns, log=print):
+        """target 아래 파일 중 토큰 색인의 후보(patterns)에 task를 적용한 FileResult를 순서대로 yield"""
+        from codemods.discover import walk_files
+        from codemods.gitfiles import select_files
+        from codemods.runner import run_files
+        from codemods.tokenindex import open_index
+
+        with self.stats.phase('discover'):
+            files = select_files(self.args, self.root, target, suffixes,
+                                 lambda: walk_files(target, suffixes, self.root), writes=self.writes)
+            index = open_index(self.args, self.root, patterns, log=log) if not self.staged else None
+        # 수정 도구는 변경이 없었던 파일(이미 고정점)만 캐시
+        cacheable = (lambda value: not value) if self.writes else None
+        return run_files(task, files, jobs=self.args.jobs, manifest=self.manifest, cacheable=cacheable,
+                         stats=self.stats, transaction=self.transaction, preview=self.preview, index=index,
+                         budget=self.args.rule_budget)
+
+    def relative(self, path):
+        return Path(path).relative_to(self.root)
+
+    def finish(self, command):
+        if self.preview is not None:
+            self.preview.finish()
+        if self.transaction is not None:
+            self.transaction.report(command)
+        self.stats.finish()
+
+
+def _project_root(args):
+    if args.root is not None:
+        return args.root.resolve()
+    from codemods.gitfiles import find_project_root
+    return find_project_root()
+
+
+def _command(args, *words):
+    """되돌리기 안내에 쓸 명령 ('-m codemods --root X fix buttons')"""
+    root = f' --root {args.root}' if args.root is not None else ''
+    return f"-m codemods{root} {' '.join(words)}"
+
+
+def _undo(root, tool):
+    from codemods.journal import undo_last_run
+    return undo_last_run(root, tool)
+
+
+def _select_rules(args, root, tool):
+    """(규칙 데이터, 대상에 해당하는 활성 규칙 id 튜플, 컴파일 결과 pickle 경로)
+
+    같은 규칙 파일의 컴파일 결과가 이미 있으면 검증을 통과한 규칙이므로
+    codemods.rules(엔진)를 import하지 않고 JSON만 읽습니다 (add_policy만 정책 표로 펼침).
+    """
+    from codemods.cache import artifact_path
+    with open(args.rules, 'r', encoding='utf-8') as f:
+        rules = json.load(f)
+    if any('add_policy' in rule for rule in rules['rules']):
+        from codemods.darkmode import resolve_add_policies
+        resolve_add_policies(rules, args.rules)
+    # 정책 파일이 바뀌어도 컴파일 결과가 바뀌므로 펼친 규칙으로 fingerprint
+    artifact = artifact_path(root, tool, args.rules, rules)
+    if not artifact.exists():
+        from codemods.rules import load_rules
+        rules = load_rules(args.rules)
+    prefix = RULE_TARGETS[args.target]
+    only = tuple(rule['id'] for rule in rules['rules']
+                 if rule.get('enabled', True) and rule['id'].startswith(prefix))
+    from codemods.guard import lint_rules
+    for rule_id, pattern, message in lint_rules(rules):
+        if rule_id in only:
+            print(f"⚠️  규칙 {rule_id}: {pattern!r} {message}", file=sys.stderr)
+    return rules, only, artifact
+
+
+def _rule_task(name, args, root, only, artifact, **options):
+    return partial(run_task, name, rules_path=args.rules, only=only, artifact=artifact, root=root, **options)
+
+
+def _rule_patterns(rules, only):
+    """대상 규칙이 걸릴 수 있는 파일의 토큰 색인 조건"""
+    from codemods.tokenindex import rule_patterns
+    return rule_patterns(rule for rule in rules['rules'] if rule['id'] in only)
+
+
+def cmd_audit(args):
+    """규칙 위반 보고 - 위반이나 오류가 있으면 1 (pre-commit 용)
+
+    파일마다 검사가 끝나는 즉시 출력하고 버리므로 메모리는 트리 크기와 무관합니다.
+    """
+    root = _project_root(args)
+    args.rules = args.rules.resolve()
+    tool = f'audit-{args.target}'
+    rules, only, artifact = _select_rules(args, root, tool)
+    session = Session(args, root, tool, rules, only, writes=False)
+    descriptions = {rule['id']: rule.get('description', '') for rule in rules['rules']}
+    report = open_report(args, root, tool, {rule_id: descriptions[rule_id] for rule_id in only})
+    # 결과를 stdout에 쓰면 진행 메시지와 통계 요약은 stderr
+    to_stderr = report is not None and args.output is None
+    log = partial(print, file=sys.stderr) if to_stderr else print
+
+    log(f"🔍 스타일 규칙 감사 ({args.target}): {', '.join(only) or '없음'}")
+    log("=" * 80)
+
+    issue_files = 0
+    issue_count = 0
+    errors = []
+    task = _rule_task('audit_file', args, root, only, artifact, staged=session.staged)
+    for result in session.run(task, root / 'src', RULE_SUFFIXES, _rule_patterns(rules, only), log=log):
+        rel_path = session.relative(result.path)
+        if result.error:
+            errors.append((rel_path, result.error))
+            if report is not None:
+                report.error(rel_path, result.error)
+        elif result.value:
+            issue_files += 1
+            issue_count += len(result.value)
+            if report is not None:
+                report.add(rel_path, result.value)
+                continue
+            log(f"\n📄 {rel_path}")
+            for rule_id, line, column, message in result.value[:AUDIT_SHOW]:
+                log(f"  Line {line}:{column} [{rule_id}] {message}")
+            if len(result.value) > AUDIT_SHOW:
+                log(f"  ... 외 {len(result.value) - AUDIT_SHOW}개 더")
+
+    if report is not None:
+        report.close()
+
+    if issue_files:
+        log(f"\n⚠️  {issue_files}개 파일에서 {issue_count}개 위반 발견")
+    else:
+        log("\n✅ 위반 없음")
+
+    if errors:
+        log(f"\n❌ {len(errors)}개 파일 검사 실패:")
+        for rel_path, error in errors:
+            log(f"  {rel_path}: {error}")
+
+    log("\n" + "=" * 80)
+    with redirect_stdout(sys.stderr) if to_stderr else nullcontext():
+        session.finish(_command(args, 'audit', args.target))
+    return 1 if issue_files or errors else 0
+
+
+def cmd_fix(args):
+    """rules.json 규칙 적용"""
+    root = _project_root(args)
+    tool = f'fix-{args.target}'
+    if args.undo:
+        return _undo(root, tool)
+    args.rules = args.rules.resolve()
+    rules, only, artifact = _select_rules(args, root, tool)
+    if not only:
+        print(f"⚠️  '{args.target}'에 해당하는 활성 규칙이 없습니다")
+        return 0
+    session = Session(args, root, tool, rules, only)
+
+    print(f"🔧 스타일 규칙 적용 ({args.target}): {', '.join(only)}")
+    print("=" * 80)
+
+    checked = 0
+    modified = 0
+    totals = {}
+    task = _rule_task('fix_file', args, root, only, artifact)
+    for result in session.run(task, root / 'src', RULE_SUFFIXES, _rule_patterns(rules, only)):
+        checked += 1
+        if result.error:
+            print(f"❌ 오류 ({result.path}): {result.error}")
+        elif result.value:
+            modified += 1
+            print(f"✅ {session.relative(result.path)}")
+            for rule_id, count in result.value.items():
+                totals[rule_id] = totals.get(rule_id, 0) + count
+                print(f"  - {rule_id}: {count}개 변경")
+
+    print("\n" + "=" * 80)
+    print(f"✨ 완료: {checked}개 파일 중 {modified}개 파일 수정됨")
+    if totals:
+        print("\n규칙별 변경:")
+        for rule_id in only:
+            if totals.get(rule_id):
+                print(f"  - {rule_id}: {totals[rule_id]}개")
+
+    session.finish(_command(args, 'fix', args.target))
+    return 0
+
+
+def _dark_mode_patterns(args, policy_bytes):
+    """정책의 토큰이 하나라도 있는 파일 (--no-index면 정책을 컴파일하지 않음)"""
+    if args.no_index:
+        return None
+    from codemods.darkmode import compile_policy
+    from codemods.tokenindex import token_patterns
+    return token_patterns(compile_policy(json.loads(policy_bytes)))
+
+
+def cmd_dark_mode(args):
+    """darkmode.json 정책으로 다크모드 클래스 추가"""
+    from codemods.cache import artifact_path
+
+    root = _project_root(args)
+    if args.undo:
+        return _undo(root, 'dark-mode')
+    policy_path = args.policy.resolve()
+    with open(policy_path, 'rb') as f:
+        policy_bytes = f.read()
+    session = Session(args, root, 'dark-mode', policy_bytes.decode('utf-8'))
+    components_dir = root / 'src' / 'components'
+
+    print("🌙 다크모드 클래스 추가...")
+    print(f"📁 디렉토리: {components_dir}")
+    print(f"🎨 정책: {policy_path.name}")
+
+    total = 0
+    modified = 0
+    task = partial(run_task, 'dark_mode_file', policy_path=policy_path,
+                   artifact=artifact_path(root, 'dark-mode', policy_path))
+    for result in session.run(task, components_dir, DARK_MODE_SUFFIXES, _dark_mode_patterns(args, policy_bytes)):
+        total += 1
+        if result.error:
+            print(f"❌ 오류 ({result.path}): {result.error}")
+        elif result.value:
+            modified += 1
+            print(f"✅ {session.relative(result.path)} ({result.value}개 추가)")
+
+    print(f"\n📊 완료: {total}개 파일 중 {modified}개 파일 수정됨")
+    session.finish(_command(args, 'dark-mode'))
+    return 0
+
+
+def _add_run_arguments(parser, writes=True):
+    add_jobs_argument(parser)
+    add_budget_argument(parser)
+    add_cache_argument(parser)
+    add_index_argument(parser)
+    add_git_arguments(parser)
+    add_stats_arguments(parser)
+    if writes:
+        add_undo_argument(parser)
+        add_dry_run_arguments(parser)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python3 -m codemods', description='스타일 코드모드 통합 CLI')
+    parser.add_argument('--root', type=Path, help='프로젝트 루트 (기본: 현재 디렉토리의 git 저장소)')
+    commands = parser.add_subparsers(dest='command', metavar='COMMAND', required=True)
+
+    audit = commands.add_parser('audit', help='규칙 위반 보고 (수정하지 않음)')
+    audit.add_argument('target', nargs='?', choices=tuple(RULE_TARGETS), default='all',
+                       help='감사할 규칙 묶음 (기본: all)')
+    audit.add_argument('--rules', type=Path, default=DEFAULT_RULES_PATH, help='규칙 파일 (JSON)')
+    _add_run_arguments(audit, writes=False)
+    add_format_arguments(audit)
+    audit.set_defaults(handler=cmd_audit)
+
+    fix = commands.add_parser('fix', help='규칙 적용')
+    fix.add_argument('target', choices=tuple(RULE_TARGETS), help='적용할 규칙 묶음')
+    fix.add_argument('--rules', type=Path, default=DEFAULT_RULES_PATH, help='규칙 파일 (JSON)')
+    _add_run_arguments(fix)
+    fix.set_defaults(handler=cmd_fix)
+
+    dark_mode = commands.add_parser('dark-mode', help='다크모드 클래스 추가')
+    dark_mode.add_argument('--policy', type=Path, default=DEFAULT_POLICY_PATH,
+                           help=f'다크모드 정책 파일 (기본: codemods/{DEFAULT_POLICY_PATH.name})')
+    _add_run_arguments(dark_mode)
+    dark_mode.set_defaults(handler=cmd_dark_mode)
+
+    return parser
+
+
+def main(argv=None):
+    """메인 함수"""
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
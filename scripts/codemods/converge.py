@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+고정점 반복 (한 번 실행으로 최종 상태까지)
+변환을 파일 내용에 메모리 안에서 바뀌지 않을 때까지 반복 적용합니다.
+마지막 패스는 바뀐 것이 없어야 하므로, 결과를 쓴 뒤 다시 실행해도 바이트 단위로 아무것도 바뀌지 않습니다
+(read_source/write_source는 UTF-8 그대로 왕복).
+
+- MAX_PASSES 안에 멈추지 않거나 이전 내용으로 되돌아가면 (진동) ConvergenceError
+  runner가 파일별 오류로 기록하므로 그 파일은 쓰지 않고 보고만 됨
+"""
+
+from functools import reduce
+from operator import add
+from typing import Any, NamedTuple
+
+from codemods import stats
+
+# 파일당 최대 패스 수 (바뀌지 않음을 확인하는 마지막 패스 포함)
+MAX_PASSES = 8
+
+
+class ConvergenceError(Exception):
+    """변환이 고정점에 도달하지 않음"""
+
+
+class Convergence(NamedTuple):
+    """고정점 반복 결과"""
+    content: str
+    value: Any          # 패스별 두 번째 반환값을 +로 합친 값 (바뀐 패스가 없으면 첫 패스의 값)
+    passes: int         # 내용을 바꾼 패스 수
+
+
+def converge(transform, content, max_passes=MAX_PASSES):
+    """transform(content) -> (new_content, value)를 내용이 바뀌지 않을 때까지 반복"""
+    seen = {content: 0}
+    values = []
+    for n in range(1, max_passes + 1):
+        new_content, value = transform(content)
+        if new_content == content:
+            changed = len(values)
+            stats.count('converge: extra passes', max(0, changed - 1))
+            return Convergence(content, reduce(add, values) if values else value, changed)
+        if new_content in seen:
+            raise ConvergenceError(f"{seen[new_content]}번째 패스 결과로 되돌아감 ({n - seen[new_content]}패스 주기로 진동)")
+        seen[new_content] = n
+        values.append(value)
+        content = new_content
+    raise ConvergenceError(f"{max_passes}패스 후에도 계속 바뀜")
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+다크모드 치환 엔진
+darkmode.json의 팔레트 정책(색 x 명도 x 속성 x 상태 변형)을 토큰 -> dark: 클래스
+해시 테이블로 컴파일해, className 스팬마다 토큰을 한 번씩만 조회합니다.
+매핑이 수천 개여도 토큰당 비용은 dict 조회 한 번이고, 결과는 한 번의 join으로 만듭니다.
+
+정책 형식:
+    {
+      "colors": ["gray", "blue", ...],
+      "variants": ["", "hover:", "focus:"],           # 토큰과 dark: 클래스에 같이 붙는 변형
+      "properties": {"bg": {"50": "900", ...}, ...},  # 속성별 명도 -> 다크모드 명도
+      "tokens": {"bg-white": "dark:bg-gray-800"}      # 팔레트 밖 개별 매핑 (우선)
+    }
+"""
+
+import json
+import re
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+from codemods import stats
+from codemods.edits import apply_edits, split_variant
+from codemods.normalize import normalize_classes
+
+DEFAULT_POLICY_PATH = Path(__file__).with_name('darkmode.json')
+
+PROPERTIES = ('bg', 'text', 'border', 'ring', 'divide', 'placeholder')
+
+SHADES = ('50', '100', '200', '300', '400', '500', '600', '700', '800', '900', '950')
+
+_TOKEN_RE = re.compile(r'\S+')
+
+
+def _dark_prefix(dark_class):
+    """'dark:bg-gray-800' -> 'dark:bg-' (같은 속성의 dark: 형제 판별용)"""
+    variant, utility = split_variant(dark_class)
+    return variant + utility.split('-', 1)[0] + '-'
+
+
+def load_policy(path=DEFAULT_POLICY_PATH):
+    """다크모드 정책 파일(JSON) 읽기"""
+    with open(path, 'r', encoding='utf-8') as f:
+        policy = json.load(f)
+
+    unknown = set(policy.get('properties', {})) - set(PROPERTIES)
+    if unknown:
+        raise ValueError(f"알 수 없는 속성 {sorted(unknown)} (가능: {', '.join(PROPERTIES)})")
+    for prop, shades in policy.get('properties', {}).items():
+        bad = {shade for pair in shades.items() for shade in pair} - set(SHADES)
+        if bad:
+            raise ValueError(f"속성 {prop}: 알 수 없는 명도 {sorted(bad)}")
+    for variant in policy.get('variants', ['']):
+        if variant and not variant.endswith(':'):
+            raise ValueError(f"변형은 ':'로 끝나야 합니다: {variant!r}")
+    for token, dark_class in policy.get('tokens', {}).items():
+        if not dark_class.startswith('dark:'):
+            raise ValueError(f"토큰 {token}: dark: 클래스가 필요합니다 ({dark_class!r})")
+    return policy
+
+
+def compile_policy(policy):
+    """정책 -> {토큰: dark: 클래스} (개별 tokens가 팔레트 조합보다 우선)"""
+    base = {}
+    for prop, shades in policy.get('properties', {}).items():
+        for color in policy.get('colors', ()):
+            for shade, dark_shade in shades.items():
+                base[f'{prop}-{color}-{shade}'] = f'dark:{prop}-{color}-{dark_shade}'
+    base.update(policy.get('tokens', {}))
+
+    table = {}
+    for variant in policy.get('variants', ['']):
+        for token, dark_class in base.items():
+            # 'dark:bg-gray-800' + 'hover:' -> 'dark:hover:bg-gray-800'
+            table[variant + token] = 'dark:' + variant + dark_class[len('dark:'):]
+    return table
+
+
+class DarkModeEngine:
+    """{토큰: dark: 클래스} 테이블을 쓰는 다크모드 치환기"""
+
+    def __init__(self, policy):
+        # 토큰 -> (추가할 dark: 클래스, dark: 접두사, 통계용 규칙 이름)
+        self.table = {
+            token: (dark_class, _dark_prefix(dark_class), 'dark-mode: ' + token)
+            for token, dark_class in compile_policy(policy).items()
+        }
+
+    def __len__(self):
+        return len(self.table)
+
+    def apply_classes(self, classes, existing_prefixes=frozenset()):
+        """className 문자열 하나를 변환해 (new_classes, 치환 횟수) 반환
+
+        existing_prefixes: 감싸는 className 속성에 이미 있는 dark: 접두사
+        """
+        parts = []
+        last = 0
+        count = 0
+        added = None
+
+        # 토큰 전체가 일치할 때만 (hover:bg-white는 변형 테이블로, bg-gray-50/50 등은 제외)
+        for m in _TOKEN_RE.finditer(classes):
+            entry = self.table.get(m.group())
+            if entry is None:
+                continue
+            dark_class, prefix, label = entry
+            if added is None:
+                added = set(existing_prefixes)
+                added.update(_dark_prefix(token) for token in classes.split() if token.startswith('dark:'))
+            # 같은 속성의 dark: 형제가 이미 있으면 스킵
+            if prefix in added:
+                continue
+            stats.count(label)
+            added.add(prefix)
+            parts.append(classes[last:m.end()])
+            parts.append(' ' + dark_class)
+            last = m.end()
+            count += 1
+
+        if not count:
+            return classes, 0
+        parts.append(classes[last:])
+        return ''.join(parts), count
+
+    def apply(self, content, spans):
+        """파일 내용의 className 스팬 전체를 변환해 (new_content, 치환 횟수) 반환"""
+        with stats.rule('dark-mode'):
+            return self._apply(content, spans)
+
+    def _apply(self, content, spans):
+        # className 속성(또는 cn() 호출) 단위로 기존 dark: 접두사 수집
+        attr_prefixes = defaultdict(set)
+        for span in spans:
+            for token in span.text.split():
+                if token.startswith('dark:'):
+                    attr_prefixes[span.attr_start].add(_dark_prefix(token))
+
+        edits = []
+        total = 0
+        for span in spans:
+            new_text, count = self.apply_classes(span.text, attr_prefixes.get(span.attr_start, frozenset()))
+            if count:
+                edits.append((span.start, span.end, normalize_classes(new_text, span.kind)))
+                total += count
+
+        if not edits:
+            return content, 0
+        return apply_edits(content, edits), total
+
+
+def resolve_add_policies(data, rules_path):
+    """rules.json 데이터에서 add_policy 규칙의 add를 정책의 토큰 표로 채움 (규칙에 직접 쓴 add가 우선)
+
+    정책 경로는 규칙 파일 기준이고, fix all과 dark-mode가 같은 표를 쓰게 됩니다.
+    """
+    for rule in data['rules']:
+        if 'add_policy' in rule:
+            table = compile_policy(load_policy(Path(rules_path).parent / rule['add_policy']))
+            table.update(rule.get('add', {}))
+            rule['add'] = table
+    return data
+
+
+@lru_cache(maxsize=None)
+def load_engine(path=DEFAULT_POLICY_PATH):
+    """정책 파일을 읽어 컴파일 (프로세스당 한 번)"""
+    return DarkModeEngine(load_policy(path))
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+파일 탐색
+os.scandir로 트리를 한 번만 훑으면서 제외할 디렉토리는 내려가기 전에 잘라냅니다.
+- node_modules, .next, .git 등은 항상 제외
+- 루트부터 각 디렉토리의 .gitignore(와 .git/info/exclude)를 컴파일한 매처로 적용
+- 여러 확장자를 한 번의 탐색으로 찾고, 제너레이터로 바로바로 내보냄
+- 디렉토리마다 이름순으로 훑으므로 결과는 sorted(rglob(...))와 같은 순서
+"""
+
+import os
+import re
+from pathlib import Path
+
+# .gitignore와 관계없이 항상 내려가지 않는 디렉토리
+ALWAYS_PRUNED = frozenset({'.git', 'node_modules', '.next', '.codemod-cache', '__pycache__'})
+
+
+def _translate(pattern):
+    """gitignore glob 하나를 정규식 문자열로 변환 (기준 디렉토리에 대한 상대 경로에 매칭)"""
+    anchored = '/' in pattern
+    pattern = pattern.lstrip('/')
+    i, n = 0, len(pattern)
+    out = []
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('/**', i) and i + 3 == n:
+            out.append('/.*')
+            i += 3
+        elif pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+        elif c == '*':
+            out.append('[^/]*')
+            i += 1
+        elif c == '?':
+            out.append('[^/]')
+            i += 1
+        elif c == '[':
+            close = pattern.find(']', i + 2)
+            if close < 0:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1:close]
+                if body[0] == '!':
+                    body = '^' + body[1:]
+                out.append('[' + body.replace('\\', '\\\\') + ']')
+                i = close + 1
+        elif c == '\\' and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    body = ''.join(out)
+    # '/'가 없는 패턴은 어느 깊이의 이름과도 매칭
+    return body if anchored else '(?:.*/)?' + body
+
+
+class IgnoreMatcher:
+    """.gitignore 파일 하나 (패턴은 그 파일이 있는 디렉토리 기준)"""
+
+    def __init__(self, lines):
+        self.rules = []         # (negate, dir_only, regex) - 마지막으로 매칭된 규칙이 이김
+        plain = []
+        for line in lines:
+            line = line.rstrip('\n')
+            if not line.endswith('\\ '):
+                line = line.rstrip()
+            if not line or line.startswith('#'):
+                continue
+            negate = line.startswith('!')
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+            if not line:
+                continue
+            regex = _translate(line)
+            self.rules.append((negate, dir_only, re.compile(regex + r'\Z', re.S)))
+            if not negate:
+                plain.append((dir_only, regex))
+
+        self.has_negation = any(negate for negate, _, _ in self.rules)
+        # 부정 패턴이 없으면 모든 패턴을 하나의 정규식으로 (디렉토리 전용 패턴은 따로)
+        self.any_path = self._combine(regex for dir_only, regex in plain if not dir_only)
+        self.any_dir = self._combine(regex for _, regex in plain)
+
+    @staticmethod
+    def _combine(regexes):
+        regexes = list(regexes)
+        if not regexes:
+            return None
+        return re.compile('(?:' + '|'.join(regexes) + r')\Z', re.S)
+
+    @classmethod
+    def from_file(cls, path):
+        """파일이 없거나 읽을 수 없으면 None"""
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                matcher = cls(f)
+        except OSError:
+            return None
+        return matcher if matcher.rules else None
+
+    def match(self, rel, is_dir):
+        """rel(기준 디렉토리 상대 경로, '/' 구분)의 판정: True 제외, False 포함, None 해당 없음"""
+        if not self.has_negation:
+            regex = self.any_dir if is_dir else self.any_path
+            return True if regex is not None and regex.match(rel) else None
+        for negate, dir_only, regex in reversed(self.rules):
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel):
+                return not negate
+        return None
+
+
+def _is_ignored(matchers, path, is_dir):
+    """안쪽 .gitignore가 바깥 것보다 우선"""
+    for base, matcher in reversed(matchers):
+        verdict = matcher.match(path[len(base):], is_dir)
+        if verdict is not None:
+            return verdict
+    return False
+
+
+def _root_matchers(root, base):
+    """root부터 base까지 (base 제외) 경로상의 .gitignore 매처"""
+    matchers = []
+    exclude = IgnoreMatcher.from_file(os.path.join(root, '.git', 'info', 'exclude'))
+    if exclude is not None:
+        matchers.append(('', exclude))
+
+    rel_parts = Path(base).relative_to(root).parts
+    for depth in range(len(rel_parts)):
+        prefix = '/'.join(rel_parts[:depth])
+        matcher = IgnoreMatcher.from_file(os.path.join(root, prefix, '.gitignore'))
+        if matcher is not None:
+            matchers.append((prefix + '/' if prefix else '', matcher))
+    return matchers
+
+
+def walk_files(base_dir, suffixes, root=None, gitignore=True, dirs=False):
+    """base_dir 아래에서 suffixes 확장자의 파일 Path를 순서대로 yield
+
+    root: .gitignore 기준이 되는 저장소 루트 (기본: base_dir)
+    dirs: True면 내려가는 하위 디렉토리 Path도 yield (파일 감시용)
+    """
+    resolved = Path(base_dir).resolve()
+    root = Path(root).resolve() if root is not None else resolved
+    if root != resolved and root not in resolved.parents:
+        root = resolved
+    suffixes = tuple(suffixes)
+
+    matchers = _root_matchers(root, resolved) if gitignore else []
+    rel = resolved.relative_to(root).as_posix()
+    yield from _walk(str(base_dir), '' if rel == '.' else rel + '/', suffixes, matchers, gitignore, dirs)
+
+
+def _walk(directory, rel_dir, suffixes, matchers, gitignore, dirs):
+    if gitignore:
+        matcher = IgnoreMatcher.from_file(os.path.join(directory, '.gitignore'))
+        if matcher is not None:
+            matchers = matchers + [(rel_dir, matcher)]
+
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    for entry in entries:
+        name = entry.name
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+        except OSError:
+            continue
+        if is_dir:
+            if name in ALWAYS_PRUNED or (matchers and _is_ignored(matchers, rel_dir + name, True)):
+                continue
+            if dirs:
+                yield Path(entry.path)
+            yield from _walk(entry.path, rel_dir + name + '/', suffixes, matchers, gitignore, dirs)
+        elif name.endswith(suffixes):
+            if matchers and _is_ignored(matchers, rel_dir + name, False):
+                continue
+            yield Path(entry.path)
+
+
+class IgnoreCache:
+    """경로 하나씩 제외 여부를 판정 (감시 모드에서 새로 생긴 파일용, 디렉토리별 매처 캐시)"""
+
+    def __init__(self, root):
+        self.root = Path(root).resolve()
+        self._matchers = {}
+
+    def clear(self):
+        """.gitignore가 바뀌면 호출"""
+        self._matchers.clear()
+
+    def _dir_matchers(self, directory):
+        matchers = self._matchers.get(directory)
+        if matchers is None:
+            matchers = _root_matchers(self.root, directory)
+            own = IgnoreMatcher.from_file(directory / '.gitignore')
+            if own is not None:
+                rel = directory.relative_to(self.root).as_posix()
+                matchers.append(('' if rel == '.' else rel + '/', own))
+            self._matchers[directory] = matchers
+        return matchers
+
+    def ignored(self, path, is_dir=False):
+        path = Path(path).resolve()
+        try:
+            rel = path.relative_to(self.root)
+        except ValueError:
+            return True
+        if any(part in ALWAYS_PRUNED for part in rel.parts):
+            return True
+        # 상위 디렉토리가 제외되면 그 아래도 모두 제외
+        for depth in range(1, len(rel.parts)):
+            parent = self.root.joinpath(*rel.parts[:depth - 1]) if depth > 1 else self.root
+            if _is_ignored(self._dir_matchers(parent), '/'.join(rel.parts[:depth]), True):
+                return True
+        return _is_ignored(self._dir_matchers(path.parent), rel.as_posix(), is_dir)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+스팬 단위 편집 도구
+lexer가 만든 className 스팬을 바꾼 뒤 파일 내용을 한 번의 join으로 재조립합니다.
+"""
+
+import re
+
+from codemods import patch
+from codemods.normalize import normalize_classes
+
+_TOKEN_RE = re.compile(r'\S+')
+
+
+def split_variant(token):
+    """'md:hover:rounded-lg' -> ('md:hover:', 'rounded-lg')"""
+    # 임의값 bg-[url(a:b)] 안의 ':'는 변형 구분자가 아님
+    head = token.split('[', 1)[0]
+    idx = head.rfind(':')
+    return token[:idx + 1], token[idx + 1:]
+
+
+def map_tokens(text, fn):
+    """공백은 그대로 두고 클래스 토큰만 fn(token)의 결과로 치환"""
+    return _TOKEN_RE.sub(lambda m: fn(m.group()), text)
+
+
+def apply_edits(content, edits):
+    """(start, end, new_text) 편집 목록을 한 번에 적용 (겹치지 않아야 함)"""
+    edits = sorted(edits)
+    parts = []
+    last = 0
+    for start, end, new_text in edits:
+        parts.append(content[last:start])
+        parts.append(new_text)
+        last = end
+    parts.append(content[last:])
+    new_content = ''.join(parts)
+    # --dry-run/--diff: 원본 좌표의 편집을 그대로 패치로 사용
+    patch.record_edits(content, edits, new_content)
+    return new_content
+
+
+def rewrite_spans(content, spans, fn):
+    """각 스팬에 fn(span)을 적용해 (new_content, 변경된 스팬 수) 반환
+
+    fn이 None 또는 원래 텍스트를 반환하면 그 스팬은 건드리지 않습니다.
+    바뀐 스팬은 normalize_classes로 충돌/중복 클래스를 정리합니다.
+    """
+    edits = []
+    for span in spans:
+        new_text = fn(span)
+        if new_text is not None and new_text != span.text:
+            edits.append((span.start, span.end, normalize_classes(new_text, span.kind)))
+    if not edits:
+        return content, 0
+    return apply_edits(content, edits), len(edits)
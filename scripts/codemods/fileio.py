@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+소스 파일 읽기/쓰기
+모든 코드모드가 이 함수로 파일을 읽고 써서 실행 통계(읽고 쓴 시간과 바이트)가 한 곳에서 기록됩니다.
+
+dry-run 중이면 (codemods.patch) write_source는 아무것도 쓰지 않고 편집을 패치로 기록합니다.
+트랜잭션 실행 중이면 (codemods.journal) write_source는 대상 파일을 건드리지 않고
+실행별 스테이징 디렉토리에 쓰기만 합니다. 반영은 실행이 끝난 뒤 한꺼번에 이루어집니다.
+"""
+
+import os
+import stat
+
+from codemods import patch, stats
+from codemods.cache import content_digest
+
+# 트랜잭션 실행 중인 스테이징 디렉토리와
+# 현재 파일에서 스테이징한 [(대상 경로, 임시 파일, 새 내용 sha256)]
+_stage_dir = None
+_staged = None
+
+
+def begin_staging(stage_dir):
+    """이후의 write_source를 stage_dir 안의 임시 파일 쓰기로 전환"""
+    global _stage_dir, _staged
+    _stage_dir = stage_dir
+    _staged = []
+
+
+def end_staging(discard=False):
+    """스테이징을 끝내고 목록 반환 (discard면 임시 파일을 지우고 빈 목록)"""
+    global _stage_dir, _staged
+    staged, _staged, _stage_dir = _staged or [], None, None
+    if discard:
+        for _, temp, _ in staged:
+            _remove_quietly(temp)
+        return []
+    return staged
+
+
+def _remove_quietly(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _write_temp(filepath, data):
+    """스테이징 디렉토리의 임시 파일에 쓰고 경로 반환"""
+    import tempfile     # 쓰기가 있을 때만 (시작 시간 절약)
+    fd, temp = tempfile.mkstemp(dir=_stage_dir, prefix=os.path.basename(filepath) + '.')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp는 0600으로 만들므로 원본 권한 유지
+        try:
+            os.chmod(temp, stat.S_IMODE(os.stat(filepath).st_mode))
+        except FileNotFoundError:
+            pass
+    except BaseException:
+        _remove_quietly(temp)
+        raise
+    return temp
+
+
+def _read_bytes(filepath, staged):
+    with stats.phase('read'):
+        if staged:
+            import subprocess   # --staged 감사에서만
+            # 작업 트리와 같은 변환(eol, smudge)을 거친 인덱스의 내용
+            directory, name = os.path.split(os.fspath(filepath))
+            data = subprocess.run(
+                ['git', 'cat-file', '--filters', ':./' + name], cwd=directory or '.', check=True,
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            ).stdout
+        else:
+            with open(filepath, 'rb') as f:
+                data = f.read()
+    stats.add_bytes('read', len(data))
+    return data
+
+
+def read_source(filepath, staged=False):
+    """UTF-8 소스 파일 읽기 (staged면 작업 트리 대신 git 인덱스에 스테이징된 내용)"""
+    return _decode(filepath, _read_bytes(filepath, staged))
+
+
+def read_source_if(filepath, needles, staged=False):
+    """바이트열 needles가 모두 들어 있는 파일만 읽기 (하나라도 없으면 디코딩하지 않고 None)"""
+    data = _read_bytes(filepath, staged)
+    if not all(needle in data for needle in needles):
+        return None
+    return _decode(filepath, data)
+
+
+def _decode(filepath, data):
+    content = data.decode('utf-8')
+    patch.remember_source(filepath, content)
+    return content
+
+
+def write_source(filepath, content):
+    """UTF-8 소스 파일 쓰기 (트랜잭션 실행 중이면 스테이징, dry-run 중이면 패치만 기록)"""
+    if patch.capturing():
+        patch.capture_write(filepath, content)
+        return
+    data = content.encode('utf-8')
+    with stats.phase('write'):
+        if _staged is None:
+            with open(filepath, 'wb') as f:
+                f.write(data)
+        else:
+            _staged.append((str(filepath), _write_temp(filepath, data), content_digest(data)))
+    stats.add_bytes('written', len(data))
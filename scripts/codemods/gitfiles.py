@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+git 기반 파일 선택
+- 프로젝트 루트는 실행 중인 git 저장소에서 찾습니다 (하드코딩된 경로 대신)
+- --changed / --staged / --rev 옵션으로 변경된 파일만 감사/수정합니다 (pre-commit 용)
+- --staged 감사는 작업 트리 대신 스테이징된 내용(git 인덱스)을 읽고,
+  --staged 수정은 스테이징되지 않은 변경이 있는 파일을 건드리지 않습니다
+- 경로는 -z(NUL 구분)로 받아 한글 등 ASCII가 아닌 이름도 따옴표 없이 그대로 씁니다
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+# 스크립트 위치 기준 기본 루트 (scripts/의 상위)
+_DEFAULT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def _git(root, *args):
+    """git 명령 실행 후 stdout 줄 목록 반환"""
+    result = subprocess.run(
+        ['git', *args], cwd=root, check=True,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+    )
+    return [line for line in result.stdout.splitlines() if line]
+
+
+def _git_paths(root, *args):
+    """git 명령을 -z로 실행해 경로 목록 반환 (core.quotePath와 무관하게 원래 이름)"""
+    result = subprocess.run(
+        ['git', *args, '-z'], cwd=root, check=True,
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+    )
+    return [os.fsdecode(name) for name in result.stdout.split(b'\0') if name]
+
+
+def find_project_root():
+    """현재 디렉토리의 git 저장소 루트 (git이 없으면 scripts/의 상위 디렉토리)"""
+    try:
+        return Path(_git(Path.cwd(), 'rev-parse', '--show-toplevel')[0])
+    except (OSError, subprocess.CalledProcessError, IndexError):
+        return _DEFAULT_ROOT
+
+
+def add_git_arguments(parser):
+    """--changed / --staged / --rev 옵션 추가 (동시에 하나만)"""
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument(
+        '--changed', action='store_true',
+        help='HEAD 대비 변경된 파일과 추적되지 않은 새 파일만 처리',
+    )
+    group.add_argument(
+        '--staged', action='store_true',
+        help='스테이징된 파일만 처리 (pre-commit hook 용, 감사는 스테이징된 내용을 검사하고 '
+             '수정은 스테이징되지 않은 변경이 있는 파일을 건너뜀)',
+    )
+    group.add_argument(
+        '--rev', metavar='RANGE',
+        help='리비전 범위에서 변경된 파일만 처리 (예: main...HEAD)',
+    )
+
+
+def git_mode(args):
+    """git 기반 선택 모드가 지정되었는지 확인"""
+    return bool(getattr(args, 'changed', False) or getattr(args, 'staged', False) or getattr(args, 'rev', None))
+
+
+def git_changed_files(root, staged=False, rev=None):
+    """변경된 파일의 절대 경로 목록 (삭제된 파일 제외, 정렬됨)"""
+    diff = ['diff', '--name-only', '--diff-filter=ACMR']
+    if staged:
+        names = _git_paths(root, *diff, '--cached')
+    elif rev:
+        names = _git_paths(root, *diff, rev)
+    else:
+        names = _git_paths(root, *diff, 'HEAD')
+        names += _git_paths(root, 'ls-files', '--others', '--exclude-standard')
+
+    files = {Path(root) / name for name in names}
+    return sorted(path for path in files if path.is_file())
+
+
+def reads_staged(args, writes):
+    """감사 도구가 작업 트리 대신 git 인덱스의 내용을 읽어야 하는지 (--staged 감사)
+
+    이때는 stat 기반 캐시와 토큰 색인이 작업 트리 파일을 보므로 쓰지 않습니다.
+    """
+    return bool(getattr(args, 'staged', False)) and not writes
+
+
+def _changed(args, root, writes):
+    """git_changed_files에서 --staged 수정이면 스테이징되지 않은 변경이 있는 파일을 빼고 경고"""
+    changed = git_changed_files(root, staged=args.staged, rev=args.rev)
+    if not (args.staged and writes):
+        return changed
+    unstaged = {Path(root) / name for name in _git_paths(root, 'diff', '--name-only')}
+    skipped = [path for path in changed if path in unstaged]
+    for path in skipped:
+        print(f"⚠️  스테이징되지 않은 변경이 있어 건너뜀 (먼저 git add 또는 git stash -k): "
+              f"{path.relative_to(root)}", file=sys.stderr)
+    return [path for path in changed if path not in unstaged]
+
+
+def select_files(args, root, base_dir, suffixes, walk, writes=True):
+    """처리할 파일 목록
+
+    git 모드면 base_dir 아래의 변경 파일 중 suffixes에 해당하는 것만,
+    아니면 walk()의 결과(전체 트리, codemods.discover.walk_files 제너레이터)를 그대로 반환합니다.
+    writes: 파일을 고치는 도구인지 (--staged면 스테이징되지 않은 변경이 있는 파일은 제외)
+    """
+    if not git_mode(args):
+        return walk()
+
+    base_dir = Path(base_dir).resolve()
+    return [
+        path for path in _changed(args, root, writes)
+        if path.suffix in suffixes and base_dir in path.resolve().parents
+        and 'node_modules' not in path.parts and '.next' not in path.parts
+    ]
+
+
+def filter_changed(args, root, paths, writes=True):
+    """git 모드면 paths 중 변경된 파일만 남김 (고정된 대상 목록용)"""
+    if not git_mode(args):
+        return list(paths)
+    changed = set(_changed(args, root, writes))
+    return [path for path in paths if Path(path) in changed]
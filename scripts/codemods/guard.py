@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+규칙 실행 시간 예산과 정규식 백트래킹 점검
+- 실행기(runner)가 예산을 정하면 규칙 하나가 파일 하나에서 쓴 시간이 그 예산을 넘길 때
+  SIGALRM으로 중단하고 RuleTimeout을 냅니다. 그 파일만 오류(규칙 이름과 걸린 시간)로 보고되고
+  실행은 다음 파일로 계속됩니다. 정규식 엔진도 일정 단계마다 신호를 확인하므로 백트래킹 중에도 멈춥니다.
+- 시간은 규칙(limit 블록 이름)마다 파일 단위로 누적하고, 블록이 중첩되면 가장 안쪽 블록에만 매깁니다
+  (style-rules 블록 안의 patterns 정규식은 그 규칙 id로, 나머지 테이블 조회는 style-rules로)
+- RuleTimeout은 BaseException이라 규칙 코드의 except Exception에 삼켜지지 않습니다
+- setitimer가 없는 플랫폼이나 메인 스레드가 아닌 곳에서는 예산을 적용하지 않습니다
+- lint_pattern: 규칙 정규식에서 무제한 반복 안의 무제한 반복((a+)+, (\\s*x)*)을 불러올 때 경고
+"""
+
+import signal
+import time
+from contextlib import contextmanager
+
+try:
+    from re import _constants as _sre, _parser as _sre_parse
+except ImportError:         # Python 3.10 이하
+    import sre_constants as _sre
+    import sre_parse as _sre_parse
+
+# 규칙 하나가 파일 하나에 쓸 수 있는 기본 시간 (초)
+DEFAULT_RULE_BUDGET = 5.0
+
+# 이 프로세스에서 적용 중인 예산 (None이면 제한 없음 - 실행기 밖의 LSP, 벤치마크 등)
+_budget = None
+
+# 이 파일에서 규칙별로 쓴 시간 (초)
+_spent = {}
+# 실행 중인 규칙 블록 [[이름, 마지막으로 시간을 매긴 시각]] - 시간은 가장 안쪽 블록에 매김
+_stack = []
+# 타이머가 울릴 시각 (꺼져 있으면 None)
+_deadline = None
+_previous_handler = None
+
+_UNBOUNDED = _sre.MAXREPEAT
+_REPEATS = (_sre.MAX_REPEAT, _sre.MIN_REPEAT)
+# 되돌아가지 않는 반복/그룹 (3.11+)
+_POSSESSIVE = getattr(_sre, 'POSSESSIVE_REPEAT', None)
+_ATOMIC = getattr(_sre, 'ATOMIC_GROUP', None)
+
+
+class RuleTimeout(BaseException):
+    """규칙 하나가 파일 하나에서 예산을 넘김"""
+
+    def __init__(self, rule, budget, elapsed):
+        super().__init__(rule, budget, elapsed)
+        self.rule = rule
+        self.budget = budget
+        self.elapsed = elapsed
+
+    def __str__(self):
+        return f"규칙 '{self.rule}'이(가) 예산 {self.budget:g}초를 넘겨 중단됨 ({self.elapsed:.2f}초)"
+
+
+def add_budget_argument(parser):
+    """--rule-budget 옵션 추가"""
+    parser.add_argument(
+        '--rule-budget', type=float, default=DEFAULT_RULE_BUDGET, metavar='SECONDS',
+        help=f'규칙 하나가 파일 하나에 쓸 수 있는 시간, 넘으면 그 파일만 오류로 보고 (기본: {DEFAULT_RULE_BUDGET:g}초, 0이면 제한 없음)',
+    )
+
+
+def set_budget(seconds):
+    """이 프로세스의 규칙 예산 설정 (None이나 0이면 제한 없음) - 실행기가 파일마다 호출, 누적 시간도 비움"""
+    global _budget, _deadline
+    if _stack:
+        # 이전 파일이 블록 정리 도중에 중단됐으면 타이머와 핸들러를 되돌림
+        _stack.clear()
+        _deadline = None
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, _previous_handler)
+    _spent.clear()
+    _budget = seconds if seconds and hasattr(signal, 'setitimer') else None
+
+
+def _charge(now):
+    """가장 안쪽 블록에 지난 시간을 매기고 그 규칙의 누적 시간 반환"""
+    entry = _stack[-1]
+    spent = _spent[entry[0]] = _spent.get(entry[0], 0.0) + now - entry[1]
+    entry[1] = now
+    return spent
+
+
+def _arm(now, force=False):
+    """가장 안쪽 규칙이 예산을 다 쓸 시각에 타이머를 맞춤 (이미 더 이른 시각에 맞춰져 있으면 그대로)"""
+    global _deadline
+    deadline = now + _budget - _spent.get(_stack[-1][0], 0.0)
+    if force or _deadline is None or deadline < _deadline:
+        _deadline = deadline
+        signal.setitimer(signal.ITIMER_REAL, max(deadline - now, 1e-6))
+
+
+def _on_alarm(signum, frame):
+    global _deadline
+    if not _stack:
+        return
+    now = time.monotonic()
+    spent = _charge(now)
+    if spent >= _budget:
+        _deadline = None
+        raise RuleTimeout(_stack[-1][0], _budget, spent)
+    # 타이머를 맞춘 규칙은 예산을 다 쓰기 전에 나왔음 - 지금 실행 중인 규칙에 맞춰 다시 설정
+    _arm(now, force=True)
+
+
+@contextmanager
+def limit(name):
+    """name 규칙 블록에 예산 적용 (예산이 없으면 아무 일도 하지 않음)"""
+    global _previous_handler, _deadline
+    if _budget is None:
+        yield
+        return
+    if not _stack:
+        try:
+            _previous_handler = signal.signal(signal.SIGALRM, _on_alarm)
+        except ValueError:      # 메인 스레드가 아님
+            yield
+            return
+    now = time.monotonic()
+    if _stack:
+        _charge(now)
+    _stack.append([name, now])
+    _arm(now)
+    try:
+        yield
+    finally:
+        now = time.monotonic()
+        _charge(now)
+        _stack.pop()
+        if _stack:
+            _stack[-1][1] = now     # 바깥 블록은 지금부터 다시 셈
+            _arm(now)
+        else:
+            _deadline = None
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, _previous_handler)
+
+
+def _nested_repeats(items, outer, found):
+    """outer(바깥 무제한 반복) 안에서 다시 나오는 무제한 반복을 found에 추가"""
+    for op, av in items:
+        if op in _REPEATS:
+            low, high, sub = av
+            unbounded = high == _UNBOUNDED
+            if unbounded and outer:
+                found.append((low, high))
+            _nested_repeats(sub, outer or unbounded, found)
+        elif op == _POSSESSIVE or op == _ATOMIC:
+            # 되돌아가지 않으므로 안쪽은 새로 시작
+            _nested_repeats(av[2] if op == _POSSESSIVE else av, False, found)
+        elif op == _sre.SUBPATTERN:
+            _nested_repeats(av[-1], outer, found)
+        elif op == _sre.BRANCH:
+            for branch in av[1]:
+                _nested_repeats(branch, outer, found)
+        elif op in (_sre.ASSERT, _sre.ASSERT_NOT):
+            _nested_repeats(av[1], outer, found)
+    return found
+
+
+def lint_pattern(pattern):
+    """정규식 하나의 경고 목록 (중첩된 무제한 반복은 실패하는 입력에서 지수 시간 백트래킹)"""
+    nested = _nested_repeats(_sre_parse.parse(pattern), False, [])
+    if not nested:
+        return []
+    return [f"무제한 반복 안에 무제한 반복이 {len(nested)}개 있습니다 "
+            f"(예: (a+)+, (\\s*x)*) - 맞지 않는 입력에서 백트래킹이 폭발할 수 있습니다"]
+
+
+def lint_rules(rules):
+    """rules.json 규칙의 patterns 정규식 점검 - [(rule id, 패턴, 경고)]"""
+    warnings = []
+    for rule in rules['rules']:
+        for pattern in rule.get('patterns', {}):
+            for message in lint_pattern(pattern):
+                warnings.append((rule['id'], pattern, message))
+    return warnings
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+트랜잭션 쓰기와 되돌리기 저널
+워커는 바뀐 내용을 실행별 스테이징 디렉토리에 쓰기만 하고 (fileio.write_source),
+실행이 끝나면 Transaction.commit()이 원본을 저널에 보관한 뒤 os.replace로 한꺼번에 반영합니다.
+
+- 실행 도중 오류나 Ctrl+C로 중단되면 스테이징 디렉토리만 지우므로 트리는 실행 전 그대로
+- 원본은 하드링크로 보관하므로 (복사 없음) 저널 비용은 바뀐 파일 수에 비례
+- --undo는 마지막 실행에서 바뀐 파일만 되돌림 (backup.js/restore.js 전체 복원 불필요)
+
+저널 위치: <root>/.codemod-cache/journal/<tool>/<실행 시각>/
+스테이징: <root>/.codemod-cache/staging/<tool>-<pid>/ (대상과 같은 파일시스템이라 rename이 원자적)
+"""
+
+import errno
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+from codemods.cache import CACHE_DIR_NAME, content_digest
+JOURNAL_DIR_NAME = 'journal'
+STAGING_DIR_NAME = 'staging'
+
+# 도구별로 보관하는 최근 실행 저널 수
+KEEP_JOURNALS = 5
+
+
+def add_undo_argument(parser):
+    """--undo 옵션 추가"""
+    parser.add_argument(
+        '--undo', action='store_true',
+        help='이 스크립트의 마지막 실행에서 바뀐 파일을 되돌림',
+    )
+
+
+def _journal_root(root, tool):
+    return Path(root) / CACHE_DIR_NAME / JOURNAL_DIR_NAME / tool
+
+
+def _file_digest(path):
+    try:
+        with open(path, 'rb') as f:
+            return content_digest(f.read())
+    except FileNotFoundError:
+        return None
+
+
+def _replace(source, target):
+    """source를 target으로 원자적으로 교체 (다른 파일시스템이면 target 옆에 복사 후 교체)"""
+    try:
+        os.replace(source, target)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        temp = f'{target}.codemod-tmp'
+        shutil.copy2(source, temp)
+        os.replace(temp, target)
+        os.unlink(source)
+
+
+def _write_journal(journal_dir, data):
+    tmp_path = journal_dir / 'journal.json.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1, ensure_ascii=False)
+    os.replace(tmp_path, journal_dir / 'journal.json')
+
+
+class Transaction:
+    """실행 하나의 스테이징된 쓰기 (run_files가 결과마다 add, 끝나면 commit)"""
+
+    def __init__(self, root, tool):
+        self.root = Path(root)
+        self.tool = tool
+        self.staged = {}        # 대상 경로 -> (임시 파일, 새 내용 sha256)
+        self.committed = []     # 반영된 대상 경로
+        self.journal_dir = None
+        self.stage_dir = None
+
+    def begin(self):
+        """스테이징 디렉토리를 만들고 경로 반환 (워커에 전달)"""
+        self.stage_dir = Path(self.root) / CACHE_DIR_NAME / STAGING_DIR_NAME / f'{self.tool}-{os.getpid()}'
+        shutil.rmtree(self.stage_dir, ignore_errors=True)
+        self.stage_dir.mkdir(parents=True)
+        return str(self.stage_dir)
+
+    def add(self, result):
+        """FileResult의 스테이징된 쓰기를 모음 (같은 파일은 마지막 쓰기만 유지)"""
+        for target, temp, digest in result.staged or ():
+            self.staged[target] = (temp, digest)
+
+    def _cleanup(self):
+        if self.stage_dir is not None:
+            shutil.rmtree(self.stage_dir, ignore_errors=True)
+            self.stage_dir = None
+
+    def abort(self):
+        """스테이징된 쓰기를 모두 버림 (대상 파일은 건드리지 않음)"""
+        self.staged.clear()
+        self._cleanup()
+
+    def _rel(self, path):
+        try:
+            return Path(path).resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return str(Path(path).resolve())
+
+    def commit(self):
+        """원본을 저널에 보관하고 스테이징된 파일을 원자적으로 반영"""
+        if not self.staged:
+            self._cleanup()
+            return
+
+        # 같은 초에 여러 번 실행해도 이름순 = 실행 순서
+        now = time.time()
+        name = time.strftime('%Y%m%d-%H%M%S', time.localtime(now)) + f'-{int(now * 1e6) % 1000000:06d}'
+        self.journal_dir = _journal_root(self.root, self.tool) / name
+        self.journal_dir.mkdir(parents=True)
+
+        targets = sorted(self.staged)
+        entries = []
+        for i, target in enumerate(targets):
+            backup = f'{i:05d}'
+            try:
+                # 반영은 os.replace(새 inode)이므로 원본 inode를 하드링크로 붙잡아 두면 충분
+                os.link(target, self.journal_dir / backup)
+            except FileNotFoundError:
+                backup = None       # 새로 만든 파일 (되돌리면 삭제)
+            except OSError:
+                shutil.copy2(target, self.journal_dir / backup)
+            entries.append({'path': self._rel(target), 'backup': backup, 'digest': self.staged[target][1]})
+
+        # 반영 전에 저널을 먼저 기록 (반영 도중 중단돼도 --undo 가능)
+        _write_journal(self.journal_dir, {'tool': self.tool, 'created': name, 'files': entries})
+
+        for target in targets:
+            _replace(self.staged[target][0], target)
+            self.committed.append(target)
+        self.staged.clear()
+        self._cleanup()
+        _prune_journals(self.root, self.tool)
+
+    def report(self, script):
+        """반영 결과와 되돌리는 방법 출력"""
+        if self.committed:
+            print(f"💾 {len(self.committed)}개 파일 반영 (되돌리기: python3 {script} --undo)")
+
+
+def _prune_journals(root, tool):
+    """도구별로 최근 KEEP_JOURNALS개의 저널만 유지"""
+    journals = sorted(path for path in _journal_root(root, tool).iterdir() if path.is_dir())
+    for old in journals[:-KEEP_JOURNALS]:
+        shutil.rmtree(old, ignore_errors=True)
+
+
+def undo_last_run(root, tool):
+    """마지막 실행의 저널로 바뀐 파일을 되돌림 (실행 후 다시 수정된 파일은 건너뜀)
+
+    모두 되돌리면 0, 건너뛴 파일이 있거나 저널이 없으면 1 반환
+    """
+    root = Path(root)
+    journal_root = _journal_root(root, tool)
+    journals = sorted(journal_root.glob('*/journal.json')) if journal_root.exists() else []
+    if not journals:
+        print(f"ℹ️  되돌릴 실행이 없습니다 ({tool})")
+        return 1
+
+    journal_dir = journals[-1].parent
+    with open(journals[-1], 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    print(f"↩️  {data['created']} 실행 되돌리기 ({len(data['files'])}개 파일)")
+
+    restored = 0
+    remaining = []
+    for entry in data['files']:
+        target = root / entry['path']
+        # 실행 후에 다시 바뀐 파일은 덮어쓰지 않음
+        if _file_digest(target) != entry['digest']:
+            print(f"⚠️  실행 후 변경되어 건너뜀: {entry['path']}")
+            remaining.append(entry)
+            continue
+        if entry['backup'] is None:
+            os.remove(target)
+        else:
+            os.replace(journal_dir / entry['backup'], target)
+        restored += 1
+
+    if remaining:
+        # 건너뛴 파일의 원본은 남겨 두어 정리 후 다시 --undo 가능
+        _write_journal(journal_dir, dict(data, files=remaining))
+    else:
+        shutil.rmtree(journal_dir, ignore_errors=True)
+
+    print(f"✅ {restored}개 파일 복원")
+    return 1 if remaining else 0
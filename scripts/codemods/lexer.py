@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+className 토크나이저
+TSX/JSX 파일을 한 번의 선형 스캔으로 className 스팬 목록으로 변환합니다.
+
+다루는 형태:
+- className="..." / className='...'            -> kind='literal'
+- className={`... ${cond ? 'a' : 'b'} ...`}     -> kind='template'
+- className={cond ? 'a' : 'b'}                  -> kind='expr'
+- cn(...) / clsx(...) 인자의 문자열               -> kind='call'
+"""
+
+import re
+from typing import List, NamedTuple, Optional
+
+from codemods import stats
+from codemods.fileio import read_source
+from codemods.scanner import scan_elements
+
+
+class ClassSpan(NamedTuple):
+    """className 문자열 조각 하나 (content[start:end] == text)"""
+    start: int
+    end: int
+    text: str
+    kind: str
+    tag: Optional[str]      # className을 가진 JSX 여는 태그 (cn() 단독 호출이면 None)
+    tag_start: int          # 요소의 '<' 위치 (-1이면 없음)
+    attr_start: int         # className 속성 또는 cn( 호출의 시작 위치
+
+
+# 최상위 토큰: className 속성, cn()/clsx() 호출
+_TOP_RE = re.compile(r"""
+    \bclassName\s*=\s*(?P<open>["'{])
+  | \b(?:cn|clsx)\s*\(
+""", re.X)
+
+# 표현식 내부 토큰: 문자열, 괄호, 주석, 중첩 cn()/clsx()
+_EXPR_RE = re.compile(r"""["'`(){}\[\]]|/[/*]|\b(?:cn|clsx)\s*\(""")
+
+# 템플릿 리터럴 내부 토큰
+_TEMPLATE_RE = re.compile(r"""\\.|`|\$\{""", re.S)
+
+# 따옴표별 문자열 본문 (이스케이프 포함, 줄바꿈에서 중단)
+_STRING_BODY = {
+    '"': re.compile(r'(?:[^"\\\n]|\\.)*'),
+    "'": re.compile(r"(?:[^'\\\n]|\\.)*"),
+}
+
+# 토큰 색인 기록 중이면 [이 파일에서 처음 lex한 스팬 목록] (codemods.tokenindex, 워커에서 파일마다)
+_recorded = None
+
+_OPENERS = frozenset('([{')
+_CLOSERS = frozenset(')]}')
+
+
+def _is_comparison_operand(content, start, end):
+    """'primary' === variant 처럼 비교 연산의 피연산자인 문자열인지 확인"""
+    before = content[max(0, start - 6):start - 1].rstrip()
+    after = content[end + 1:end + 7].lstrip()
+    return before.endswith(('==', '!=')) or after.startswith(('==', '!='))
+
+
+def _scan_string(content, pos, quote, kind, ctx, out):
+    """따옴표 문자열을 스팬으로 기록하고 닫는 따옴표 다음 위치 반환"""
+    end = _STRING_BODY[quote].match(content, pos).end()
+    if end > pos and not _is_comparison_operand(content, pos, end):
+        out.append(ClassSpan(pos, end, content[pos:end], kind, *ctx))
+    return end + 1
+
+
+def _scan_template(content, pos, ctx, out):
+    """템플릿 리터럴의 정적 조각과 ${} 안의 문자열을 기록하고 닫는 ` 다음 위치 반환"""
+    seg_start = pos
+    n = len(content)
+    while True:
+        m = _TEMPLATE_RE.search(content, pos)
+        if m is None:
+            return n
+        tok = m.group()
+        if tok[0] == '\\':
+            pos = m.end()
+            continue
+        if content[seg_start:m.start()].strip():
+            out.append(ClassSpan(seg_start, m.start(), content[seg_start:m.start()], 'template', *ctx))
+        if tok == '`':
+            return m.end()
+        pos = _scan_expr(content, m.end(), 'template', ctx, out)
+        seg_start = pos
+
+
+def _scan_expr(content, pos, kind, ctx, out):
+    """짝이 맞는 닫는 괄호까지 스캔하며 문자열을 기록하고 닫는 괄호 다음 위치 반환"""
+    depth = 0
+    n = len(content)
+    while True:
+        m = _EXPR_RE.search(content, pos)
+        if m is None:
+            return n
+        tok = m.group()
+        pos = m.end()
+        if tok in _OPENERS:
+            depth += 1
+        elif tok in _CLOSERS:
+            if depth == 0:
+                return pos
+            depth -= 1
+        elif tok == '"' or tok == "'":
+            pos = _scan_string(content, pos, tok, kind, ctx, out)
+        elif tok == '`':
+            pos = _scan_template(content, pos, ctx, out)
+        elif tok == '//':
+            newline = content.find('\n', pos)
+            pos = n if newline < 0 else newline
+        elif tok == '/*':
+            close = content.find('*/', pos)
+            pos = n if close < 0 else close + 2
+        else:
+            # 중첩된 cn( / clsx(
+            pos = _scan_expr(content, pos, 'call', ctx, out)
+
+
+class _ElementCursor:
+    """위치 순으로 진행하며 pos를 속성 영역에 포함하는 가장 안쪽 요소를 찾음"""
+
+    def __init__(self, elements):
+        self.elements = elements
+        self.next = 0
+        self.stack = []
+
+    def at(self, pos):
+        elements, stack = self.elements, self.stack
+        while self.next < len(elements) and elements[self.next].start < pos:
+            element = elements[self.next]
+            while stack and stack[-1].attrs_end <= element.start:
+                stack.pop()
+            stack.append(element)
+            self.next += 1
+        while stack and stack[-1].attrs_end <= pos:
+            stack.pop()
+        if stack and stack[-1].attrs_start <= pos:
+            return stack[-1]
+        return None
+
+
+def lex(content, elements=None, steps=None) -> List[ClassSpan]:
+    """파일 내용을 한 번 스캔해 className 스팬 목록을 반환 (위치 순)
+
+    elements: 이미 구한 scan_elements(content) 결과 (없으면 여기서 스캔)
+    steps: 주어지면 최상위 스캔 단계마다 (매치 시작, 다음 스캔 위치)를 추가 (증분 재분석용)
+    """
+    with stats.rule('lex'):
+        spans = _lex(content, elements, steps=steps)
+    if _recorded is not None and not _recorded:
+        _recorded.append(spans)
+    return spans
+
+
+def begin_record():
+    """이후 처음 lex한 파일 전체의 스팬 목록을 기록 (작업 함수는 원본 내용부터 lex함)"""
+    global _recorded
+    _recorded = []
+
+
+def end_record():
+    """기록한 스팬 목록 (lex하지 않았으면 None)"""
+    global _recorded
+    recorded, _recorded = _recorded, None
+    return recorded[0] if recorded else None
+
+
+def lex_range(content, elements, start, stop, steps=None):
+    """start부터 최상위 스캔을 진행해 stop 이후에서 시작하는 매치 직전에 멈춤
+
+    start는 최상위 상태(이전 단계가 걸쳐 있지 않은 위치)여야 하고,
+    elements는 그 범위의 scan_elements 결과면 충분합니다.
+    """
+    with stats.rule('lex'):
+        return _lex(content, elements, start, stop, steps)
+
+
+def _lex(content, elements=None, pos=0, stop=None, steps=None):
+    spans = []
+    if elements is None:
+        elements = scan_elements(content)
+    elements = _ElementCursor(elements)
+    search = _TOP_RE.search
+
+    while True:
+        m = search(content, pos)
+        if m is None or stop is not None and m.start() >= stop:
+            break
+
+        opener = m.group('open')
+        if opener is None:
+            # 속성 밖의 cn()/clsx() 호출
+            pos = _scan_expr(content, m.end(), 'call', (None, -1, m.start()), spans)
+            if steps is not None:
+                steps.append((m.start(), pos))
+            continue
+
+        # className 속성을 가진 여는 태그 (속성 영역 밖이면 None)
+        element = elements.at(m.start())
+        if element is None:
+            ctx = (None, -1, m.start())
+        else:
+            ctx = (element.tag, element.start, m.start())
+
+        if opener == '{':
+            pos = _scan_expr(content, m.end(), 'expr', ctx, spans)
+        else:
+            end = content.find(opener, m.end())
+            if end < 0:
+                if steps is not None:
+                    steps.append((m.start(), len(content)))
+                break
+            spans.append(ClassSpan(m.end(), end, content[m.end():end], 'literal', *ctx))
+            pos = end + 1
+        if steps is not None:
+            steps.append((m.start(), pos))
+
+    return spans
+
+
+def lex_file(filepath):
+    """파일을 읽어 (content, spans) 반환"""
+    content = read_source(filepath)
+    return content, lex(content)
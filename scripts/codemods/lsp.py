@@ -0,0 +1,489 @@
+#!/usr/bin/env python3
+"""
+스타일 규칙 LSP 서버 (표준 라이브러리만 사용, stdio)
+편집기에 rules.json 규칙(버튼 rounded-full, 카드 rounded-lg, 다크모드 클래스)의 진단을 보내고
+규칙별 수정과 파일 전체 수정(source.fixAll)을 code action으로 제공합니다.
+
+- textDocumentSync: 증분(2). 편집이 여는 태그 하나 안에서 끝나면 그 태그만 다시 스캔하고
+  나머지 스팬/진단은 offset만 옮김. 태그 밖의 단순 텍스트 편집은 다시 분석하지 않음
+- 그 외(태그 경계나 따옴표/괄호를 건드리는 편집)는 문서 전체를 다시 분석
+- 위치 인코딩: 클라이언트가 utf-32를 지원하면 utf-32, 아니면 LSP 기본값 utf-16
+"""
+
+import json
+import re
+import sys
+from bisect import bisect_left
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+from codemods.lexer import lex, lex_range
+from codemods.patch import LineIndex
+from codemods.rules import DEFAULT_RULES_PATH, describe_finding, load_ruleset
+from codemods.scanner import scan_elements
+from codemods.selectors import project_path
+
+SOURCE = 'style-rules'
+FIX_ALL_KIND = 'source.fixAll.' + SOURCE
+
+# LSP 상수
+_SYNC_INCREMENTAL = 2
+_SEVERITY_WARNING = 2
+_METHOD_NOT_FOUND = -32601
+_SERVER_NOT_INITIALIZED = -32002
+_INTERNAL_ERROR = -32603
+
+# 태그 밖 편집의 앞뒤 문맥에 이 문자들이 없으면 요소/스팬 구조가 바뀌지 않음
+# (줄바꿈은 // 주석의 끝, '<' 앞 글자는 JSX/비교 구분에 쓰임)
+_STRUCTURAL_RE = re.compile(r'''[<>{}()\[\]"'`/=\\\n]''')
+
+# 새로 생기거나 사라지면 스팬이 달라지는 식별자
+_HELPER_RE = re.compile(r'className|\b(?:cn|clsx)\b')
+
+_WORD_RE = re.compile(r'\w*')
+
+# UTF-16에서 두 단위를 차지하는 문자
+_ASTRAL_RE = re.compile('[\U00010000-\U0010ffff]')
+
+
+def read_message(stream):
+    """Content-Length 헤더로 구분된 JSON-RPC 메시지 하나 (EOF면 None)"""
+    length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode('ascii').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    if length is None:
+        return None
+    return json.loads(stream.read(length).decode('utf-8'))
+
+
+def write_message(stream, message):
+    body = json.dumps(message, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    stream.write(b'Content-Length: %d\r\n\r\n' % len(body))
+    stream.write(body)
+    stream.flush()
+
+
+def uri_to_path(uri):
+    parsed = urlparse(uri)
+    return unquote(parsed.path) if parsed.scheme == 'file' else uri
+
+
+def _workspace_root(params):
+    """initialize 요청의 작업 공간 루트 (없으면 현재 디렉토리의 git 저장소 루트)"""
+    folders = params.get('workspaceFolders') or []
+    uri = folders[0]['uri'] if folders else params.get('rootUri')
+    if uri:
+        return uri_to_path(uri)
+    if params.get('rootPath'):
+        return params['rootPath']
+    from codemods.gitfiles import find_project_root
+    return str(find_project_root())
+
+
+def _kind_wanted(kind, only):
+    """CodeActionContext.only 필터 ('source'는 'source.fixAll.*'을 포함)"""
+    return not only or any(kind == prefix or kind.startswith(prefix + '.') for prefix in only)
+
+
+def _top_level(elements):
+    """다른 여는 태그의 속성 안에 들어 있지 않은 요소인지 (요소마다 bool)"""
+    flags = []
+    end = -1
+    for element in elements:
+        top = element.start >= end
+        if top:
+            end = element.end
+        flags.append(top)
+    return flags
+
+
+def _step_start(step):
+    return step[0]
+
+
+def _finding_start(finding):
+    return finding[1]
+
+
+def _shift_span(span, delta):
+    return span._replace(
+        start=span.start + delta,
+        end=span.end + delta,
+        tag_start=span.tag_start + delta if span.tag_start >= 0 else -1,
+        attr_start=span.attr_start + delta,
+    )
+
+
+def _shift_element(element, delta):
+    return element._replace(
+        start=element.start + delta,
+        attrs_start=element.attrs_start + delta,
+        attrs_end=element.attrs_end + delta,
+        end=element.end + delta,
+    )
+
+
+def _shift_finding(finding, delta):
+    rule_id, start, end, (edit_start, edit_end, new_text) = finding
+    return rule_id, start + delta, end + delta, (edit_start + delta, edit_end + delta, new_text)
+
+
+class Document:
+    """열린 문서 하나의 내용과 분석 결과 (요소, 스팬, 규칙 위반)"""
+
+    def __init__(self, uri, text, version, ruleset, root=None):
+        self.uri = uri
+        self.path = uri_to_path(uri)
+        # files glob 판정용 (작업 공간 루트 기준)
+        self.rel_path = project_path(self.path, root)
+        self.version = version
+        self.ruleset = ruleset
+        self.text = text
+        self.full_analyses = 0
+        self.partial_analyses = 0
+        self._lines = None
+        self.analyze()
+
+    def analyze(self):
+        """문서 전체 분석"""
+        self.elements = scan_elements(self.text)
+        self.top = _top_level(self.elements)
+        self.starts = [element.start for element in self.elements]
+        self.steps = []
+        self.spans = lex(self.text, self.elements, self.steps)
+        self.findings = self.ruleset.findings(self.spans, self.rel_path, self.text)
+        self.full_analyses += 1
+
+    @property
+    def lines(self):
+        if self._lines is None:
+            self._lines = LineIndex(self.text)
+        return self._lines
+
+    # 위치 변환
+
+    def offset(self, position, encoding):
+        """LSP Position -> 문자 offset"""
+        lines = self.lines
+        line = position['line']
+        if line >= len(lines.starts):
+            return len(self.text)
+        start = lines.start(line)
+        end = lines.start(line + 1)
+        character = position['character']
+        if encoding == 'utf-16':
+            text = self.text[start:end]
+            if _ASTRAL_RE.search(text):
+                units = 0
+                for i, ch in enumerate(text):
+                    if units >= character:
+                        return start + i
+                    units += 2 if ord(ch) > 0xFFFF else 1
+                return end
+        return min(start + character, end)
+
+    def position(self, offset, encoding):
+        """문자 offset -> LSP Position"""
+        lines = self.lines
+        line = lines.line_of(offset)
+        start = lines.start(line)
+        character = offset - start
+        if encoding == 'utf-16':
+            astral = _ASTRAL_RE.findall(self.text, start, offset)
+            character += len(astral)
+        return {'line': line, 'character': character}
+
+    def range(self, start, end, encoding):
+        return {'start': self.position(start, encoding), 'end': self.position(end, encoding)}
+
+    # 증분 변경
+
+    def change(self, changes, version, encoding):
+        """didChange의 contentChanges 적용"""
+        for change in changes:
+            if 'range' not in change:
+                self.text = change['text']
+                self._lines = None
+                self.analyze()
+                continue
+            start = self.offset(change['range']['start'], encoding)
+            end = self.offset(change['range']['end'], encoding)
+            self._splice(start, end, change['text'])
+        self.version = version
+
+    def _splice(self, start, end, new_text):
+        old_text = self.text[start:end]
+        self.text = self.text[:start] + new_text + self.text[end:]
+        self._lines = None
+        delta = len(new_text) - (end - start)
+
+        element = self._enclosing_element(start, end)
+        if element is not None:
+            # select 규칙은 자손 요소의 판정도 바뀔 수 있으므로 전체 분석
+            if not self.ruleset.selects and self._reanalyze_element(element, delta):
+                return
+        elif self._plain_text_edit(start, old_text, len(new_text)) and not self._in_step(start, end):
+            # 태그 밖의 평범한 텍스트: 뒤쪽 offset만 이동
+            self._shift_after(end, delta)
+            return
+        self.analyze()
+
+    def _plain_text_edit(self, start, old_text, new_length):
+        """편집 전후 모두 (이어진 단어와 앞뒤 한 글자까지) 구조 문자나 className/cn 식별자가 없는지"""
+        text = self.text
+        before = start
+        while before > 0 and (text[before - 1].isalnum() or text[before - 1] == '_'):
+            before -= 1
+        before = max(0, before - 1)
+        after = _WORD_RE.match(text, start + new_length).end()
+        after = min(len(text), after + 1)
+        new_context = text[before:after]
+        old_context = text[before:start] + old_text + text[start + new_length:after]
+        for context in (old_context, new_context):
+            if _STRUCTURAL_RE.search(context) or _HELPER_RE.search(context):
+                return False
+        return True
+
+    def _enclosing_element(self, start, end):
+        """편집 [start, end)를 속성 영역(태그 이름 포함) 안에 품는 가장 바깥 여는 태그"""
+        i = bisect_left(self.starts, start) - 1
+        while i >= 0 and not self.top[i]:
+            i -= 1
+        if i < 0:
+            return None
+        element = self.elements[i]
+        if element.start < start and end <= element.attrs_end:
+            return element
+        return None
+
+    def _in_step(self, start, end):
+        """[start, end)가 lexer의 최상위 스캔 단계(className 값, cn() 인자) 안쪽과 겹치는지"""
+        i = bisect_left(self.steps, end, key=_step_start) - 1
+        return i >= 0 and self.steps[i][1] > start
+
+    def _span_index(self, offset):
+        return bisect_left(self.spans, offset, key=lambda span: span.start)
+
+    def _shift_after(self, offset, delta):
+        """offset 이후의 요소/스팬/위반 위치를 delta만큼 이동"""
+        if not delta:
+            return
+        self.elements = [_shift_element(e, delta) if e.start >= offset else e for e in self.elements]
+        self.starts = [element.start for element in self.elements]
+        self.spans = [_shift_span(s, delta) if s.start >= offset else s for s in self.spans]
+        self.steps = [(a + delta, b + delta) if a >= offset else (a, b) for a, b in self.steps]
+        self.findings = [_shift_finding(f, delta) if f[1] >= offset else f for f in self.findings]
+
+    def _reanalyze_element(self, element, delta):
+        """여는 태그 하나만 다시 스캔 (태그와 lexer 단계의 경계가 그대로일 때만 True)"""
+        window_start = element.start
+        old_end = element.end
+        window_end = old_end + delta
+        # 편집 전 lexer 단계가 창 경계에 걸쳐 있으면 창 밖 결과도 달라질 수 있음
+        if self._in_step(window_start, window_start) or self._in_step(old_end, old_end):
+            return False
+
+        window = self.text[window_start:window_end]
+        sub_elements = scan_elements(window)
+        if (not sub_elements or sub_elements[0].start != 0 or sub_elements[0].end != len(window)
+                or any(e.start >= sub_elements[0].end for e in sub_elements[1:])):
+            return False
+        sub_elements = [_shift_element(e, window_start) for e in sub_elements]
+
+        sub_steps = []
+        sub_spans = lex_range(self.text, sub_elements, window_start, window_end, sub_steps)
+        if sub_steps and sub_steps[-1][1] > window_end:
+            return False
+        sub_findings = self.ruleset.findings(sub_spans, self.rel_path)
+
+        i = bisect_left(self.starts, window_start)
+        j = bisect_left(self.starts, old_end)
+        tail = [_shift_element(e, delta) for e in self.elements[j:]]
+        self.elements = self.elements[:i] + sub_elements + tail
+        self.top = self.top[:i] + [True] + [False] * (len(sub_elements) - 1) + self.top[j:]
+        self.starts = [e.start for e in self.elements]
+
+        i = bisect_left(self.steps, window_start, key=_step_start)
+        j = bisect_left(self.steps, old_end, key=_step_start)
+        self.steps = self.steps[:i] + sub_steps + [(a + delta, b + delta) for a, b in self.steps[j:]]
+
+        i = self._span_index(window_start)
+        j = self._span_index(old_end)
+        self.spans = self.spans[:i] + sub_spans + [_shift_span(s, delta) for s in self.spans[j:]]
+
+        i = bisect_left(self.findings, window_start, key=_finding_start)
+        j = bisect_left(self.findings, old_end, key=_finding_start)
+        self.findings = (self.findings[:i] + sub_findings
+                         + [_shift_finding(f, delta) for f in self.findings[j:]])
+        self.partial_analyses += 1
+        return True
+
+    # 진단과 code action
+
+    def _message(self, finding):
+        return describe_finding(self.text, finding)
+
+    def diagnostic(self, finding, encoding):
+        rule_id, start, end, _ = finding
+        return {
+            'range': self.range(start, end, encoding),
+            'severity': _SEVERITY_WARNING,
+            'code': rule_id,
+            'source': SOURCE,
+            'message': self._message(finding),
+        }
+
+    def diagnostics(self, encoding):
+        return [self.diagnostic(finding, encoding) for finding in self.findings]
+
+    def _text_edit(self, edit, encoding):
+        start, end, new_text = edit
+        return {'range': self.range(start, end, encoding), 'newText': new_text}
+
+    def code_actions(self, request_range, only, encoding):
+        """요청 범위에 걸친 규칙별 quickfix와 파일 전체 수정 (only로 종류 제한)"""
+        actions = []
+        if _kind_wanted('quickfix', only):
+            start = self.offset(request_range['start'], encoding)
+            end = self.offset(request_range['end'], encoding)
+            for finding in self.findings:
+                rule_id, f_start, f_end, edit = finding
+                if f_end < start or f_start > end:
+                    continue
+                actions.append({
+                    'title': f"{rule_id}: {self._message(finding)} 수정",
+                    'kind': 'quickfix',
+                    'diagnostics': [self.diagnostic(finding, encoding)],
+                    'isPreferred': True,
+                    'edit': {'changes': {self.uri: [self._text_edit(edit, encoding)]}},
+                })
+
+        if _kind_wanted(FIX_ALL_KIND, only) and self.findings:
+            edits = self.ruleset.span_edits(self.spans, self.rel_path, content=self.text)
+            actions.append({
+                'title': f'스타일 규칙 모두 적용 ({len(self.findings)}개)',
+                'kind': FIX_ALL_KIND,
+                'edit': {'changes': {self.uri: [self._text_edit(edit, encoding) for edit in edits]}},
+            })
+        return actions
+
+
+class Server:
+    """stdio JSON-RPC 루프"""
+
+    def __init__(self, reader, writer, rules_path=DEFAULT_RULES_PATH):
+        self.reader = reader
+        self.writer = writer
+        self.ruleset = load_ruleset(Path(rules_path))
+        self.documents = {}
+        self.root = None
+        self.encoding = 'utf-16'
+        self.initialized = False
+        self.shutdown_requested = False
+
+    def serve(self):
+        """exit 알림까지 처리하고 종료 코드 반환"""
+        while True:
+            message = read_message(self.reader)
+            if message is None:
+                return 1
+            if message.get('method') == 'exit':
+                return 0 if self.shutdown_requested else 1
+            self._dispatch(message)
+
+    def send(self, message):
+        message['jsonrpc'] = '2.0'
+        write_message(self.writer, message)
+
+    def notify(self, method, params):
+        self.send({'method': method, 'params': params})
+
+    def _dispatch(self, message):
+        method = message.get('method')
+        request_id = message.get('id')
+        handler = getattr(self, 'on_' + method.replace('/', '_').replace('$', 'dollar'), None) if method else None
+
+        if request_id is None:
+            # 알림: 모르는 것은 무시 ($/cancelRequest 등)
+            if handler is not None and (self.initialized or method == 'initialized'):
+                try:
+                    handler(message.get('params') or {})
+                except Exception as e:
+                    print(f"❌ {method}: {type(e).__name__}: {e}", file=sys.stderr)
+            return
+
+        if handler is None:
+            self.send({'id': request_id, 'error': {'code': _METHOD_NOT_FOUND, 'message': f'{method} 미지원'}})
+            return
+        if not self.initialized and method != 'initialize':
+            self.send({'id': request_id, 'error': {'code': _SERVER_NOT_INITIALIZED, 'message': 'initialize 전'}})
+            return
+        try:
+            result = handler(message.get('params') or {})
+        except Exception as e:
+            self.send({'id': request_id, 'error': {'code': _INTERNAL_ERROR, 'message': f'{type(e).__name__}: {e}'}})
+            return
+        self.send({'id': request_id, 'result': result})
+
+    def publish(self, document):
+        self.notify('textDocument/publishDiagnostics', {
+            'uri': document.uri,
+            'version': document.version,
+            'diagnostics': document.diagnostics(self.encoding),
+        })
+
+    # 요청/알림 처리
+
+    def on_initialize(self, params):
+        encodings = (params.get('capabilities', {}).get('general', {}) or {}).get('positionEncodings') or []
+        self.encoding = 'utf-32' if 'utf-32' in encodings else 'utf-16'
+        self.root = _workspace_root(params)
+        self.initialized = True
+        return {
+            'capabilities': {
+                'positionEncoding': self.encoding,
+                'textDocumentSync': {'openClose': True, 'change': _SYNC_INCREMENTAL},
+                'codeActionProvider': {'codeActionKinds': ['quickfix', FIX_ALL_KIND]},
+            },
+            'serverInfo': {'name': 'style-rules-lsp'},
+        }
+
+    def on_initialized(self, params):
+        pass
+
+    def on_shutdown(self, params):
+        self.shutdown_requested = True
+        return None
+
+    def on_textDocument_didOpen(self, params):
+        item = params['textDocument']
+        document = Document(item['uri'], item['text'], item.get('version'), self.ruleset, self.root)
+        self.documents[item['uri']] = document
+        self.publish(document)
+
+    def on_textDocument_didChange(self, params):
+        document = self.documents.get(params['textDocument']['uri'])
+        if document is None:
+            return
+        document.change(params['contentChanges'], params['textDocument'].get('version'), self.encoding)
+        self.publish(document)
+
+    def on_textDocument_didClose(self, params):
+        uri = params['textDocument']['uri']
+        if self.documents.pop(uri, None) is not None:
+            self.notify('textDocument/publishDiagnostics', {'uri': uri, 'diagnostics': []})
+
+    def on_textDocument_codeAction(self, params):
+        document = self.documents.get(params['textDocument']['uri'])
+        if document is None:
+            return []
+        only = (params.get('context') or {}).get('only')
+        return document.code_actions(params['range'], only, self.encoding)
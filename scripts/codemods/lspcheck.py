@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+스타일 규칙 LSP 서버 점검 (stdio 클라이언트 스크립트)
+style-lsp.py를 띄워 실제 프로토콜로 파일을 열고 편집해 보며 확인합니다.
+
+- didOpen 진단 == 같은 내용을 처음부터 분석한 진단 (규칙 위반 수는 RuleSet.findings와 같음)
+- 무작위 증분 편집(className 안, 여는 태그 안, 태그 밖 텍스트, 태그 경계) 뒤의 진단
+  == 편집 결과를 처음부터 분석한 진단
+- source.fixAll 편집을 적용한 결과 == RuleSet.apply 결과
+
+    cd scripts
+    python3 -m codemods.lspcheck ../src --edits 20
+"""
+
+import argparse
+import random
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from codemods.discover import walk_files
+from codemods.lexer import lex
+from codemods.lsp import FIX_ALL_KIND, Document, read_message, write_message
+from codemods.rules import DEFAULT_RULES_PATH, load_ruleset
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+SUFFIXES = ('.tsx', '.jsx')
+
+# 무작위 편집에 넣을 텍스트 (종류별)
+CLASS_INSERTS = (' rounded-md', ' rounded-lg', ' rounded-full', ' bg-white', ' dark:bg-gray-800', ' px-4', '')
+ATTR_INSERTS = (' disabled', ' type="button"', ' className="rounded-md p-2"', ' onClick={() => go("x")}', '')
+TEXT_INSERTS = ('hello', ' ', 'x', '한글', '😀', '')
+STRUCTURAL_INSERTS = ('<', '>', '"', '{', '}', '\n', '<button className="rounded-md">', '/>', '')
+
+
+def utf16_position(text, offset):
+    line = text.count('\n', 0, offset)
+    line_start = text.rfind('\n', 0, offset) + 1
+    return {'line': line, 'character': len(text[line_start:offset].encode('utf-16-le')) // 2}
+
+
+class Client:
+    """서버 프로세스와 요청/알림을 주고받는 최소 클라이언트"""
+
+    def __init__(self, command):
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, cwd=SCRIPTS_DIR)
+        self.next_id = 0
+        self.diagnostics = {}       # uri -> (version, diagnostics)
+
+    def notify(self, method, params):
+        write_message(self.process.stdin, {'jsonrpc': '2.0', 'method': method, 'params': params})
+
+    def request(self, method, params):
+        self.next_id += 1
+        request_id = self.next_id
+        write_message(self.process.stdin, {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params})
+        while True:
+            message = self._read()
+            if message.get('id') == request_id:
+                if 'error' in message:
+                    raise RuntimeError(f"{method}: {message['error']}")
+                return message.get('result')
+
+    def wait_diagnostics(self, uri, version):
+        while True:
+            current = self.diagnostics.get(uri)
+            if current is not None and current[0] == version:
+                return current[1]
+            self._read()
+
+    def _read(self):
+        message = read_message(self.process.stdout)
+        if message is None:
+            raise RuntimeError('서버가 종료됨')
+        if message.get('method') == 'textDocument/publishDiagnostics':
+            params = message['params']
+            self.diagnostics[params['uri']] = (params.get('version'), params['diagnostics'])
+        return message
+
+    def close(self):
+        self.request('shutdown', None)
+        self.notify('exit', None)
+        self.process.stdin.close()
+        return self.process.wait(timeout=10)
+
+
+def _key(diagnostics):
+    return sorted((d['range']['start']['line'], d['range']['start']['character'],
+                   d['range']['end']['line'], d['range']['end']['character'], d['code'], d['message'])
+                  for d in diagnostics)
+
+
+def random_edit(rng, document):
+    """(start, end, 새 텍스트) - 스팬/여는 태그/태그 밖/구조 편집 중 하나"""
+    text = document.text
+    choice = rng.random()
+    if choice < 0.35 and document.spans:
+        span = rng.choice(document.spans)
+        start = rng.randint(span.start, span.end)
+        end = start if rng.random() < 0.6 else min(span.end, start + rng.randint(1, 12))
+        return start, end, rng.choice(CLASS_INSERTS)
+    if choice < 0.6 and document.elements:
+        element = rng.choice(document.elements)
+        start = rng.randint(element.attrs_start, element.attrs_end)
+        return start, start, rng.choice(ATTR_INSERTS)
+    if choice < 0.9:
+        start = rng.randint(0, len(text))
+        end = start if rng.random() < 0.7 else min(len(text), start + rng.randint(1, 5))
+        return start, end, rng.choice(TEXT_INSERTS)
+    start = rng.randint(0, len(text))
+    end = min(len(text), start + rng.randint(0, 3))
+    return start, end, rng.choice(STRUCTURAL_INSERTS)
+
+
+def apply_text_edits(text, edits):
+    """LSP TextEdit 목록(겹치지 않음)을 적용"""
+    resolved = []
+    for edit in edits:
+        resolved.append((_offset(text, edit['range']['start']), _offset(text, edit['range']['end']), edit['newText']))
+    for start, end, new_text in sorted(resolved, reverse=True):
+        text = text[:start] + new_text + text[end:]
+    return text
+
+
+def _offset(text, position):
+    pos = 0
+    for _ in range(position['line']):
+        pos = text.index('\n', pos) + 1
+    units = 0
+    while units < position['character']:
+        units += 2 if ord(text[pos]) > 0xFFFF else 1
+        pos += 1
+    return pos
+
+
+def check_file(client, path, ruleset, rng, edits, timings, root):
+    """파일 하나 점검 - 불일치 메시지 목록"""
+    problems = []
+    text = path.read_text(encoding='utf-8')
+    uri = path.resolve().as_uri()
+    version = 1
+
+    started = time.perf_counter()
+    client.notify('textDocument/didOpen', {
+        'textDocument': {'uri': uri, 'languageId': 'typescriptreact', 'version': version, 'text': text}})
+    diagnostics = client.wait_diagnostics(uri, version)
+    timings['open'].append(time.perf_counter() - started)
+
+    expected = Document(uri, text, version, ruleset, root)
+    if _key(diagnostics) != _key(expected.diagnostics('utf-16')):
+        problems.append('didOpen 진단 불일치')
+    if len(diagnostics) != len(ruleset.findings(lex(text), expected.rel_path, text)):
+        problems.append('didOpen 진단 수가 RuleSet.findings와 다름')
+
+    for _ in range(edits):
+        start, end, new_text = random_edit(rng, expected)
+        change = {'range': {'start': utf16_position(text, start), 'end': utf16_position(text, end)}, 'text': new_text}
+        text = text[:start] + new_text + text[end:]
+        version += 1
+
+        started = time.perf_counter()
+        client.notify('textDocument/didChange', {
+            'textDocument': {'uri': uri, 'version': version}, 'contentChanges': [change]})
+        diagnostics = client.wait_diagnostics(uri, version)
+        timings['change'].append(time.perf_counter() - started)
+
+        expected = Document(uri, text, version, ruleset, root)
+        if _key(diagnostics) != _key(expected.diagnostics('utf-16')):
+            problems.append(f'편집 {version - 1}회 뒤 진단 불일치 ({start}:{end} -> {new_text!r})')
+            break
+
+    whole = {'start': {'line': 0, 'character': 0}, 'end': utf16_position(text, len(text))}
+    started = time.perf_counter()
+    actions = client.request('textDocument/codeAction', {
+        'textDocument': {'uri': uri}, 'range': whole,
+        'context': {'diagnostics': [], 'only': [FIX_ALL_KIND]}})
+    timings['fix_all'].append(time.perf_counter() - started)
+
+    fixed = text
+    if actions:
+        fixed = apply_text_edits(text, actions[0]['edit']['changes'][uri])
+    wanted, _ = ruleset.apply(text, lex(text), expected.rel_path)
+    if fixed != wanted:
+        problems.append('source.fixAll 결과가 RuleSet.apply와 다름')
+
+    client.notify('textDocument/didClose', {'textDocument': {'uri': uri}})
+    return problems
+
+
+def _ms(values):
+    if not values:
+        return '-'
+    values = sorted(values)
+    p95 = values[min(len(values) - 1, int(len(values) * 0.95))]
+    return f"중앙값 {statistics.median(values) * 1000:.1f}ms, p95 {p95 * 1000:.1f}ms"
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='스타일 규칙 LSP 서버 점검')
+    parser.add_argument('paths', nargs='*', type=Path, default=[SCRIPTS_DIR.parent / 'src'],
+                        help='점검할 파일/디렉토리 (기본: src)')
+    parser.add_argument('--edits', type=int, default=20, help='파일당 무작위 편집 수')
+    parser.add_argument('--limit', type=int, help='최대 파일 수')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--rules', type=Path, default=DEFAULT_RULES_PATH, help='서버와 기대값에 쓸 규칙 파일 (JSON)')
+    args = parser.parse_args()
+
+    files = []
+    for path in args.paths:
+        if path.is_dir():
+            files.extend(sorted(walk_files(path, SUFFIXES, path)))
+        else:
+            files.append(path)
+    if args.limit:
+        files = files[:args.limit]
+
+    rules_path = args.rules.resolve()
+    ruleset = load_ruleset(rules_path)
+    rng = random.Random(args.seed)
+    client = Client([sys.executable, str(SCRIPTS_DIR / 'style-lsp.py'), '--rules', str(rules_path)])
+    # files glob은 작업 공간 루트 기준이므로 서버와 기대값이 같은 루트를 씀
+    root = SCRIPTS_DIR.parent
+    client.request('initialize', {'processId': None, 'rootUri': root.as_uri(), 'capabilities': {}})
+    client.notify('initialized', {})
+
+    print(f"🩺 LSP 점검: {len(files)}개 파일, 파일당 편집 {args.edits}회")
+    timings = {'open': [], 'change': [], 'fix_all': []}
+    failed = 0
+    for path in files:
+        problems = check_file(client, path, ruleset, rng, args.edits, timings, str(root))
+        if problems:
+            failed += 1
+            for problem in problems:
+                print(f"❌ {path}: {problem}")
+
+    code = client.close()
+    print(f"⏱️  didOpen: {_ms(timings['open'])}")
+    print(f"⏱️  didChange: {_ms(timings['change'])}")
+    print(f"⏱️  fixAll: {_ms(timings['fix_all'])}")
+    if code != 0:
+        print(f"❌ 서버 종료 코드 {code}")
+        return 1
+    if failed:
+        print(f"❌ {failed}개 파일 불일치")
+        return 1
+    print("✨ 모든 진단과 수정이 일치합니다")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
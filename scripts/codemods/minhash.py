@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+MinHash/LSH 근사 중복 클러스터링
+className 토큰 집합 수만 개를 쌍마다 비교하지 않고 (O(n²)) 거의 선형 시간에 비슷한 것끼리 묶습니다.
+
+- 같은 토큰 집합은 먼저 하나로 합치고 (출현 횟수만 셈)
+- 토큰마다 num_perm개의 해시 벡터를 한 번만 계산해 두면
+  집합의 MinHash 서명은 토큰 벡터들의 원소별 최솟값
+- 서명을 band개의 띠로 나눠 같은 띠를 가진 집합만 후보로 보고 (LSH)
+- 후보는 실제 Jaccard 유사도로 확인해 가장 가까운 대표 집합에 붙임 (대표 기준 클러스터)
+"""
+
+import hashlib
+import random
+from collections import Counter, defaultdict
+
+# 메르센 소수 2^61 - 1 (universal hash a*x + b mod p)
+_PRIME = (1 << 61) - 1
+
+DEFAULT_NUM_PERM = 64
+
+# LSH 변곡점 = 임계값 x RECALL_MARGIN
+RECALL_MARGIN = 0.85
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def lsh_params(threshold, num_perm=DEFAULT_NUM_PERM):
+    """유사도 임계값에 맞는 (band 수, band당 행 수)
+
+    두 집합이 한 band 이상에서 겹칠 확률은 1 - (1 - s^r)^b이고
+    이 S자 곡선의 변곡점은 약 (1/b)^(1/r)이므로 그 값이 threshold에 가장 가까운 조합을 고름
+    """
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if bands == 0:
+            break
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class MinHasher:
+    """토큰 집합의 MinHash 서명 (토큰별 해시 벡터는 캐시)"""
+
+    def __init__(self, num_perm=DEFAULT_NUM_PERM, seed=1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self.coefficients = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+        self._vectors = {}
+
+    def _vector(self, token):
+        vector = self._vectors.get(token)
+        if vector is None:
+            x = int.from_bytes(hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest(), 'little')
+            vector = tuple((a * x + b) % _PRIME for a, b in self.coefficients)
+            self._vectors[token] = vector
+        return vector
+
+    def signature(self, tokens):
+        """비어 있지 않은 토큰 집합의 서명 (num_perm개 정수 튜플)"""
+        vectors = [self._vector(token) for token in tokens]
+        if len(vectors) == 1:
+            return vectors[0]
+        return tuple(map(min, *vectors))
+
+
+def cluster_sets(sets, threshold=0.7, num_perm=DEFAULT_NUM_PERM, seed=1, weights=None):
+    """서로 다른 토큰 집합(frozenset) 목록을 근사 중복끼리 묶어 [[인덱스, ...]] 반환
+
+    weights(출현 횟수)가 큰 집합부터 보면서, LSH 버킷에서 만난 기존 대표 집합 중
+    Jaccard 유사도가 threshold 이상인 가장 가까운 대표에 붙이고 없으면 새 대표가 됩니다.
+    버킷에는 대표만 넣으므로 비교 횟수는 (집합 수 x band 수 x 버킷의 대표 수)이고,
+    모든 멤버가 대표와 직접 비슷하므로 단일 연결처럼 사슬로 번지지 않습니다.
+    """
+    # 후보는 실제 유사도로 다시 확인하므로 곡선의 변곡점을 임계값보다 낮춰 놓치는 쌍을 줄임
+    bands, rows = lsh_params(threshold * RECALL_MARGIN, num_perm)
+    hasher = MinHasher(num_perm, seed)
+    signatures = [hasher.signature(tokens) for tokens in sets]
+    if weights is None:
+        weights = [1] * len(sets)
+    order = sorted(range(len(sets)), key=lambda i: (-weights[i], -len(sets[i])))
+
+    buckets = [defaultdict(list) for _ in range(bands)]
+    clusters = {}       # 대표 인덱스 -> 멤버 인덱스 목록
+    for i in order:
+        keys = [signatures[i][band * rows:(band + 1) * rows] for band in range(bands)]
+        best, best_score = None, threshold
+        seen = set()
+        for band, key in enumerate(keys):
+            for leader in buckets[band].get(key, ()):
+                if leader in seen:
+                    continue
+                seen.add(leader)
+                score = jaccard(sets[i], sets[leader])
+                if score >= best_score:
+                    best, best_score = leader, score
+        if best is not None:
+            clusters[best].append(i)
+            continue
+        clusters[i] = [i]
+        for band, key in enumerate(keys):
+            buckets[band][key].append(i)
+    return list(clusters.values())
+
+
+def consensus(members):
+    """[(토큰 순서 목록, 출현 횟수)]에서 출현 가중치 절반 이상이 가진 토큰 (가장 흔한 멤버의 순서대로)"""
+    total = sum(count for _, count in members)
+    weights = Counter()
+    for tokens, count in members:
+        for token in set(tokens):
+            weights[token] += count
+    common = {token for token, weight in weights.items() if weight * 2 >= total}
+
+    ordered = []
+    for tokens, _ in sorted(members, key=lambda member: -member[1]):
+        for token in tokens:
+            if token in common and token not in ordered:
+                ordered.append(token)
+    return ordered
@@ -0,0 +1,365 @@
+#!/usr/bin/env python3
+"""
+className 목록 정규화 (tailwind-merge 방식의 충돌 해소)
+코드모드가 만든 className에 남는 충돌(rounded-lg ... rounded-full)과
+반복 실행으로 생긴 중복(dark:bg-gray-800 두 번)을 정리합니다.
+
+- 토큰마다 (변형, !important, 유틸리티 그룹)을 키로 보고, 같은 키는 뒤에 온 것만 남김
+- 변형은 순서와 무관하게 비교 (dark:hover: == hover:dark:, 임의 변형 [&>*]:는 순서 유지)
+- 넓은 그룹은 좁은 그룹을 덮어씀 (p-4는 앞의 px-2/pt-1을, rounded-lg는 앞의 rounded-t-xl을 제거)
+- 모르는 클래스(btn-primary 등)는 완전히 같은 토큰의 중복만 제거
+- 색과 길이가 모두 가능한 접두사에 표시 없는 var()/calc() 임의값(border-[var(--c)])은 종류를 알 수 없으므로
+  모르는 클래스처럼 다룸 ([length:...], [color:...] 표시가 있으면 그대로 따름)
+- 토큰 사이 공백과 줄바꿈은 그대로, 제거한 토큰은 앞 공백과 함께 제거
+
+같은 className 문자열은 트리 전체에서 반복되므로 결과는 문자열 단위 LRU 캐시에 둡니다.
+"""
+
+import re
+from functools import lru_cache
+
+from codemods import stats
+
+# 서로 다른 className 문자열 캐시 크기 (프로세스당)
+NORMALIZE_CACHE_SIZE = 8192
+
+_TOKEN_RE = re.compile(r'\S+')
+
+_ARBITRARY = r'\[.+\]'
+# 길이로 보이는 임의값 (border-[2px]는 두께, border-[#eee]는 색)
+_ARBITRARY_LENGTH = r'\[(?:length:)?(?:[\d.]+[a-z%]*|(?:calc|min|max|clamp|var)\(.+\))\]'
+_NUMBER_RE = re.compile(rf'(?:\d+(?:\.\d+)?|{_ARBITRARY_LENGTH})$')
+_PERCENT_RE = re.compile(rf'(?:\d+%|{_ARBITRARY_LENGTH})$')
+_TSHIRT_RE = re.compile(rf'(?:none|xs|sm|md|lg|xl|\d?xl|full|inner|{_ARBITRARY_LENGTH})$')
+_FONT_SIZE_RE = re.compile(r'(?:xs|sm|base|lg|xl|\dxl|\[\d[\d.]*(?:px|r?em|%|vw|vh)?\])(?:/\S+)?$')
+_FONT_WEIGHT_RE = re.compile(r'(?:thin|extralight|light|normal|medium|semibold|bold|extrabold|black|\[\d+\])$')
+_FONT_FAMILY_RE = re.compile(rf'(?:sans|serif|mono|{_ARBITRARY})$')
+_ALIGN_RE = re.compile(r'(?:normal|center|start|end|between|around|evenly|baseline|stretch|left|right)$')
+_OBJECT_FIT_RE = re.compile(r'(?:contain|cover|fill|none|scale-down)$')
+_ARBITRARY_COLOR_RE = re.compile(r'\[(?:color:|#|rgba?\(|hsla?\()')
+# 길이인지 색인지 표시가 없는 임의값 (var(--c)는 둘 다, calc()도 색 함수 안에서 쓰일 수 있음)
+_UNTYPED_RE = re.compile(r'\[(?:calc|min|max|clamp|var)\(')
+
+# Tailwind 기본 팔레트와 tailwind.config.js의 테마 색 (첫 마디: gray-500 -> gray, bs-blue-600 -> bs)
+# 여기 없는 이름(text-md 같은 오타 포함)은 색으로 보지 않고 그대로 둠
+_COLORS = frozenset('''
+    inherit current transparent black white slate gray zinc neutral stone red orange amber yellow lime
+    green emerald teal cyan sky blue indigo violet purple fuchsia pink rose
+    background foreground card popover primary secondary muted accent destructive border input ring
+    chart sidebar bs
+'''.split())
+
+
+def _any(value):
+    return bool(value)
+
+
+def _color(value):
+    """색 이름(gray-500, primary-foreground, black/50)이거나 색으로 보이는 임의값"""
+    if value.startswith('['):
+        return bool(_ARBITRARY_COLOR_RE.match(value))
+    return value.split('/', 1)[0].split('-', 1)[0] in _COLORS
+
+
+def _arbitrary(value):
+    return value.startswith('[') and value.endswith(']')
+
+
+def _number(value):
+    return bool(_NUMBER_RE.match(value))
+
+
+def _percent(value):
+    return bool(_PERCENT_RE.match(value))
+
+
+def _tshirt(value):
+    return bool(_TSHIRT_RE.match(value))
+
+
+def _font_size(value):
+    return bool(_FONT_SIZE_RE.match(value))
+
+
+def _font_weight(value):
+    return bool(_FONT_WEIGHT_RE.match(value))
+
+
+def _font_family(value):
+    return bool(_FONT_FAMILY_RE.match(value))
+
+
+def _align(value):
+    return bool(_ALIGN_RE.match(value))
+
+
+def _object_fit(value):
+    return bool(_OBJECT_FIT_RE.match(value))
+
+
+# 토큰 전체로 판별하는 그룹
+_EXACT_GROUPS = {
+    'display': 'block inline-block inline flex inline-flex table inline-table table-caption table-cell '
+               'table-column table-column-group table-footer-group table-header-group table-row-group '
+               'table-row flow-root grid inline-grid contents list-item hidden',
+    'position': 'static fixed absolute relative sticky',
+    'visibility': 'visible invisible collapse',
+    'isolation': 'isolate isolation-auto',
+    'box-sizing': 'box-border box-content',
+    'sr': 'sr-only not-sr-only',
+    'appearance': 'appearance-none appearance-auto',
+    'font-style': 'italic not-italic',
+    'font-smoothing': 'antialiased subpixel-antialiased',
+    'text-transform': 'uppercase lowercase capitalize normal-case',
+    'text-decoration': 'underline overline line-through no-underline',
+    'text-overflow': 'truncate text-ellipsis text-clip',
+    'text-wrap': 'text-wrap text-nowrap text-balance text-pretty',
+    'text-align': 'text-left text-center text-right text-justify text-start text-end',
+    'flex-direction': 'flex-row flex-row-reverse flex-col flex-col-reverse',
+    'flex-wrap': 'flex-wrap flex-wrap-reverse flex-nowrap',
+    'border-style': 'border-solid border-dashed border-dotted border-double border-hidden border-none',
+    'border-collapse': 'border-collapse border-separate',
+    'divide-style': 'divide-solid divide-dashed divide-dotted divide-double divide-none',
+    'outline-style': 'outline outline-none outline-dashed outline-dotted outline-double',
+    'bg-attachment': 'bg-fixed bg-local bg-scroll',
+    'bg-size': 'bg-auto bg-cover bg-contain',
+    'bg-repeat': 'bg-repeat bg-no-repeat bg-repeat-x bg-repeat-y bg-repeat-round bg-repeat-space',
+    'bg-position': 'bg-bottom bg-center bg-left bg-left-bottom bg-left-top bg-right bg-right-bottom '
+                   'bg-right-top bg-top',
+    'bg-image': 'bg-none',
+    'transform': 'transform transform-gpu transform-cpu transform-none',
+    'resize': 'resize resize-none resize-x resize-y',
+    'space-x-reverse': 'space-x-reverse',
+    'space-y-reverse': 'space-y-reverse',
+    'ring-inset': 'ring-inset',
+    'pointer-events': 'pointer-events-none pointer-events-auto',
+    'select': 'select-none select-text select-all select-auto',
+    'word-break': 'break-normal break-words break-all break-keep',
+    'list-position': 'list-inside list-outside',
+    'decoration-style': 'decoration-solid decoration-double decoration-dotted decoration-dashed decoration-wavy',
+    'snap-type': 'snap-none snap-x snap-y snap-both',
+    'snap-strictness': 'snap-mandatory snap-proximity',
+    'snap-align': 'snap-start snap-end snap-center snap-align-none',
+    'snap-stop': 'snap-normal snap-always',
+    # touch-action: pan-x/pan-y/pinch-zoom은 함께 쓸 수 있고 auto/none/manipulation과만 충돌
+    'touch': 'touch-auto touch-none touch-manipulation',
+    'touch-x': 'touch-pan-x touch-pan-left touch-pan-right',
+    'touch-y': 'touch-pan-y touch-pan-up touch-pan-down',
+    'touch-pz': 'touch-pinch-zoom',
+}
+
+# 그 이름만으로도 쓰이는 접두사 (rounded, border, shadow ...)의 기본값 그룹
+_BARE_GROUPS = {
+    'rounded': 'rounded', 'border': 'border-w', 'ring': 'ring-w', 'shadow': 'shadow',
+    'transition': 'transition', 'grow': 'grow', 'shrink': 'shrink', 'blur': 'blur',
+    'backdrop-blur': 'backdrop-blur', 'divide-x': 'divide-x', 'divide-y': 'divide-y',
+}
+
+_SIDES = ('x', 'y', 't', 'r', 'b', 'l', 's', 'e')
+_CORNERS = ('t', 'r', 'b', 'l', 's', 'e', 'tl', 'tr', 'br', 'bl', 'ss', 'se', 'es', 'ee')
+
+# 접두사 -> [(값 판별 함수, 그룹)] (앞의 판별 함수부터 시도, 색은 마지막)
+_PREFIX_GROUPS = {
+    'text': [(_font_size, 'font-size'), (_color, 'text-color')],
+    'bg': [(lambda value: value.startswith('gradient-to-'), 'bg-image'),
+           (lambda value: value.startswith('opacity-'), 'bg-opacity'), (_color, 'bg-color'),
+           (_arbitrary, 'bg-image')],
+    'border': [(_number, 'border-w'), (lambda value: value.startswith('opacity-'), 'border-opacity'),
+               (_color, 'border-color')],
+    'ring': [(_number, 'ring-w'), (_color, 'ring-color')],
+    'ring-offset': [(_number, 'ring-offset-w'), (_color, 'ring-offset-color')],
+    'outline': [(_number, 'outline-w'), (_color, 'outline-color')],
+    'outline-offset': [(_number, 'outline-offset')],
+    'shadow': [(_tshirt, 'shadow'), (_color, 'shadow-color'), (_arbitrary, 'shadow')],
+    'divide-x': [(_number, 'divide-x')],
+    'divide-y': [(_number, 'divide-y')],
+    'divide': [(_color, 'divide-color')],
+    'font': [(_font_weight, 'font-weight'), (_font_family, 'font-family')],
+    'rounded': [(_tshirt, 'rounded')],
+    'from': [(_percent, 'gradient-from-pos'), (_color, 'gradient-from')],
+    'via': [(_percent, 'gradient-via-pos'), (_color, 'gradient-via')],
+    'to': [(_percent, 'gradient-to-pos'), (_color, 'gradient-to')],
+    'stroke': [(_number, 'stroke-w'), (_color, 'stroke')],
+    'decoration': [(lambda value: value in ('auto', 'from-font') or _number(value), 'decoration-thickness'),
+                   (_color, 'decoration-color')],
+    'object': [(_object_fit, 'object-fit'), (_any, 'object-position')],
+    'content': [(_align, 'align-content'), (_any, 'content')],
+    'flex': [(lambda value: value in ('1', 'auto', 'initial', 'none') or value.startswith('['), 'flex')],
+    'grow': [(_number, 'grow')],
+    'shrink': [(_number, 'shrink')],
+    'list': [(_any, 'list-style-type')],
+    'transition': [(_any, 'transition')],
+    'blur': [(_tshirt, 'blur')],
+    'backdrop-blur': [(_tshirt, 'backdrop-blur')],
+    'placeholder': [(lambda value: value.startswith('opacity-'), 'placeholder-opacity'),
+                    (_color, 'placeholder-color')],
+}
+
+# 값과 관계없이 접두사만으로 정해지는 그룹
+for _prefix in ('p px py pt pr pb pl ps pe m mx my mt mr mb ml ms me space-x space-y gap gap-x gap-y '
+                'w min-w max-w h min-h max-h size inset inset-x inset-y top right bottom left start end '
+                'z order opacity leading tracking cursor duration ease delay animate justify justify-items '
+                'justify-self items self place-content place-items place-self grid-cols grid-rows col-span '
+                'col-start col-end row-span row-start row-end basis overflow overflow-x overflow-y '
+                'overscroll overscroll-x overscroll-y whitespace line-clamp aspect translate-x translate-y '
+                'scale scale-x scale-y rotate skew-x skew-y origin brightness backdrop-brightness fill '
+                'underline-offset indent align columns accent caret will-change '
+                'scroll-m scroll-p grayscale').split():
+    _PREFIX_GROUPS.setdefault(_prefix, [(_any, _prefix)])
+
+for _side in _SIDES:
+    _PREFIX_GROUPS[f'border-{_side}'] = [(_number, f'border-w-{_side}'), (_color, f'border-color-{_side}')]
+    _BARE_GROUPS[f'border-{_side}'] = f'border-w-{_side}'
+for _corner in _CORNERS:
+    _PREFIX_GROUPS[f'rounded-{_corner}'] = [(_tshirt, f'rounded-{_corner}')]
+    _BARE_GROUPS[f'rounded-{_corner}'] = f'rounded-{_corner}'
+
+# 색과 다른 종류(길이, 위치 ...)를 모두 받는 접두사 - 표시 없는 var()/calc() 값은 그룹을 정하지 않음
+_TYPED_PREFIXES = frozenset(
+    prefix for prefix, candidates in _PREFIX_GROUPS.items()
+    if len(candidates) > 1 and any(accepts is _color for accepts, _ in candidates)
+)
+
+_EXACT = {name: group for group, names in _EXACT_GROUPS.items() for name in names.split()}
+_EXACT.update(_BARE_GROUPS)
+
+
+def _sides(prefix, sides):
+    return tuple(f'{prefix}{side}' for side in sides)
+
+
+# 뒤에 온 그룹이 앞의 어떤 그룹을 덮어쓰는지
+CONFLICTS = {
+    'p': _sides('p', 'xytrblse'), 'px': _sides('p', 'rlse'), 'py': _sides('p', 'tb'),
+    'm': _sides('m', 'xytrblse'), 'mx': _sides('m', 'rlse'), 'my': _sides('m', 'tb'),
+    'gap': ('gap-x', 'gap-y'),
+    'size': ('w', 'h'),
+    'inset': ('inset-x', 'inset-y', 'top', 'right', 'bottom', 'left', 'start', 'end'),
+    'inset-x': ('right', 'left'), 'inset-y': ('top', 'bottom'),
+    'overflow': ('overflow-x', 'overflow-y'),
+    'overscroll': ('overscroll-x', 'overscroll-y'),
+    'scale': ('scale-x', 'scale-y'),
+    'rounded': _sides('rounded-', _CORNERS),
+    'rounded-t': ('rounded-tl', 'rounded-tr'), 'rounded-r': ('rounded-tr', 'rounded-br'),
+    'rounded-b': ('rounded-br', 'rounded-bl'), 'rounded-l': ('rounded-tl', 'rounded-bl'),
+    'rounded-s': ('rounded-ss', 'rounded-es'), 'rounded-e': ('rounded-se', 'rounded-ee'),
+    'border-w': _sides('border-w-', _SIDES),
+    'border-w-x': ('border-w-r', 'border-w-l'), 'border-w-y': ('border-w-t', 'border-w-b'),
+    'border-color': _sides('border-color-', _SIDES),
+    'border-color-x': ('border-color-r', 'border-color-l'), 'border-color-y': ('border-color-t', 'border-color-b'),
+    'touch': ('touch-x', 'touch-y', 'touch-pz'),
+    'touch-x': ('touch',), 'touch-y': ('touch',), 'touch-pz': ('touch',),
+}
+
+
+@lru_cache(maxsize=None)
+def utility_group(utility):
+    """'rounded-lg' -> 'rounded', 'text-gray-500' -> 'text-color' (모르는 클래스는 None)"""
+    if utility in _EXACT:
+        return _EXACT[utility]
+    # '-' 위치마다 접두사/값으로 나눠 가장 긴 접두사부터 (임의값 [...] 안의 '-'는 제외)
+    head = utility.split('[', 1)[0]
+    cut = head.rfind('-')
+    while cut > 0:
+        candidates = _PREFIX_GROUPS.get(utility[:cut])
+        if candidates:
+            value = utility[cut + 1:]
+            if utility[:cut] in _TYPED_PREFIXES and _UNTYPED_RE.match(value):
+                return None
+            for accepts, group in candidates:
+                if accepts(value):
+                    return group
+        cut = head.rfind('-', 0, cut)
+    return None
+
+
+def _split_modifiers(token):
+    """'md:[&>*]:hover:p-2' -> (['md', '[&>*]', 'hover'], 'p-2') - 대괄호 안의 ':'는 구분자가 아님"""
+    modifiers = []
+    depth = 0
+    last = 0
+    for i, ch in enumerate(token):
+        if ch == '[':
+            depth += 1
+        elif ch == ']':
+            depth -= 1
+        elif ch == ':' and depth == 0:
+            modifiers.append(token[last:i])
+            last = i + 1
+    return modifiers, token[last:]
+
+
+@lru_cache(maxsize=None)
+def conflict_key(token):
+    """토큰의 충돌 키 (정렬한 변형, important, 그룹) - 모르는 클래스는 토큰 자체가 그룹"""
+    modifiers, utility = _split_modifiers(token)
+    important = utility.startswith('!') or utility.endswith('!')
+    utility = utility.strip('!')
+    group = utility_group(utility[1:] if utility.startswith('-') else utility)
+    if group is None:
+        group = '=' + utility
+
+    if modifiers and not any(modifier.startswith('[') for modifier in modifiers):
+        modifiers.sort()
+    return ':'.join(modifiers), important, group
+
+
+@lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
+def _normalize(text, partial):
+    matches = list(_TOKEN_RE.finditer(text))
+    if len(matches) < 2:
+        return text, 0
+
+    # 템플릿 조각의 양끝 토큰은 ${}와 이어진 클래스의 일부일 수 있으므로 판단하지 않음
+    opaque = set()
+    if partial:
+        if matches[0].start() == 0:
+            opaque.add(0)
+        if matches[-1].end() == len(text):
+            opaque.add(len(matches) - 1)
+
+    # 뒤에서부터: 이미 나온 키(또는 뒤에 온 넓은 그룹이 덮은 키)면 제거
+    seen = set()
+    dropped = set()
+    for index in range(len(matches) - 1, -1, -1):
+        if index in opaque:
+            continue
+        modifiers, important, group = conflict_key(matches[index].group())
+        if (modifiers, important, group) in seen:
+            dropped.add(index)
+            continue
+        seen.add((modifiers, important, group))
+        for covered in CONFLICTS.get(group, ()):
+            seen.add((modifiers, important, covered))
+    if not dropped:
+        return text, 0
+
+    parts = []
+    last = 0
+    leading = None
+    kept = False
+    for index, m in enumerate(matches):
+        sep = text[last:m.start()]
+        last = m.end()
+        if index in dropped:
+            # 맨 앞 토큰을 지우면 그 앞 공백은 다음에 남는 토큰 앞으로
+            if not kept and leading is None:
+                leading = sep
+            continue
+        if not kept and leading is not None:
+            sep = leading
+        parts.append(sep)
+        parts.append(m.group())
+        kept = True
+    parts.append(text[last:])
+    return ''.join(parts), len(dropped)
+
+
+def normalize_classes(text, kind='literal'):
+    """className 스팬 텍스트의 충돌/중복 토큰을 제거해 반환 (제거 수는 'class-conflicts'로 통계 기록)
+
+    kind: 스팬 종류 ('template'이면 양끝 토큰은 그대로 둠)
+    """
+    text, removed = _normalize(text, kind == 'template')
+    stats.count('class-conflicts', removed)
+    return text
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+className 정규화 점검
+normalize_classes가 충돌하는 클래스만 지우고, 같이 쓸 수 있는 클래스는 남기는지 확인합니다.
+(tailwind-merge와 같은 결과여야 하는 사례 목록)
+
+    cd scripts && python3 -m codemods.normcheck
+"""
+
+import argparse
+import sys
+
+from codemods.normalize import normalize_classes
+
+# (입력, 기대 결과, 스팬 종류)
+CASES = [
+    # 충돌: 뒤에 온 것만 남김
+    ('rounded-lg px-4 rounded-full', 'px-4 rounded-full', 'literal'),
+    ('px-2 pt-1 p-4', 'p-4', 'literal'),
+    ('rounded-t-xl rounded-lg', 'rounded-lg', 'literal'),
+    ('dark:hover:bg-gray-800 hover:dark:bg-gray-700', 'hover:dark:bg-gray-700', 'literal'),
+    ('text-sm text-gray-500 text-lg', 'text-gray-500 text-lg', 'literal'),
+    ('border-2 border-gray-200 border-4', 'border-gray-200 border-4', 'literal'),
+    ('snap-x snap-y', 'snap-y', 'literal'),
+    ('decoration-2 decoration-4', 'decoration-4', 'literal'),
+    ('decoration-dotted decoration-wavy', 'decoration-wavy', 'literal'),
+    ('touch-auto touch-pan-x', 'touch-pan-x', 'literal'),
+    ('touch-pan-x touch-pinch-zoom touch-none', 'touch-none', 'literal'),
+    ('btn-primary btn-primary', 'btn-primary', 'literal'),
+    ('border-[2px] border-4', 'border-4', 'literal'),
+    ('border-[length:var(--w)] border-2', 'border-2', 'literal'),
+    ('border-[color:var(--c)] border-gray-200', 'border-gray-200', 'literal'),
+    ('placeholder-gray-400 placeholder-gray-500', 'placeholder-gray-500', 'literal'),
+    ('placeholder-opacity-50 placeholder-opacity-75', 'placeholder-opacity-75', 'literal'),
+    # 다른 속성: 모두 남김
+    ('snap-x snap-mandatory snap-center snap-always', 'snap-x snap-mandatory snap-center snap-always', 'literal'),
+    ('decoration-2 decoration-blue-500 decoration-wavy', 'decoration-2 decoration-blue-500 decoration-wavy',
+     'literal'),
+    ('decoration-[3px] decoration-[#eee]', 'decoration-[3px] decoration-[#eee]', 'literal'),
+    ('touch-pan-x touch-pan-y touch-pinch-zoom', 'touch-pan-x touch-pan-y touch-pinch-zoom', 'literal'),
+    ('text-sm font-bold text-gray-500', 'text-sm font-bold text-gray-500', 'literal'),
+    ('border-2 border-gray-200 border-dashed', 'border-2 border-gray-200 border-dashed', 'literal'),
+    ('md:p-2 p-4', 'md:p-2 p-4', 'literal'),
+    ('btn-primary btn-secondary', 'btn-primary btn-secondary', 'literal'),
+    ('placeholder-gray-400 placeholder-opacity-50', 'placeholder-gray-400 placeholder-opacity-50', 'literal'),
+    ('border-[color:var(--c)] border-2', 'border-[color:var(--c)] border-2', 'literal'),
+    # 표시 없는 var()/calc()는 길이인지 색인지 모름: 지우지 않음
+    ('border-2 border-[var(--c)]', 'border-2 border-[var(--c)]', 'literal'),
+    ('border-gray-200 border-[var(--c)]', 'border-gray-200 border-[var(--c)]', 'literal'),
+    ('border-2 border-[calc(var(--w)*2)]', 'border-2 border-[calc(var(--w)*2)]', 'literal'),
+    ('ring-2 ring-[var(--c)]', 'ring-2 ring-[var(--c)]', 'literal'),
+    ('from-10% from-[var(--c)]', 'from-10% from-[var(--c)]', 'literal'),
+    # 템플릿 조각의 양끝 토큰은 ${}와 이어질 수 있으므로 그대로
+    ('p-2 rounded-lg p-4', 'p-2 rounded-lg p-4', 'template'),
+]
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='className 정규화 점검')
+    parser.add_argument('-v', '--verbose', action='store_true', help='통과한 사례도 출력')
+    args = parser.parse_args()
+
+    failed = 0
+    for text, expected, kind in CASES:
+        result = normalize_classes(text, kind)
+        if result != expected:
+            failed += 1
+            print(f"❌ {text!r} -> {result!r} (기대: {expected!r})")
+        elif args.verbose:
+            print(f"✅ {text!r} -> {result!r}")
+
+    if failed:
+        print(f"\n❌ {len(CASES)}개 중 {failed}개 사례 실패")
+        return 1
+    print(f"✨ {len(CASES)}개 사례 모두 통과")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+dry-run과 패치 출력 (--dry-run / --diff)
+변환이 apply_edits로 적용한 (offset, old, new) 편집을 그대로 기록해
+파일 전체를 다시 diff하지 않고 unified patch나 JSON 편집 목록을 만듭니다.
+
+- 워커: read_source가 원본을, apply_edits가 편집을 기록하고,
+  write_source는 파일을 쓰는 대신 편집을 hunk로 만들어 FileResult.patch로 돌려줌
+- 부모: Preview가 입력 순서대로 모아 파일 하나로 출력
+- 패치는 프로젝트 루트 기준 a/ b/ 경로이므로 루트에서 git apply로 그대로 적용 가능
+"""
+
+import json
+from bisect import bisect_right
+from pathlib import Path
+
+# unified diff 문맥 줄 수
+CONTEXT_LINES = 3
+
+# 현재 파일의 기록 (캡처 중이 아니면 None)
+# {'sources': {경로: 원본}, 'batches': [(편집 전 내용, 편집 목록)], 'patches': [...]}
+_capture = None
+
+
+def add_dry_run_arguments(parser):
+    """--dry-run / --diff / --diff-format 옵션 추가"""
+    parser.add_argument('--dry-run', action='store_true',
+                        help='파일을 쓰지 않고 바뀔 파일만 보고')
+    parser.add_argument('--diff', type=Path, metavar='FILE',
+                        help='바뀔 내용을 패치로 저장 (--dry-run 포함, git apply로 적용 가능)')
+    parser.add_argument('--diff-format', choices=('patch', 'json'), default='patch',
+                        help='--diff 출력 형식: unified patch 또는 JSON 편집 목록 (기본: patch)')
+
+
+def open_preview(args, root):
+    """--dry-run이나 --diff면 Preview, 아니면 None"""
+    if not (args.dry_run or args.diff):
+        return None
+    return Preview(root, args.diff, args.diff_format)
+
+
+def begin_capture():
+    global _capture
+    _capture = {'sources': {}, 'batches': [], 'patches': []}
+
+
+def end_capture():
+    """캡처를 끝내고 [(경로, 편집 목록, hunk 텍스트)] 반환"""
+    global _capture
+    captured, _capture = _capture, None
+    return captured['patches'] if captured else []
+
+
+def capturing():
+    return _capture is not None
+
+
+def remember_source(filepath, content):
+    """read_source가 읽은 원본 기록"""
+    if _capture is not None:
+        _capture['sources'][str(filepath)] = content
+
+
+def record_edits(content, edits, new_content):
+    """apply_edits에 들어온 편집 기록 (content: 편집 전 내용, new_content: 편집 결과)"""
+    if _capture is not None:
+        _capture['batches'].append((content, edits, new_content))
+
+
+def capture_write(filepath, new_content):
+    """파일을 쓰는 대신 원본 대비 편집과 hunk를 기록"""
+    original = _capture['sources'].get(str(filepath))
+    if original is None:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            original = f.read()
+
+    batches = _capture['batches']
+    if batches and _chained(original, batches, new_content):
+        # 여러 패스(고정점 반복)로 적용된 경우 편집 목록을 원본 좌표로 합성
+        edits = batches[0][1]
+        for content, later, _ in batches[1:]:
+            edits = compose_edits(edits, content, later)
+        edits = [(start, end, new) for start, end, new in edits if original[start:end] != new]
+    else:
+        # 편집 기록과 이어지지 않는 쓰기: 처음과 끝의 바뀐 위치로 편집 하나를 만듦
+        edits = _single_edit(original, new_content)
+    _capture['batches'] = []
+
+    if edits:
+        lines = LineIndex(original)
+        _capture['patches'].append((
+            str(filepath),
+            [edit_json(original, lines, start, end, new) for start, end, new in edits],
+            unified_hunks(original, lines, edits),
+        ))
+
+
+def _chained(original, batches, new_content):
+    """batches가 original에서 시작해 차례로 이어져 new_content로 끝나는지"""
+    previous = original
+    for content, _, result in batches:
+        if content is not previous:
+            return False
+        previous = result
+    return previous == new_content
+
+
+def compose_edits(first, middle, second):
+    """first(원본 -> middle)와 second(middle -> 결과)를 원본 좌표의 편집 목록 하나로 합성
+
+    두 목록 모두 정렬되어 있고 각각 겹치지 않아야 합니다. 서로 닿거나 겹치는 편집은 하나로 합칩니다.
+    """
+    # middle 좌표 구간: (시작, 끝, 길이 변화, second 편집) - first 편집은 새 텍스트가 차지하는 구간
+    items = []
+    shift = 0
+    for start, end, new_text in first:
+        items.append((start + shift, start + shift + len(new_text), len(new_text) - (end - start), None))
+        shift += len(new_text) - (end - start)
+    items.extend((start, end, 0, (start, end, new_text)) for start, end, new_text in second)
+    items.sort(key=lambda item: item[:2])
+
+    composed = []
+    shift = 0           # 앞에서 지나간 first 편집의 길이 변화 합
+    i = 0
+    while i < len(items):
+        group_start, group_end, delta, edit = items[i]
+        group = [edit]
+        i += 1
+        while i < len(items) and items[i][0] <= group_end:
+            group_end = max(group_end, items[i][1])
+            delta += items[i][2]
+            group.append(items[i][3])
+            i += 1
+
+        parts = []
+        last = group_start
+        for edit in group:
+            if edit is not None:
+                parts.append(middle[last:edit[0]])
+                parts.append(edit[2])
+                last = edit[1]
+        parts.append(middle[last:group_end])
+        # 묶음 앞은 그 전까지의 변화만큼, 끝은 묶음 안의 변화까지 빼면 원본 좌표
+        composed.append((group_start - shift, group_end - shift - delta, ''.join(parts)))
+        shift += delta
+    return composed
+
+
+def _single_edit(original, new_content):
+    """공통 접두사/접미사를 뺀 편집 하나 (바뀐 것이 없으면 빈 목록)"""
+    if original == new_content:
+        return []
+    limit = min(len(original), len(new_content))
+    prefix = 0
+    while prefix < limit and original[prefix] == new_content[prefix]:
+        prefix += 1
+    suffix = 0
+    while (suffix < limit - prefix
+           and original[len(original) - 1 - suffix] == new_content[len(new_content) - 1 - suffix]):
+        suffix += 1
+    return [(prefix, len(original) - suffix, new_content[prefix:len(new_content) - suffix])]
+
+
+class LineIndex:
+    """줄 시작 위치 배열 (offset -> 줄 번호는 bisect)"""
+
+    def __init__(self, content):
+        starts = [0]
+        pos = content.find('\n')
+        while pos >= 0:
+            starts.append(pos + 1)
+            pos = content.find('\n', pos + 1)
+        self.starts = starts
+        self.size = len(content)
+
+    def line_of(self, offset):
+        """0부터 시작하는 줄 번호"""
+        return bisect_right(self.starts, offset) - 1
+
+    def start(self, line):
+        return self.starts[line] if line < len(self.starts) else self.size
+
+    @property
+    def count(self):
+        # 마지막 줄바꿈 뒤가 비어 있으면 줄로 세지 않음
+        return len(self.starts) - (1 if self.starts[-1] == self.size else 0)
+
+
+def edit_json(content, lines, start, end, new):
+    line = lines.line_of(start)
+    return {
+        'offset': start,
+        'length': end - start,
+        'line': line + 1,
+        'column': start - lines.start(line) + 1,
+        'old': content[start:end],
+        'new': new,
+    }
+
+
+def split_lines(text):
+    r"""'\n'에서만 나눈 줄 목록 (줄바꿈 포함, LineIndex와 같은 기준)
+
+    str.splitlines는 \x0c, \x1c-\x1e, \x85, U+2028, U+2029에서도 나누므로 git과 줄 수가 달라집니다.
+    """
+    lines = text.split('\n')
+    out = [line + '\n' for line in lines[:-1]]
+    if lines[-1]:
+        out.append(lines[-1])
+    return out
+
+
+def _diff_lines(prefix, text):
+    """text의 각 줄에 prefix를 붙임 (마지막 줄에 줄바꿈이 없으면 git 표식 추가)"""
+    out = []
+    for line in split_lines(text):
+        out.append(prefix + line)
+        if not line.endswith('\n'):
+            out.append('\n\\ No newline at end of file\n')
+    return ''.join(out)
+
+
+def _blocks(lines, edits):
+    """편집을 줄 단위 블록으로 묶음: [(첫 줄, 끝 줄(미포함), [편집...])]"""
+    blocks = []
+    for start, end, new in edits:
+        first = lines.line_of(start)
+        last = lines.line_of(end - 1) + 1 if end > start else first + 1
+        # 마지막 줄바꿈 뒤(파일 끝)에 삽입하면 바꿀 원본 줄이 없음
+        last = max(first, min(last, lines.count))
+        if blocks and first < blocks[-1][1]:
+            blocks[-1][1] = max(blocks[-1][1], last)
+            blocks[-1][2].append((start, end, new))
+        else:
+            blocks.append([first, last, [(start, end, new)]])
+    return blocks
+
+
+def unified_hunks(content, lines, edits):
+    """정렬된 편집 목록으로 unified diff hunk 텍스트 생성 (헤더 제외)"""
+    blocks = _blocks(lines, edits)
+    total = lines.count
+
+    # 문맥이 겹치는 블록은 hunk 하나로
+    hunks = []
+    for block in blocks:
+        if hunks and block[0] - hunks[-1][-1][1] <= 2 * CONTEXT_LINES:
+            hunks[-1].append(block)
+        else:
+            hunks.append([block])
+
+    out = []
+    delta = 0
+    for hunk in hunks:
+        first = max(0, hunk[0][0] - CONTEXT_LINES)
+        last = min(total, hunk[-1][1] + CONTEXT_LINES)
+        body = []
+        old_count = new_count = 0
+        pos = first
+        for block_first, block_last, block_edits in hunk:
+            context = content[lines.start(pos):lines.start(block_first)]
+            body.append(_diff_lines(' ', context))
+            old_count += block_first - pos
+            new_count += block_first - pos
+
+            block_start, block_end = lines.start(block_first), lines.start(block_last)
+            old_text = content[block_start:block_end]
+            parts = []
+            cursor = block_start
+            for start, end, new in block_edits:
+                parts.append(content[cursor:start])
+                parts.append(new)
+                cursor = end
+            parts.append(content[cursor:block_end])
+            new_text = ''.join(parts)
+
+            body.append(_diff_lines('-', old_text))
+            body.append(_diff_lines('+', new_text))
+            old_count += len(split_lines(old_text))
+            new_count += len(split_lines(new_text))
+            pos = block_last
+
+        context = content[lines.start(pos):lines.start(last)]
+        body.append(_diff_lines(' ', context))
+        old_count += last - pos
+        new_count += last - pos
+
+        old_start = first + 1 if old_count else first
+        new_start = first + 1 + delta if new_count else first + delta
+        out.append(f'@@ -{old_start},{old_count} +{new_start},{new_count} @@\n')
+        out.extend(body)
+        delta += new_count - old_count
+    return ''.join(out)
+
+
+class Preview:
+    """dry-run 결과 (부모 프로세스). 파일 순서는 입력 순서 그대로"""
+
+    def __init__(self, root, diff_path=None, diff_format='patch'):
+        self.root = Path(root)
+        self.diff_path = diff_path
+        self.diff_format = diff_format
+        self.files = []     # [(상대 경로, 편집 목록, hunk 텍스트)]
+
+    def _rel(self, path):
+        try:
+            return Path(path).resolve().relative_to(self.root.resolve()).as_posix()
+        except ValueError:
+            return Path(path).as_posix()
+
+    def add(self, result):
+        for path, edits, hunks in result.patch or ():
+            self.files.append((self._rel(path), edits, hunks))
+
+    def render(self):
+        if self.diff_format == 'json':
+            files = [{'path': path, 'edits': edits} for path, edits, _ in self.files]
+            return json.dumps(files, indent=2, ensure_ascii=False) + '\n'
+        return ''.join(
+            f'diff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}\n{hunks}'
+            for path, _, hunks in self.files
+        )
+
+    def finish(self):
+        """패치 저장과 요약 출력"""
+        edit_count = sum(len(edits) for _, edits, _ in self.files)
+        print(f"🔍 dry-run: {len(self.files)}개 파일, {edit_count}개 편집 (파일은 수정하지 않음)")
+        if self.diff_path is not None:
+            with open(self.diff_path, 'w', encoding='utf-8', newline='') as f:
+                f.write(self.render())
+            if self.diff_format == 'patch':
+                print(f"📝 패치 저장: {self.diff_path} (적용: git apply {self.diff_path})")
+            else:
+                print(f"📝 편집 목록 저장: {self.diff_path}")
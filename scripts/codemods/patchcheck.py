@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+dry-run 패치 점검
+--diff와 같은 경로(read_source -> apply_edits -> write_source 캡처)로 패치를 만들고
+임시 git 저장소에서 git apply --check와 실제 적용 결과를 확인합니다.
+str.splitlines가 줄로 나누는 문자(U+2028, \\x0c, \\x85 ...)가 든 파일도 git과 같은 줄 수여야 합니다.
+
+    cd scripts && python3 -m codemods.patchcheck
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from codemods import patch
+from codemods.edits import apply_edits
+from codemods.fileio import read_source, write_source
+
+# (이름, 원본, 바꿀 문자열, 새 문자열)
+CASES = [
+    ('U+2028 in JSX string',
+     'const a = "첫 줄\u2028둘째 줄";\n'
+     'export const B = () => <button className="px-4 rounded-lg">go</button>;\n'
+     'const c = 1;\n',
+     'rounded-lg', 'rounded-full'),
+    ('U+2028 on the edited line',
+     'const x = 0;\n<div title="a\u2028b" className="rounded-2xl" />\nconst y = 1;\n',
+     'rounded-2xl', 'rounded-lg'),
+    ('form feed, \\x1c, \\x85, U+2029',
+     '// a\x0cb\nconst s = "\x1c\x85\u2029";\n<div className="p-2 rounded-2xl" />\n// end\n',
+     'rounded-2xl', 'rounded-lg'),
+    ('no newline at end of file',
+     'const s = "\u2028";\n<div className="rounded-2xl" />',
+     'rounded-2xl', 'rounded-lg'),
+    ('CRLF',
+     'const s = "\u2028";\r\n<div className="rounded-2xl" />\r\nconst t = 2;\r\n',
+     'rounded-2xl', 'rounded-lg'),
+]
+
+
+def _git(cwd, *args, stdin=None):
+    return subprocess.run(['git', *args], cwd=cwd, input=stdin, capture_output=True)
+
+
+def check_case(workdir, name, original, old, new):
+    """케이스 하나 점검 - 실패 메시지 (통과면 None)"""
+    path = workdir / 'File.tsx'
+    path.write_bytes(original.encode('utf-8'))
+    _git(workdir, 'add', '-A')
+    _git(workdir, '-c', 'user.email=check@example.com', '-c', 'user.name=check', 'commit', '-qm', name)
+
+    patch.begin_capture()
+    try:
+        content = read_source(path)
+        start = content.index(old)
+        expected = apply_edits(content, [(start, start + len(old), new)])
+        write_source(path, expected)
+    finally:
+        captured = patch.end_capture()
+
+    preview = patch.Preview(workdir)
+    for filepath, edits, hunks in captured:
+        preview.files.append((preview._rel(filepath), edits, hunks))
+    diff = preview.render().encode('utf-8')
+
+    result = _git(workdir, 'apply', '--check', '-', stdin=diff)
+    if result.returncode != 0:
+        return f"git apply --check 실패: {result.stderr.decode('utf-8', 'replace').strip()}"
+    _git(workdir, 'apply', '-', stdin=diff)
+    applied = path.read_bytes().decode('utf-8')
+    if applied != expected:
+        return f"적용 결과가 다름: {applied!r} (기대: {expected!r})"
+    return None
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='dry-run 패치 점검 (git apply)')
+    parser.parse_args()
+
+    failed = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        _git(workdir, 'init', '-q')
+        _git(workdir, 'config', 'core.autocrlf', 'false')
+        for name, original, old, new in CASES:
+            problem = check_case(workdir, name, original, old, new)
+            if problem:
+                failed += 1
+                print(f"❌ {name}: {problem}")
+            else:
+                print(f"✅ {name}")
+
+    if failed:
+        print(f"\n❌ {len(CASES)}개 중 {failed}개 사례 실패")
+        return 1
+    print(f"✨ {len(CASES)}개 사례 모두 git apply로 적용됩니다")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
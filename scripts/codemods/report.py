@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+감사 결과 스트리밍 출력 (--format ndjson / sarif)
+파일 하나의 결과가 나오는 즉시 써서, 트리 전체를 모으지 않고도 (메모리 일정) CI나
+코드 스캐닝 도구가 읽을 수 있게 합니다. 결과 순서는 runner가 지키는 입력 순서 그대로입니다.
+
+- ndjson: 위반 하나당 한 줄 {"path", "line", "column", "rule", "message", ...}
+          검사 실패는 {"path", "error"}
+- sarif: SARIF 2.1.0 문서 하나 - results 배열을 열어 두고 결과마다 이어 쓴 뒤 마지막에 닫음
+         artifactLocation.uri는 퍼센트 인코딩한 상대 URI ([id] 같은 라우트 폴더도 올바른 URI로)
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import NamedTuple, Optional
+from urllib.parse import quote
+
+FORMATS = ('text', 'ndjson', 'sarif')
+
+SARIF_SCHEMA = 'https://json.schemastore.org/sarif-2.1.0.json'
+
+
+class Finding(NamedTuple):
+    """감사 결과 하나 (줄과 열은 1부터)"""
+    rule: str
+    line: int
+    column: int
+    message: str
+    properties: Optional[dict] = None   # 형식별 추가 필드 (ndjson은 같은 줄에, SARIF는 properties)
+
+
+def add_format_arguments(parser):
+    """--format / --output 옵션 추가"""
+    parser.add_argument('--format', choices=FORMATS, default='text',
+                        help='결과 형식: 사람이 읽는 text, 위반당 한 줄 JSON(ndjson), SARIF 2.1.0 (기본: text)')
+    parser.add_argument('--output', type=Path, metavar='FILE',
+                        help='ndjson/sarif 결과를 쓸 파일 (기본: stdout, 진행 메시지는 stderr)')
+
+
+def open_report(args, root, tool, rules):
+    """--format이 ndjson/sarif면 스트리밍 Report, text면 None
+
+    root: 결과 경로의 기준 (SARIF %SRCROOT%)
+    rules: {rule id: 설명} (SARIF tool.driver.rules)
+    """
+    if args.format == 'text':
+        return None
+    stream = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    if args.format == 'ndjson':
+        return NdjsonReport(stream, tool, rules)
+    return SarifReport(stream, tool, rules, root)
+
+
+class Report:
+    """파일 단위로 결과를 받아 바로 쓰는 출력기"""
+
+    def __init__(self, stream, tool, rules):
+        self.stream = stream
+        self.tool = tool
+        self.rules = dict(rules)
+        self.findings = 0
+        self.errors = 0
+
+    def add(self, path, findings):
+        """path(프로젝트 기준 상대 경로)의 Finding 목록을 씀"""
+        for finding in findings:
+            self._write_finding(Path(path).as_posix(), Finding(*finding))
+            self.findings += 1
+        self.stream.flush()
+
+    def error(self, path, message):
+        self._write_error(Path(path).as_posix(), message)
+        self.errors += 1
+        self.stream.flush()
+
+    def close(self):
+        self._finish()
+        self.stream.flush()
+        if self.stream is not sys.stdout:
+            self.stream.close()
+
+    def _write_finding(self, path, finding):
+        raise NotImplementedError
+
+    def _write_error(self, path, message):
+        raise NotImplementedError
+
+    def _finish(self):
+        pass
+
+
+class NdjsonReport(Report):
+    """위반 하나당 JSON 한 줄"""
+
+    def _write_finding(self, path, finding):
+        record = {'path': path, 'rule': finding.rule, 'line': finding.line, 'column': finding.column,
+                  'message': finding.message, **(finding.properties or {})}
+        self.stream.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    def _write_error(self, path, message):
+        self.stream.write(json.dumps({'path': path, 'error': message}, ensure_ascii=False) + '\n')
+
+
+class SarifReport(Report):
+    """SARIF 2.1.0 - results를 하나씩 이어 쓰고 invocations로 닫음"""
+
+    def __init__(self, stream, tool, rules, root):
+        super().__init__(stream, tool, rules)
+        self.notifications = []
+        self.rule_index = {rule_id: i for i, rule_id in enumerate(self.rules)}
+        driver = {
+            'name': tool,
+            'rules': [{'id': rule_id, 'shortDescription': {'text': text or rule_id}}
+                      for rule_id, text in self.rules.items()],
+        }
+        run = {
+            'tool': {'driver': driver},
+            'originalUriBaseIds': {'%SRCROOT%': {'uri': Path(root).resolve().as_uri() + '/'}},
+            'columnKind': 'unicodeCodePoints',
+            'results': [],
+        }
+        head = json.dumps({'version': '2.1.0', '$schema': SARIF_SCHEMA, 'runs': [run]}, ensure_ascii=False)
+        # '..., "results": []}]}'에서 results 배열을 열어 둔 채로 씀
+        self.stream.write(head[:-len(']}]}')])
+        self._first = True
+
+    def _write_finding(self, path, finding):
+        result = {
+            'ruleId': finding.rule,
+            'level': 'warning',
+            'message': {'text': finding.message},
+            'locations': [{'physicalLocation': {
+                'artifactLocation': {'uri': quote(path), 'uriBaseId': '%SRCROOT%'},
+                'region': {'startLine': finding.line, 'startColumn': finding.column},
+            }}],
+        }
+        if finding.rule in self.rule_index:
+            result['ruleIndex'] = self.rule_index[finding.rule]
+        if finding.properties:
+            result['properties'] = finding.properties
+        self.stream.write(('\n' if self._first else ',\n') + json.dumps(result, ensure_ascii=False))
+        self._first = False
+
+    def _write_error(self, path, message):
+        # 검사 실패는 실행이 끝날 때 invocations에 모아 씀 (실패 파일 수만큼만 보관)
+        self.notifications.append({
+            'level': 'error',
+            'message': {'text': message},
+            'locations': [{'physicalLocation': {'artifactLocation': {'uri': quote(path), 'uriBaseId': '%SRCROOT%'}}}],
+        })
+
+    def _finish(self):
+        invocation = {'executionSuccessful': not self.notifications}
+        if self.notifications:
+            invocation['toolExecutionNotifications'] = self.notifications
+        self.stream.write('\n], "invocations": ' + json.dumps([invocation], ensure_ascii=False) + '}]}\n')
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+SARIF 출력 점검
+SarifReport가 쓴 문서가 JSON으로 읽히고, artifactLocation.uri가 올바른 상대 URI여서
+%SRCROOT%에 이어 붙여 풀면 원래 경로가 되는지 확인합니다 (Next.js의 [id] 라우트 폴더 등).
+
+    cd scripts && python3 -m codemods.reportcheck
+"""
+
+import argparse
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+from urllib.parse import unquote, urljoin, urlsplit
+
+from codemods.report import Finding, SarifReport
+
+# (프로젝트 기준 경로, 기대하는 uri)
+CASES = [
+    ('src/app/courses/rounds/[id]/page.tsx', 'src/app/courses/rounds/%5Bid%5D/page.tsx'),
+    ('src/app/[...slug]/page.tsx', 'src/app/%5B...slug%5D/page.tsx'),
+    ('src/app/(admin)/users/page.tsx', 'src/app/%28admin%29/users/page.tsx'),
+    ('src/components/My Button.tsx', 'src/components/My%20Button.tsx'),
+    ('src/components/100%.tsx', 'src/components/100%25.tsx'),
+    ('src/components/#hash?.tsx', 'src/components/%23hash%3F.tsx'),
+    ('src/components/버튼.tsx', 'src/components/%EB%B2%84%ED%8A%BC.tsx'),
+    ('src/components/Card.tsx', 'src/components/Card.tsx'),
+]
+
+# RFC 3986에서 상대 URI 경로에 그대로 쓸 수 있는 문자
+_URI_CHARS = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-._~/%')
+
+
+def _render(root):
+    """CASES마다 위반 하나와 검사 실패 하나를 쓴 SARIF 문서"""
+    stream = io.StringIO()
+    report = SarifReport(stream, 'reportcheck', {'rule': ''}, root)
+    for path, _ in CASES:
+        report.add(path, [Finding('rule', 1, 1, 'message')])
+        report.error(path, 'error')
+    report._finish()
+    return json.loads(stream.getvalue())
+
+
+def check_case(base, path, expected, uri):
+    """사례 하나 점검 - 실패 메시지 (통과면 None)"""
+    if uri != expected:
+        return f"uri {uri!r} (기대: {expected!r})"
+    if not set(uri) <= _URI_CHARS:
+        return f"uri에 인코딩하지 않은 문자: {sorted(set(uri) - _URI_CHARS)}"
+    resolved = urlsplit(urljoin(base, uri))
+    if resolved.query or resolved.fragment:
+        return f"%SRCROOT%와 합치면 경로가 잘림: {resolved.geturl()!r}"
+    if unquote(resolved.path) != unquote(urlsplit(base).path) + path:
+        return f"%SRCROOT%와 합친 경로가 다름: {unquote(resolved.path)!r}"
+    return None
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='SARIF 출력 점검')
+    parser.add_argument('-v', '--verbose', action='store_true', help='통과한 사례도 출력')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        document = _render(Path(tmp))
+    run = document['runs'][0]
+    base = run['originalUriBaseIds']['%SRCROOT%']['uri']
+    results = [result['locations'][0] for result in run['results']]
+    errors = [note['locations'][0] for note in run['invocations'][0]['toolExecutionNotifications']]
+
+    failed = 0
+    for (path, expected), result, error in zip(CASES, results, errors):
+        problem = None
+        for location in (result, error):
+            uri = location['physicalLocation']['artifactLocation']['uri']
+            problem = problem or check_case(base, path, expected, uri)
+        if problem:
+            failed += 1
+            print(f"❌ {path}: {problem}")
+        elif args.verbose:
+            print(f"✅ {path} -> {expected}")
+
+    if failed:
+        print(f"\n❌ {len(CASES)}개 중 {failed}개 사례 실패")
+        return 1
+    print(f"✨ {len(CASES)}개 사례 모두 통과")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
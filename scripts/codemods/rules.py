@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+선언적 스타일 규칙
+rules.json에 정의된 규칙(어떤 요소의 어떤 클래스를 무엇으로 쓸지)을
+하나의 토큰 조회 테이블로 컴파일해, 파일당 한 번의 스캔으로 모든 규칙을 적용합니다.
+select 규칙이 있으면 요소 트리를 파일당 한 번 만들어 모든 규칙이 같이 씁니다.
+
+규칙 형식:
+    {
+      "id": "card-rounded-lg",
+      "enabled": true,
+      "tags": ["div", "section"],        # 생략하면 모든 요소 (cn() 단독 호출 포함)
+      "select": "section div, Card > div[data-slot]",   # 요소 선택자 (codemods.selectors, tags 대신)
+      "kinds": ["literal"],              # 생략하면 literal/template/expr/call 모두
+      "files": ["src/components/admin/*"],   # 프로젝트 루트 기준 경로가 이 glob과 맞는 파일에만 적용
+      "exclude_files": ["Button.tsx"],   # 파일 이름에 포함되면 제외
+      "replace": {"rounded-2xl": "rounded-lg"},          # 클래스 교체
+      "patterns": {"rounded-([23])xl": "rounded-lg"},    # utility 정규식(fullmatch) 교체, replace에 없을 때 (\\1 가능)
+      "add": {"bg-white": "dark:bg-gray-800"},           # 같은 속성의 dark: 형제가 없으면 추가 (변형 포함 토큰 단위)
+      "add_policy": "darkmode.json",     # 다크모드 정책(codemods.darkmode)의 토큰 표를 add로 (규칙 파일 기준 경로)
+      "ensure": {"class": "rounded-full", "unless": "rounded"}  # unless 계열이 없으면 추가
+    }
+"""
+
+import json
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
+from pathlib import Path
+
+from codemods import guard, stats
+from codemods.darkmode import resolve_add_policies
+from codemods.edits import apply_edits, split_variant
+from codemods.normalize import normalize_classes
+from codemods.selectors import ElementTree, match_path, parse_selector
+
+DEFAULT_RULES_PATH = Path(__file__).with_name('rules.json')
+
+KINDS = ('literal', 'template', 'expr', 'call')
+
+_TOKEN_RE = re.compile(r'\S+')
+
+
+def sibling_prefix(token):
+    """'dark:bg-gray-800' -> 'dark:bg-' (같은 속성의 형제 클래스 판별용)"""
+    variant, utility = split_variant(token)
+    return variant + utility.split('-', 1)[0] + '-'
+
+
+def load_rules(path=DEFAULT_RULES_PATH):
+    """규칙 파일(JSON) 읽기"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    rules = data['rules']
+    seen = set()
+    for rule in rules:
+        rule_id = rule.get('id')
+        if not rule_id or rule_id in seen:
+            raise ValueError(f"규칙 id가 없거나 중복됨: {rule_id!r}")
+        seen.add(rule_id)
+        if not any(key in rule for key in ('replace', 'patterns', 'add', 'add_policy', 'ensure')):
+            raise ValueError(f"규칙 {rule_id}: replace/patterns/add/add_policy/ensure 중 하나가 필요합니다")
+        for pattern in rule.get('patterns', {}):
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"규칙 {rule_id}: 정규식 {pattern!r} 오류 ({e})") from None
+        unknown = set(rule.get('kinds', KINDS)) - set(KINDS)
+        if unknown:
+            raise ValueError(f"규칙 {rule_id}: 알 수 없는 kind {sorted(unknown)}")
+        if 'select' in rule:
+            try:
+                parse_selector(rule['select'])
+            except ValueError as e:
+                raise ValueError(f"규칙 {rule_id}: {e}") from None
+        if 'add_policy' in rule:
+            try:
+                resolve_add_policies({'rules': [rule]}, path)
+            except (OSError, ValueError) as e:
+                raise ValueError(f"규칙 {rule_id}: add_policy {rule['add_policy']!r} 오류 ({e})") from None
+    return data
+
+
+class _Table:
+    """(파일, 태그, kind) 조합 하나에 적용되는 규칙을 합친 조회 테이블"""
+
+    def __init__(self, rules):
+        self.replace = {}    # utility -> (rule id, new utility)
+        self.patterns = []   # (rule id, 정규식, 교체 템플릿) - replace에 없는 utility에만
+        self.add = {}        # 토큰(변형 포함) -> (rule id, [추가할 클래스])
+        self.ensure = []     # (rule id, class, unless)
+
+        for rule in rules:
+            for old, new in rule.get('replace', {}).items():
+                # 먼저 정의된 규칙이 우선
+                self.replace.setdefault(old, (rule['id'], new))
+            for pattern, template in rule.get('patterns', {}).items():
+                self.patterns.append((rule['id'], re.compile(pattern), template))
+            for old, extra in rule.get('add', {}).items():
+                extra = extra.split() if isinstance(extra, str) else list(extra)
+                self.add.setdefault(old, (rule['id'], extra))
+            if 'ensure' in rule:
+                self.ensure.append((rule['id'], rule['ensure']['class'], rule['ensure'].get('unless')))
+
+    def __bool__(self):
+        return bool(self.replace or self.patterns or self.add or self.ensure)
+
+    def match_pattern(self, utility):
+        """patterns 중 처음 맞는 규칙의 (rule id, new utility) (정규식 시간은 그 규칙의 예산으로)"""
+        for rule_id, regex, template in self.patterns:
+            with guard.limit(rule_id):
+                m = regex.fullmatch(utility)
+            if m is not None:
+                new_utility = m.expand(template)
+                return (rule_id, new_utility) if new_utility != utility else None
+        return None
+
+
+class RuleSet:
+    """활성 규칙 전체를 컴파일한 결과"""
+
+    def __init__(self, data, only=None):
+        self.rules = [rule for rule in data['rules']
+                      if rule.get('enabled', True) and (only is None or rule['id'] in only)]
+        # 규칙별 허용 태그 (None이면 모두)와 요소 트리로 판정할 선택자
+        # 태그만 나열한 선택자('div, section')는 태그 집합으로 바꿔 트리 없이 판정
+        self.tag_sets = []
+        self.selectors = []
+        for rule in self.rules:
+            tags = frozenset(rule['tags']) if rule.get('tags') is not None else None
+            selector = parse_selector(rule['select']) if 'select' in rule else None
+            simple = selector.simple_tags() if selector is not None else None
+            if simple is not None:
+                tags = simple if tags is None else tags & simple
+                selector = None
+            self.tag_sets.append(tags)
+            self.selectors.append(selector)
+        # 요소 트리가 필요한지 (편집기의 여는 태그 단위 증분 분석은 이때 쓰지 않음)
+        self.selects = any(selector is not None for selector in self.selectors)
+        self._by_tag = {}
+        self._tables = {}
+
+    def _active(self, filepath):
+        """파일 경로 기준으로 제외되지 않은 규칙 인덱스
+
+        filepath: 프로젝트 루트 기준 상대 경로 (selectors.project_path) - files glob은 경로 전체와 비교
+        """
+        name = Path(filepath).name if filepath else ''
+        return tuple(
+            i for i, rule in enumerate(self.rules)
+            if not any(pattern in name for pattern in rule.get('exclude_files', ()))
+            and ('files' not in rule or filepath and match_path(filepath, rule['files']))
+        )
+
+    def _tag_allowed(self, i, tag):
+        tags = self.tag_sets[i]
+        return tags is None or tag in tags
+
+    def _tag_rules(self, active, tag):
+        """태그만으로 걸리는 규칙 인덱스 (select 규칙 제외, 파일 사이에서도 재사용)"""
+        key = (active, tag)
+        selected = self._by_tag.get(key)
+        if selected is None:
+            selected = self._by_tag[key] = tuple(
+                i for i in active
+                if self.selectors[i] is None and self._tag_allowed(i, tag)
+            )
+        return selected
+
+    def _span_tables(self, spans, active, content):
+        """스팬마다 (스팬, 적용할 테이블) - select 규칙은 파일당 한 번 만든 요소 트리로 판정"""
+        tree = None
+        if any(self.selectors[i] is not None for i in active):
+            if content is None:
+                raise ValueError('select 규칙을 판정하려면 파일 내용이 필요합니다')
+            tree = ElementTree(content)
+        by_element = {}
+        for span in spans:
+            selected = self._tag_rules(active, span.tag)
+            if tree is not None and span.tag_start >= 0:
+                key = span.tag_start
+                if key not in by_element:
+                    index = tree.index_of(span.tag_start)
+                    matched = [
+                        i for i in active
+                        if self.selectors[i] is not None and index >= 0
+                        and self._tag_allowed(i, span.tag) and self.selectors[i].matches(tree, index)
+                    ]
+                    by_element[key] = tuple(sorted(selected + tuple(matched))) if matched else selected
+                selected = by_element[key]
+            yield span, self._table(selected, span.kind)
+
+    def _table(self, selected, kind):
+        key = (selected, kind)
+        table = self._tables.get(key)
+        if table is None:
+            table = self._tables[key] = _Table(
+                [self.rules[i] for i in selected if kind in self.rules[i].get('kinds', KINDS)])
+        return table
+
+    def _apply_span(self, span, table, present_prefixes, counts, findings=None):
+        """스팬 하나에 테이블을 적용해 새 텍스트 반환 (변경 없으면 None)
+
+        토큰 사이의 공백과 줄바꿈은 그대로 유지합니다.
+        findings가 주어지면 규칙이 걸린 자리마다
+        (rule id, 토큰 시작, 토큰 끝, 편집 시작, 편집 끝, 새 텍스트)를 스팬 기준 offset으로 추가합니다.
+        """
+        text = span.text
+        present = set(text.split())
+        parts = []
+        utilities = []
+        last = 0
+        changed = False
+
+        for m in _TOKEN_RE.finditer(text):
+            token = m.group()
+            sep = text[last:m.start()]
+            last = m.end()
+            variant, utility = split_variant(token)
+
+            hit = table.replace.get(utility)
+            if hit is None and table.patterns:
+                hit = table.match_pattern(utility)
+            if hit is not None:
+                rule_id, new_utility = hit
+                new_token = variant + new_utility
+                counts[rule_id] += 1
+                changed = True
+                # 교체 결과가 이미 있으면 중복 제거 (앞 공백과 함께)
+                if new_token in present:
+                    if findings is not None:
+                        findings.append((rule_id, m.start(), m.end(), m.start() - len(sep), m.end(), ''))
+                    continue
+                if findings is not None:
+                    findings.append((rule_id, m.start(), m.end(), m.start(), m.end(), new_token))
+                present.add(new_token)
+                token, utility = new_token, new_utility
+
+            parts.append(sep)
+            parts.append(token)
+            utilities.append(utility)
+
+            hit = table.add.get(token)
+            if hit is not None:
+                rule_id, extra = hit
+                prefixes = {sibling_prefix(c) for c in extra}
+                if not prefixes & present_prefixes:
+                    if findings is not None:
+                        findings.append((rule_id, m.start(), m.end(), m.end(), m.end(), ' ' + ' '.join(extra)))
+                    parts.append(' ' + ' '.join(extra))
+                    present_prefixes |= prefixes
+                    counts[rule_id] += 1
+                    changed = True
+
+        for rule_id, cls, unless in table.ensure:
+            if cls in present or (unless and any(u == unless or u.startswith(unless + '-') for u in utilities)):
+                continue
+            if findings is not None:
+                findings.append((rule_id, 0, len(text), last, last, ' ' + cls if parts else cls))
+            parts.append(' ' + cls if parts else cls)
+            present.add(cls)
+            counts[rule_id] += 1
+            changed = True
+
+        if not changed:
+            return None
+        parts.append(text[last:])
+        return ''.join(parts)
+
+    def apply(self, content, spans, filepath=None):
+        """파일 내용에 활성 규칙 전체를 적용해 (new_content, 규칙별 변경 수 Counter) 반환
+
+        규칙은 하나의 테이블로 합쳐 적용되므로 시간은 'style-rules'로 묶어서,
+        변경 수는 규칙별로 통계에 기록합니다. 예산은 patterns 정규식만 규칙별로 따로 셉니다.
+        """
+        with stats.rule('style-rules'):
+            content, counts = self._apply(content, spans, filepath)
+        for rule_id, n in counts.items():
+            stats.count(rule_id, n)
+        return content, counts
+
+    @staticmethod
+    def _attr_prefixes(spans):
+        """className 속성 단위로 이미 있는 dark: 등 변형 접두사"""
+        attr_prefixes = defaultdict(set)
+        for span in spans:
+            for token in span.text.split():
+                if ':' in token:
+                    attr_prefixes[span.attr_start].add(sibling_prefix(token))
+        return attr_prefixes
+
+    def findings(self, spans, filepath=None, content=None):
+        """규칙이 걸린 자리 목록 (파일 내용은 바꾸지 않음, 편집기 진단용)
+
+        [(rule id, 토큰 시작, 토큰 끝, (편집 시작, 편집 끝, 새 텍스트))] - 모두 파일 기준 offset
+        content: 스팬을 구한 파일 내용 (select 규칙이 있을 때 필요)
+        """
+        found = []
+        active = self._active(filepath)
+        if not active:
+            return found
+        attr_prefixes = self._attr_prefixes(spans)
+        counts = Counter()
+        with stats.rule('style-rules'):
+            for span, table in self._span_tables(spans, active, content):
+                if not table:
+                    continue
+                span_findings = []
+                self._apply_span(span, table, set(attr_prefixes.get(span.attr_start, ())), counts, span_findings)
+                base = span.start
+                for rule_id, start, end, edit_start, edit_end, new_text in span_findings:
+                    found.append((rule_id, base + start, base + end,
+                                  (base + edit_start, base + edit_end, new_text)))
+        return found
+
+    def span_edits(self, spans, filepath=None, counts=None, content=None):
+        """활성 규칙을 적용한 스팬별 (start, end, 새 텍스트) 편집 목록 (counts에 규칙별 변경 수)"""
+        if counts is None:
+            counts = Counter()
+        active = self._active(filepath)
+        if not active:
+            return []
+
+        attr_prefixes = self._attr_prefixes(spans)
+        edits = []
+        for span, table in self._span_tables(spans, active, content):
+            if not table:
+                continue
+            new_text = self._apply_span(span, table, set(attr_prefixes.get(span.attr_start, ())), counts)
+            if new_text is not None and new_text != span.text:
+                edits.append((span.start, span.end, normalize_classes(new_text, span.kind)))
+        return edits
+
+    def _apply(self, content, spans, filepath):
+        counts = Counter()
+        edits = self.span_edits(spans, filepath, counts, content)
+        if not edits:
+            return content, counts
+        return apply_edits(content, edits), counts
+
+
+def describe_finding(content, finding):
+    """findings() 항목 하나를 사람이 읽는 메시지로 ('rounded-md' → 'rounded-full' 등)"""
+    rule_id, start, end, (edit_start, edit_end, new_text) = finding
+    old = content[start:end]
+    if edit_start == start and edit_end == end:
+        return f"'{old}' → '{new_text}'"
+    if not new_text:
+        return f"'{old}' 중복 (교체 결과가 이미 있음)"
+    if edit_start == end and start != end:
+        return f"'{old}'에 '{new_text.strip()}' 없음"
+    return f"'{new_text.strip()}' 없음"
+
+
+@lru_cache(maxsize=None)
+def load_ruleset(path=DEFAULT_RULES_PATH, only=None):
+    """규칙 파일을 읽어 컴파일 (프로세스당 한 번, only: 적용할 규칙 id 튜플)"""
+    return RuleSet(load_rules(path), only)
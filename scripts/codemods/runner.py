@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+코드모드 공용 실행기
+파일별 함수(process_file, audit_button_styles 등)를 ProcessPoolExecutor로 나눠 실행합니다.
+- 결과는 입력 파일 순서대로 반환
+- 파일 목록은 제너레이터여도 되며, 탐색이 끝나기 전에 처리를 시작
+- 결과는 준비되는 대로 스트리밍하고, 미리 보낸 작업 수가 제한되어 메모리는 트리 크기와 무관
+- 파일별 예외는 실행을 멈추지 않고 결과에 기록
+- 규칙 하나가 파일 하나에서 시간 예산을 넘기면 (codemods.guard) 그 파일만 중단하고 오류로 기록
+- manifest가 주어지면 바뀌지 않은 파일은 열지 않고 캐시된 결과 사용
+- stats가 주어지면 파일별 단계/규칙 통계를 워커에서 수집해 합침
+- transaction이 주어지면 쓰기를 스테이징했다가 모든 파일이 끝난 뒤 한꺼번에 반영
+- preview가 주어지면 (dry-run) 파일을 쓰지 않고 워커가 만든 패치를 모음
+- index가 주어지면 토큰 색인의 후보만 처리하고, 색인이 낡은 파일은 워커가 lex할 때 색인 항목도 만듦
+"""
+
+import os
+from functools import partial
+from collections import deque
+from typing import Any, NamedTuple, Optional, Tuple
+
+from codemods import fileio, guard, patch
+from codemods import stats as run_stats
+from codemods.cache import content_digest
+
+# --jobs를 지정하지 않았을 때 병렬 실행을 시작하는 최소 파일 수
+_MIN_PARALLEL_FILES = 16
+
+# 파일 수를 미리 알 수 없을 때(제너레이터) 워커에 한 번에 보내는 파일 수
+_STREAM_CHUNKSIZE = 8
+
+# 파일 수를 알 때도 청크 하나가 너무 커지지 않게 (첫 결과가 늦어지지 않도록)
+_MAX_CHUNKSIZE = 64
+
+# 워커당 보내 둘 수 있는 청크 수 (이보다 앞서 나가면 앞 청크 결과를 기다림)
+_WINDOW = 4
+
+# 앞 결과를 기다리느라 붙잡아 둘 수 있는 최대 항목 수 (넘으면 기다리거나 순차 실행)
+_MAX_PENDING = 1024
+
+
+class FileResult(NamedTuple):
+    """파일 하나의 처리 결과"""
+    path: Any
+    value: Any
+    error: Optional[str]
+    stamp: Optional[Tuple[int, int, str]] = None   # 캐시용 (size, mtime_ns, sha256)
+    stats: Optional[dict] = None                    # --stats 수집 시 파일 통계
+    staged: Optional[list] = None                   # 트랜잭션 실행 시 스테이징된 쓰기
+    patch: Optional[list] = None                    # dry-run 시 [(경로, 편집 목록, hunk)]
+    index: Optional[tuple] = None                   # 다시 색인한 파일의 토큰 색인 항목
+
+
+def add_jobs_argument(parser):
+    """--jobs 옵션 추가"""
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=None,
+        help='병렬 작업 프로세스 수 (기본: CPU 코어 수, 1이면 순차 실행)',
+    )
+
+
+def _tracked(call, collect, stage, capture, record):
+    """call(func, path, ...)을 파일 통계 수집, 쓰기 스테이징, 패치 기록, 색인 기록과 함께 실행"""
+    def wrapper(*args):
+        if record:
+            from codemods import tokenindex
+            stamp = tokenindex.begin_record(args[1])
+        if collect:
+            run_stats.begin_file()
+        if stage:
+            fileio.begin_staging(stage)
+        if capture:
+            patch.begin_capture()
+        try:
+            result = call(*args)
+        except BaseException:
+            if capture:
+                patch.end_capture()
+            if stage:
+                fileio.end_staging(discard=True)
+            if collect:
+                run_stats.end_file()
+            if record:
+                tokenindex.end_record(args[1], stamp, discard=True)
+            raise
+        # 오류가 난 파일의 쓰기는 반영하지 않음
+        patches = patch.end_capture() if capture else None
+        staged = fileio.end_staging(discard=result.error is not None) if stage else None
+        file_stats = run_stats.end_file() if collect else None
+        entry = tokenindex.end_record(args[1], stamp, discard=result.error is not None) if record else None
+        if result.error is not None:
+            patches = None
+        return result._replace(stats=file_stats, staged=staged, patch=patches, index=entry)
+    return wrapper
+
+
+def _call(func, path, record=False, collect=False, stage=None, capture=False, budget=None):
+    """func(path)를 실행하고 예외(규칙 시간 초과 포함)는 문자열로 기록 (record면 색인 항목도 만듦)"""
+    guard.set_budget(budget)
+    if collect or stage or capture or record:
+        return _tracked(partial(_call, budget=budget), collect, stage, capture, record)(func, path)
+    try:
+        return FileResult(path, func(path), None)
+    except (Exception, guard.RuleTimeout) as e:
+        return FileResult(path, None, f"{type(e).__name__}: {e}")
+
+
+def _call_cached(func, path, digest, cached, record=False, collect=False, stage=None, capture=False, budget=None):
+    """내용 해시가 이전과 같으면 캐시된 결과, 다르면 func(path) 실행"""
+    guard.set_budget(budget)
+    if collect or stage or capture or record:
+        return _tracked(partial(_call_cached, budget=budget), collect, stage, capture, record)(
+            func, path, digest, cached)
+    try:
+        st = os.stat(path)
+        with run_stats.phase('read'):
+            with open(path, 'rb') as f:
+                data = f.read()
+        run_stats.add_bytes('read', len(data))
+        new_digest = content_digest(data)
+        stamp = (st.st_size, st.st_mtime_ns, new_digest)
+        if new_digest == digest:
+            return FileResult(path, cached, None, stamp)
+        return FileResult(path, func(path), None, stamp)
+    except (Exception, guard.RuleTimeout) as e:
+        return FileResult(path, None, f"{type(e).__name__}: {e}")
+
+
+def _chunksize(total, jobs):
+    """워커당 4개 정도의 청크로 나눔 (프로세스 간 전송 횟수 절감)"""
+    if total is None:
+        return _STREAM_CHUNKSIZE
+    return max(1, min(_MAX_CHUNKSIZE, total // (jobs * 4)))
+
+
+def _apply_chunk(call, chunk):
+    return [call(*arg) for arg in chunk]
+
+
+class _Chunk:
+    """입력 순서를 지키며 워커에 보낼 실행 항목 묶음"""
+    __slots__ = ('args', 'future')
+
+    def __init__(self):
+        self.args = []
+        self.future = None
+
+
+def _map(call, items, jobs, total=None):
+    """items 순서대로 결과 yield - FileResult는 그대로, 인자 튜플은 call(*arg) (jobs > 1이면 프로세스 풀)
+
+    items는 제너레이터여도 되고 끝까지 미리 읽지 않습니다. 앞 결과가 준비되는 대로 내보내고,
+    보낸 뒤 아직 내보내지 않은 청크는 최대 jobs * _WINDOW개라 메모리는 트리 크기와 무관합니다.
+    jobs가 None이면 실행할 항목이 _MIN_PARALLEL_FILES개 쌓일 때 풀을 만들고 그 전까지는 순차로 봅니다.
+    """
+    workers = max(1, jobs if jobs is not None else (os.cpu_count() or 1))
+    if total is not None:
+        workers = max(1, min(workers, total))
+    if workers == 1:
+        for item in items:
+            yield item if isinstance(item, FileResult) else call(*item)
+        return
+
+    threshold = 1 if jobs is not None else _MIN_PARALLEL_FILES
+    chunksize = _chunksize(total, workers)
+    apply_chunk = partial(_apply_chunk, call)
+    queue = deque()     # 입력 순서대로 FileResult 또는 _Chunk
+    filling = None      # queue 끝에서 아직 채우는 중인 청크
+    unsent = 0          # 풀이 생기기 전에 쌓인 실행 항목 수
+    in_flight = 0       # 풀에 보냈지만 아직 내보내지 않은 청크 수
+    pool = None
+
+    def submit(chunk):
+        nonlocal in_flight
+        chunk.future = pool.submit(apply_chunk, chunk.args)
+        chunk.args = None
+        in_flight += 1
+
+    def drain(final=False):
+        """queue 앞에서 준비된 결과를 내보냄 (창이 가득 찼거나 final이면 기다림)"""
+        nonlocal in_flight, unsent, filling
+        while queue:
+            head = queue[0]
+            if isinstance(head, FileResult):
+                queue.popleft()
+                yield head
+                continue
+            if head.future is None:
+                if head is filling and not final and pool is not None:
+                    break
+                if pool is not None:
+                    submit(head)
+                elif final or len(queue) > _MAX_PENDING:
+                    # 풀을 만들 만큼 모이지 않음: 순차 실행
+                    queue.popleft()
+                    unsent -= len(head.args)
+                    if head is filling:
+                        filling = None
+                    for arg in head.args:
+                        yield call(*arg)
+                    continue
+                else:
+                    break
+            if not (final or head.future.done() or in_flight > workers * _WINDOW
+                    or len(queue) > _MAX_PENDING):
+                break
+            queue.popleft()
+            in_flight -= 1
+            yield from head.future.result()
+
+    try:
+        for item in items:
+            if isinstance(item, FileResult):
+                # 앞에 채우던 청크는 이 결과보다 먼저 나가야 하므로 바로 보냄
+                if filling is not None and pool is not None:
+                    submit(filling)
+                filling = None
+                queue.append(item)
+            else:
+                if filling is None:
+                    filling = _Chunk()
+                    queue.append(filling)
+                filling.args.append(item)
+                full = len(filling.args) >= chunksize
+                if pool is None:
+                    unsent += 1
+                    if unsent >= threshold:
+                        from concurrent.futures import ProcessPoolExecutor
+                        pool = ProcessPoolExecutor(max_workers=workers)
+                        for entry in queue:
+                            if isinstance(entry, _Chunk):
+                                submit(entry)
+                        filling = None
+                    elif full:
+                        filling = None
+                elif full:
+                    submit(filling)
+                    filling = None
+            yield from drain()
+        yield from drain(final=True)
+    finally:
+        # 중간에 멈추면 아직 시작하지 않은 청크는 취소
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def run_files(func, files, jobs=None, manifest=None, cacheable=None, stats=None, transaction=None,
+              preview=None, index=None, budget=guard.DEFAULT_RULE_BUDGET):
+    """files 각각에 func를 적용해 FileResult를 입력 순서대로 yield
+
+    func는 모듈 최상위 함수여야 합니다 (프로세스 간 pickle).
+    manifest: codemods.cache.Manifest (없으면 캐시 미사용)
+    cacheable: 결과를 캐시에 기록할지 판단하는 함수 (기본: 항상 기록)
+               수정 도구는 변경이 없었던 결과만 기록해야 합니다
+    stats: codemods.stats.RunStats (enabled면 결과마다 파일 통계를 합침)
+    transaction: codemods.journal.Transaction (쓰기를 스테이징했다가 끝까지 돌면 commit,
+                 도중에 중단되면 abort)
+    preview: codemods.patch.Preview (dry-run: 파일을 쓰지 않고 패치를 모음, transaction은 무시)
+    index: codemods.tokenindex.Prefilter (후보 파일만 처리, 끝까지 돌면 색인 저장)
+    budget: 규칙 하나가 파일 하나에 쓸 수 있는 초 (넘으면 그 파일은 RuleTimeout 오류, None이나 0이면 제한 없음)
+    """
+    if preview is not None:
+        transaction = None
+    options = {
+        'collect': stats is not None and stats.enabled,
+        'stage': transaction.begin() if transaction is not None else None,
+        'capture': preview is not None,
+        'budget': budget,
+    }
+    total = len(files) if index is None and hasattr(files, '__len__') else None
+    items = index.select(files) if index is not None else ((path, False) for path in files)
+    if options['collect']:
+        items = stats.timed_iter('discover', items)
+
+    results = _run(func, items, total, jobs, manifest, cacheable, options)
+    completed = False
+    try:
+        for result in results:
+            if options['collect']:
+                stats.add(result)
+            if transaction is not None:
+                transaction.add(result)
+            if preview is not None:
+                preview.add(result)
+            if index is not None:
+                index.add(result)
+            yield result
+        completed = True
+        if index is not None:
+            index.finish()
+    finally:
+        # 워커 풀을 먼저 정리해야 진행 중이던 워커의 스테이징까지 함께 버릴 수 있음
+        results.close()
+        if transaction is not None:
+            if completed:
+                transaction.commit()
+            else:
+                transaction.abort()
+
+
+def _run(func, items, total, jobs, manifest, cacheable, options):
+    """items: (경로, 색인 항목을 만들지) 순서대로"""
+    if manifest is None:
+        yield from _map(partial(_call, func, **options), items, jobs, total)
+        return
+
+    # stat만으로 hit 판정(부모), 나머지는 워커에서 해시 비교 후 처리
+    # (다시 색인할 파일은 hit여도 워커에 보내고, 해시가 같으면 캐시된 결과를 씀)
+    def lookups():
+        for path, record in items:
+            hit, value = manifest.lookup(path)
+            if hit and not record:
+                yield FileResult(path, value, None)
+            else:
+                digest = manifest.digest(path) if hit else value
+                yield path, digest, manifest.cached_result(path), record
+
+    for result in _map(partial(_call_cached, func, **options), lookups(), jobs, total):
+        # hit는 stamp도 오류도 없음
+        if result.stamp is not None or result.error is not None:
+            if result.error is None and (cacheable is None or cacheable(result.value)):
+                manifest.record(result.path, result.stamp, result.value)
+            else:
+                manifest.forget(result.path)
+        yield result
+
+    manifest.save()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+JSX 여는 태그 스캐너
+정규식 백트래킹 없이 파일을 한 번만 훑어 여는 태그와 속성 범위를 찾습니다.
+
+- 속성 값의 문자열, {} 표현식(중괄호 깊이), 템플릿 리터럴, 주석을 추적하므로
+  onClick={() => a > b} 같은 '>'에서 태그가 끝난 것으로 오인하지 않습니다
+- 속성 표현식 안의 JSX (icon={<Icon className="..." />})도 요소로 기록합니다
+- 각 문자는 최대 한 번만 소비되므로 입력 크기에 대해 선형 시간입니다
+"""
+
+import re
+from typing import List, NamedTuple
+
+
+class Element(NamedTuple):
+    """JSX 여는 태그 하나"""
+    tag: str            # 'button', 'div', 'Card', 'motion.div', 프래그먼트는 ''
+    start: int          # '<' 위치
+    attrs_start: int    # 태그 이름 바로 다음
+    attrs_end: int      # '>' 또는 '/>'의 위치
+    end: int            # 여는 태그 다음 위치
+    self_closing: bool
+
+
+# '<' 다음 태그 이름 (프래그먼트 '<>' 포함)
+_TAG_NAME_RE = re.compile(r'[A-Za-z][\w.:-]*|(?=>)')
+
+# 최상위에서 JSX 후보 찾기
+_OPEN_RE = re.compile(r'<(?=[A-Za-z>])')
+
+# 여는 태그 안의 속성 영역
+_ATTR_RE = re.compile(r'''[{"'>]|/>''')
+
+# 속성 영역의 속성 이름, 또는 건너뛸 값의 시작
+_ATTR_NAME_RE = re.compile(r'''[A-Za-z_$][\w$:.-]*|[{"']''')
+
+# {} 표현식 안
+_EXPR_RE = re.compile(r'''["'`{}]|/[/*]|<(?=[A-Za-z>])''')
+
+# 템플릿 리터럴 안
+_TEMPLATE_RE = re.compile(r'\\.|`|\$\{', re.S)
+
+# JSX 자식 영역 안
+_CHILDREN_RE = re.compile(r'[{]|<(?=[A-Za-z>/])')
+
+_STRING_END = {
+    '"': re.compile(r'(?:[^"\\]|\\.)*"', re.S),
+    "'": re.compile(r"(?:[^'\\]|\\.)*'", re.S),
+}
+
+# '<' 바로 앞에 붙어 있으면 JSX가 아니라 비교(i<n)나 제네릭(Array<T>)인 문자
+_IDENT_TAIL = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_$)]')
+
+
+def _is_jsx_start(content, pos):
+    """pos의 '<'가 JSX 요소의 시작인지 (i<n 비교, useState<T> 제네릭 제외)"""
+    return pos == 0 or content[pos - 1] not in _IDENT_TAIL
+
+
+class _Scanner:
+    def __init__(self, content):
+        self.content = content
+        self.n = len(content)
+        self.elements = []
+
+    def string(self, pos, quote):
+        """여는 따옴표 다음 pos에서 닫는 따옴표 다음 위치 반환"""
+        m = _STRING_END[quote].match(self.content, pos)
+        return m.end() if m else self.n
+
+    def template(self, pos):
+        """여는 ` 다음 pos에서 닫는 ` 다음 위치 반환"""
+        content = self.content
+        while True:
+            m = _TEMPLATE_RE.search(content, pos)
+            if m is None:
+                return self.n
+            tok = m.group()
+            if tok == '`':
+                return m.end()
+            pos = m.end()
+            if tok == '${':
+                pos = self.expr(pos)
+
+    def expr(self, pos):
+        """여는 '{' 다음 pos에서 짝이 맞는 '}' 다음 위치 반환"""
+        content = self.content
+        depth = 0
+        while True:
+            m = _EXPR_RE.search(content, pos)
+            if m is None:
+                return self.n
+            tok = m.group()
+            pos = m.end()
+            if tok == '{':
+                depth += 1
+            elif tok == '}':
+                if depth == 0:
+                    return pos
+                depth -= 1
+            elif tok == '"' or tok == "'":
+                pos = self.string(pos, tok)
+            elif tok == '`':
+                pos = self.template(pos)
+            elif tok == '//':
+                newline = content.find('\n', pos)
+                pos = self.n if newline < 0 else newline
+            elif tok == '/*':
+                close = content.find('*/', pos)
+                pos = self.n if close < 0 else close + 2
+            elif _is_jsx_start(content, m.start()):
+                pos = self.element(m.start(), nested=True)
+
+    def children(self, pos):
+        """표현식 안 JSX 요소의 자식 영역을 닫는 태그 다음까지 건너뜀"""
+        content = self.content
+        while True:
+            m = _CHILDREN_RE.search(content, pos)
+            if m is None:
+                return self.n
+            pos = m.end()
+            if m.group() == '{':
+                pos = self.expr(pos)
+            elif content.startswith('/', pos):
+                close = content.find('>', pos)
+                return self.n if close < 0 else close + 1
+            else:
+                pos = self.element(m.start(), nested=True)
+
+    def element(self, start, nested=False):
+        """start의 '<'부터 여는 태그를 스캔해 기록하고 다음 스캔 위치 반환
+
+        nested=True면 (표현식 안의 JSX) 자식 영역과 닫는 태그까지 건너뜁니다.
+        """
+        content = self.content
+        m = _TAG_NAME_RE.match(content, start + 1)
+        tag = m.group()
+        attrs_start = pos = m.end()
+
+        while True:
+            m = _ATTR_RE.search(content, pos)
+            if m is None:
+                return self.n
+            tok = m.group()
+            pos = m.end()
+            if tok == '{':
+                pos = self.expr(pos)
+            elif tok == '"' or tok == "'":
+                pos = self.string(pos, tok)
+            else:
+                break
+
+        self_closing = tok == '/>'
+        self.elements.append(Element(tag, start, attrs_start, m.start(), pos, self_closing))
+
+        if nested and not self_closing:
+            pos = self.children(pos)
+        return pos
+
+    def scan(self):
+        content = self.content
+        pos = 0
+        while True:
+            m = _OPEN_RE.search(content, pos)
+            if m is None:
+                break
+            if _is_jsx_start(content, m.start()):
+                pos = self.element(m.start())
+            else:
+                pos = m.end()
+        # 중첩 요소는 바깥 요소보다 먼저 기록되므로 위치 순으로 정렬
+        self.elements.sort(key=lambda element: element.start)
+        return self.elements
+
+
+def scan_elements(content) -> List[Element]:
+    """파일 내용의 JSX 여는 태그 목록 (위치 순)"""
+    return _Scanner(content).scan()
+
+
+def attribute_names(content, element) -> List[str]:
+    """여는 태그의 속성 이름 목록 (값과 {...spread}는 건너뜀)"""
+    scanner = _Scanner(content)
+    names = []
+    pos = element.attrs_start
+    while True:
+        m = _ATTR_NAME_RE.search(content, pos, element.attrs_end)
+        if m is None:
+            return names
+        tok = m.group()
+        pos = m.end()
+        if tok == '{':
+            pos = scanner.expr(pos)
+        elif tok == '"' or tok == "'":
+            pos = scanner.string(pos, tok)
+        else:
+            names.append(tok)
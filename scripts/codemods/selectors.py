@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+JSX 요소 선택자
+규칙이 적용될 요소를 태그 목록이나 파일 목록 대신 작은 선택자 언어로 고릅니다.
+선택자는 파일당 한 번 만든 요소 트리(ElementTree) 위에서 평가하고, 트리는 그 파일의 모든 규칙이 공유합니다.
+
+선택자 문법 (CSS의 작은 부분집합):
+    button                      태그 (컴포넌트 이름도 그대로: Card, motion.div)
+    *                           아무 요소
+    button[type]                속성이 있는 요소 (값은 보지 않음, 여러 개면 모두 있어야 함)
+    section button              section 안(자손)의 button
+    Card > div                  Card의 바로 아래(자식) div
+    div, section, article       그중 하나
+
+파일 경로 glob: 'src/components/admin/*.tsx' - 프로젝트 루트 기준 상대 경로 전체와 맞춰 봅니다
+    *, ?, [abc]                 경로 한 마디 안에서만 ('*'는 '/'를 넘지 않음)
+    src/**/admin/*.tsx          '**' 마디는 0개 이상의 디렉토리
+"""
+
+import os
+import re
+from functools import lru_cache
+from pathlib import PurePath
+from typing import NamedTuple, Optional, Tuple
+
+from codemods.scanner import attribute_names, scan_elements
+
+# 닫는 태그 (프래그먼트 '</>' 포함)
+_CLOSE_RE = re.compile(r'</\s*([A-Za-z][\w.:-]*)?\s*>')
+
+# 선택자 한 단계: 태그(또는 *)와 [속성] 목록
+_COMPOUND_RE = re.compile(r'(\*|[A-Za-z][\w.:-]*)?((?:\[\s*[A-Za-z_$][\w$:.-]*\s*\])*)')
+_ATTR_NAME_RE = re.compile(r'[A-Za-z_$][\w$:.-]*')
+
+# 단계 사이의 결합자 (공백: 자손, '>': 자식)
+_COMBINATOR_RE = re.compile(r'\s*>\s*|\s+')
+
+
+class ElementTree:
+    """파일 하나의 JSX 요소 트리 - 여는 태그 목록과 부모 관계 (속성 이름은 필요할 때 파싱)"""
+
+    def __init__(self, content, elements=None):
+        self.content = content
+        self.elements = scan_elements(content) if elements is None else elements
+        self.parents = _link_parents(content, self.elements)
+        self._by_start = {element.start: i for i, element in enumerate(self.elements)}
+        self._attributes = {}
+
+    def index_of(self, start):
+        """'<' 위치의 요소 번호 (없으면 -1)"""
+        return self._by_start.get(start, -1)
+
+    def attributes(self, index):
+        names = self._attributes.get(index)
+        if names is None:
+            names = self._attributes[index] = frozenset(attribute_names(self.content, self.elements[index]))
+        return names
+
+
+def _link_parents(content, elements):
+    """요소마다 감싸는 요소의 번호 (최상위면 -1)
+
+    여는 태그와 닫는 태그를 위치 순으로 맞춰 가며 스택으로 부모를 정합니다.
+    짝이 없는 닫는 태그는 무시하고, 짝이 맞지 않으면 같은 이름이 나올 때까지 닫습니다.
+    """
+    parents = [-1] * len(elements)
+    closes = [(m.start(), m.group(1) or '') for m in _CLOSE_RE.finditer(content)]
+    stack = []
+    c = 0
+
+    def close_before(pos):
+        nonlocal c
+        while True:
+            # 스스로 닫힌 요소 (속성 안 JSX를 품을 수 있으므로 태그가 끝날 때 닫음)
+            while stack and elements[stack[-1]].self_closing and elements[stack[-1]].end <= pos:
+                stack.pop()
+            if c >= len(closes) or closes[c][0] >= pos:
+                return
+            close_pos, tag = closes[c]
+            c += 1
+            while stack and elements[stack[-1]].self_closing and elements[stack[-1]].end <= close_pos:
+                stack.pop()
+            for depth in range(len(stack) - 1, -1, -1):
+                element = elements[stack[depth]]
+                if element.tag == tag and not element.self_closing:
+                    del stack[depth:]
+                    break
+
+    for i, element in enumerate(elements):
+        close_before(element.start)
+        if stack:
+            parents[i] = stack[-1]
+        stack.append(i)
+    return parents
+
+
+class Compound(NamedTuple):
+    """선택자 한 단계"""
+    tag: Optional[str]          # None이면 '*'
+    attrs: Tuple[str, ...]
+
+    def matches(self, tree, index):
+        if self.tag is not None and tree.elements[index].tag != self.tag:
+            return False
+        return not self.attrs or tree.attributes(index).issuperset(self.attrs)
+
+
+class Complex(NamedTuple):
+    """결합자로 이은 단계 목록 (마지막 단계가 대상 요소)"""
+    compounds: Tuple[Compound, ...]
+    combinators: Tuple[str, ...]    # compounds[i]와 compounds[i + 1] 사이: ' ' 또는 '>'
+
+    def matches(self, tree, index, k=None):
+        if k is None:
+            k = len(self.compounds) - 1
+        if not self.compounds[k].matches(tree, index):
+            return False
+        if k == 0:
+            return True
+        parent = tree.parents[index]
+        if self.combinators[k - 1] == '>':
+            return parent >= 0 and self.matches(tree, parent, k - 1)
+        while parent >= 0:
+            if self.matches(tree, parent, k - 1):
+                return True
+            parent = tree.parents[parent]
+        return False
+
+
+class Selector(NamedTuple):
+    """쉼표로 나눈 선택자 중 하나라도 맞으면 선택"""
+    source: str
+    alternatives: Tuple[Complex, ...]
+
+    def matches(self, tree, index):
+        """tree의 index번 요소가 선택되는지"""
+        return any(alternative.matches(tree, index) for alternative in self.alternatives)
+
+    def simple_tags(self):
+        """'div, section'처럼 태그만 나열한 선택자면 그 태그 집합 (요소 트리 없이 판정 가능), 아니면 None"""
+        tags = set()
+        for alternative in self.alternatives:
+            if len(alternative.compounds) > 1:
+                return None
+            compound = alternative.compounds[0]
+            if compound.tag is None or compound.attrs:
+                return None
+            tags.add(compound.tag)
+        return frozenset(tags)
+
+    def subject_tags(self):
+        """선택될 수 있는 요소 태그 집합 (대상 단계에 '*'가 있으면 None)"""
+        tags = set()
+        for alternative in self.alternatives:
+            tag = alternative.compounds[-1].tag
+            if tag is None:
+                return None
+            tags.add(tag)
+        return frozenset(tags)
+
+
+def _parse_complex(text, source):
+    compounds = []
+    combinators = []
+    pos = 0
+    while True:
+        m = _COMPOUND_RE.match(text, pos)
+        if not m.group():
+            raise ValueError(f"선택자를 읽을 수 없습니다: {source!r} ({text[pos:]!r} 부분)")
+        name = m.group(1)
+        compounds.append(Compound(None if name in (None, '*') else name,
+                                  tuple(_ATTR_NAME_RE.findall(m.group(2)))))
+        pos = m.end()
+        if pos == len(text):
+            return Complex(tuple(compounds), tuple(combinators))
+        m = _COMBINATOR_RE.match(text, pos)
+        if m is None:
+            raise ValueError(f"선택자를 읽을 수 없습니다: {source!r} ({text[pos:]!r} 부분)")
+        combinators.append('>' if '>' in m.group() else ' ')
+        pos = m.end()
+
+
+@lru_cache(maxsize=None)
+def parse_selector(source):
+    """'section button, Card > div' 같은 선택자 문자열을 컴파일 (문법 오류는 ValueError)"""
+    alternatives = []
+    for text in source.split(','):
+        text = text.strip()
+        if not text:
+            raise ValueError(f"빈 선택자가 있습니다: {source!r}")
+        alternatives.append(_parse_complex(text, source))
+    return Selector(source, tuple(alternatives))
+
+
+def project_path(filepath, root):
+    """files glob과 비교할 경로 ('src/components/admin/X.tsx' - 루트 기준 상대, '/' 구분)"""
+    if root is not None:
+        filepath = os.path.relpath(filepath, root)
+    return PurePath(filepath).as_posix()
+
+
+def _glob_segment(segment):
+    """경로 한 마디의 glob -> 정규식 ('*', '?'는 '/'를 넘지 않음)"""
+    out = []
+    i = 0
+    while i < len(segment):
+        ch = segment[i]
+        if ch == '*':
+            out.append('[^/]*')
+        elif ch == '?':
+            out.append('[^/]')
+        elif ch == '[' and ']' in segment[i + 2:]:
+            end = segment.index(']', i + 2)
+            body = segment[i + 1:end]
+            if body.startswith('!'):
+                body = '^' + body[1:]
+            out.append('[' + body.replace('\\', '\\\\') + ']')
+            i = end
+        else:
+            out.append(re.escape(ch))
+        i += 1
+    return ''.join(out)
+
+
+@lru_cache(maxsize=None)
+def _glob_regex(pattern):
+    parts = []
+    segments = pattern.strip('/').split('/')
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == '**':
+            parts.append('.*' if last else '(?:[^/]+/)*')
+        else:
+            parts.append(_glob_segment(segment) + ('' if last else '/'))
+    return re.compile(''.join(parts))
+
+
+def match_path(path, patterns):
+    """project_path() 경로가 glob 중 하나와 (경로 전체가) 맞는지"""
+    return any(_glob_regex(pattern).fullmatch(path) for pattern in patterns)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+실행 통계와 프로파일링 (--stats / --profile)
+- 단계별 시간: discover, read, transform, write
+- 파일별 시간과 읽고 쓴 바이트
+- 규칙별 시간과 치환 횟수 (치환하는 자리에서 직접 센 값)
+
+파일 단위 수집은 워커 프로세스 안에서 이루어지고, run_files가 FileResult.stats로
+부모 프로세스에 넘겨 RunStats에 합칩니다. 수집 중이 아니면 phase/rule/count는 아무 일도 하지 않습니다.
+"""
+
+import json
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+
+from codemods import guard
+
+PHASES = ('discover', 'read', 'transform', 'write')
+
+# 현재 프로세스에서 처리 중인 파일의 통계 (수집하지 않으면 None)
+_current = None
+
+
+def add_stats_arguments(parser):
+    """--stats / --profile 옵션 추가"""
+    parser.add_argument('--stats', type=Path, metavar='FILE',
+                        help='단계별/파일별/규칙별 실행 통계를 JSON으로 저장')
+    parser.add_argument('--profile', type=Path, metavar='FILE',
+                        help='cProfile 결과 저장 (프로파일링을 위해 순차 실행)')
+
+
+def begin_file():
+    """파일 하나의 수집 시작"""
+    global _current
+    _current = {
+        'seconds': time.perf_counter(),
+        'read': 0.0,
+        'write': 0.0,
+        'bytes_read': 0,
+        'bytes_written': 0,
+        'rules': {},
+    }
+
+
+def end_file():
+    """수집을 끝내고 파일 통계 dict 반환 (transform = 전체 - read - write)"""
+    global _current
+    stats, _current = _current, None
+    stats['seconds'] = time.perf_counter() - stats['seconds']
+    stats['transform'] = max(0.0, stats['seconds'] - stats['read'] - stats['write'])
+    return stats
+
+
+@contextmanager
+def phase(name):
+    """파일 하나의 read/write 단계 시간 기록"""
+    if _current is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _current[name] += time.perf_counter() - start
+
+
+def add_bytes(name, count):
+    """읽거나 쓴 바이트 수 기록 (name: 'read' / 'written')"""
+    if _current is not None:
+        _current['bytes_' + name] += count
+
+
+def _rule_entry(name):
+    entry = _current['rules'].get(name)
+    if entry is None:
+        entry = _current['rules'][name] = [0.0, 0]
+    return entry
+
+
+@contextmanager
+def rule(name):
+    """규칙 하나의 적용 시간 기록 (실행기가 정한 예산을 넘기면 guard.RuleTimeout)"""
+    with guard.limit(name):
+        if _current is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            _rule_entry(name)[0] += time.perf_counter() - start
+
+
+def count(name, n=1):
+    """규칙의 치환 횟수 기록"""
+    if _current is not None and n:
+        _rule_entry(name)[1] += n
+
+
+class RunStats:
+    """실행 전체의 통계 (부모 프로세스)"""
+
+    def __init__(self, tool, root, stats_path=None, profile_path=None):
+        self.tool = tool
+        self.root = Path(root)
+        self.stats_path = stats_path
+        self.profile_path = profile_path
+        self.enabled = stats_path is not None or profile_path is not None
+        self.started = time.perf_counter()
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self.bytes = {'read': 0, 'written': 0}
+        self.rules = defaultdict(lambda: {'seconds': 0.0, 'count': 0})
+        self.files = []
+        self.cached = 0
+        self.errors = 0
+        self.profiler = None
+        if profile_path is not None:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    @contextmanager
+    def phase(self, name):
+        """부모 프로세스의 단계 시간 기록 (discover 등)"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - start
+
+    def timed_iter(self, name, iterable):
+        """iterable을 그대로 내보내며 다음 항목을 꺼내는 데 걸린 시간을 name 단계에 기록
+
+        제너레이터로 탐색하면 탐색과 처리가 섞이므로 discover 시간은 이렇게 잽니다.
+        """
+        it = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(it)
+            except StopIteration:
+                self.phases[name] += time.perf_counter() - start
+                return
+            self.phases[name] += time.perf_counter() - start
+            yield item
+
+    def _rel(self, path):
+        try:
+            return str(Path(path).resolve().relative_to(self.root))
+        except ValueError:
+            return str(path)
+
+    def add(self, result):
+        """FileResult 하나를 합침"""
+        if result.error:
+            self.errors += 1
+        stats = result.stats
+        if stats is None:
+            # 캐시 hit (파일을 열지 않음)
+            self.cached += 1
+            self.files.append({'path': self._rel(result.path), 'cached': True})
+            return
+
+        for name in ('read', 'transform', 'write'):
+            self.phases[name] += stats[name]
+        self.bytes['read'] += stats['bytes_read']
+        self.bytes['written'] += stats['bytes_written']
+        for name, (seconds, n) in stats['rules'].items():
+            self.rules[name]['seconds'] += seconds
+            self.rules[name]['count'] += n
+
+        self.files.append({
+            'path': self._rel(result.path),
+            'seconds': round(stats['seconds'], 6),
+            'read': round(stats['read'], 6),
+            'transform': round(stats['transform'], 6),
+            'write': round(stats['write'], 6),
+            'bytes_read': stats['bytes_read'],
+            'bytes_written': stats['bytes_written'],
+            'error': result.error,
+        })
+
+    def report(self):
+        """JSON으로 저장할 dict"""
+        return {
+            'tool': self.tool,
+            'wall_seconds': round(time.perf_counter() - self.started, 6),
+            'files': len(self.files),
+            'cached': self.cached,
+            'errors': self.errors,
+            'phases': {name: round(seconds, 6) for name, seconds in self.phases.items()},
+            'bytes': self.bytes,
+            'rules': {
+                name: {'seconds': round(entry['seconds'], 6), 'count': entry['count']}
+                for name, entry in sorted(self.rules.items(), key=lambda item: -item[1]['seconds'])
+            },
+            'per_file': sorted(self.files, key=lambda entry: -entry.get('seconds', 0.0)),
+        }
+
+    def finish(self):
+        """통계 JSON과 cProfile 결과 저장"""
+        if self.profiler is not None:
+            self.profiler.disable()
+            self.profiler.dump_stats(self.profile_path)
+            print(f"🧪 프로파일 저장: {self.profile_path} (python3 -m pstats {self.profile_path})")
+
+        if self.stats_path is not None:
+            report = self.report()
+            with open(self.stats_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+                f.write('\n')
+
+            phases = ', '.join(f"{name} {seconds:.2f}s" for name, seconds in report['phases'].items())
+            print(f"📊 통계 저장: {self.stats_path}")
+            print(f"   {phases}")
+            print(f"   읽기 {self.bytes['read']:,} bytes, 쓰기 {self.bytes['written']:,} bytes")
+            for name, entry in report['rules'].items():
+                parts = []
+                if entry['seconds']:
+                    parts.append(f"{entry['seconds']:.3f}s")
+                if entry['count']:
+                    parts.append(f"{entry['count']}회")
+                print(f"   {name}: {', '.join(parts)}")
+
+
+def open_stats(args, root, tool):
+    """명령줄 옵션에 맞는 RunStats (--profile이면 순차 실행으로 전환)"""
+    if args.profile is not None:
+        # 워커 프로세스 안의 코드까지 프로파일하려면 한 프로세스에서 실행해야 함
+        args.jobs = 1
+    return RunStats(tool, root, args.stats, args.profile)
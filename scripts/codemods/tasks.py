@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+통합 CLI(python3 -m codemods)의 파일별 작업
+엔진 모듈(lexer, rules, darkmode, converge)은 여기서만 import하고, codemods.cli는 이 모듈을
+처리할 파일이 생겼을 때 (워커 안에서) 처음 읽습니다. 모든 파일이 캐시 hit이면 읽지 않습니다.
+
+컴파일된 규칙은 codemods.cache.load_artifact로 pickle을 재사용합니다 (프로세스당 한 번).
+"""
+
+from codemods.cache import load_artifact
+from codemods.converge import converge
+from codemods.darkmode import DarkModeEngine, load_policy
+from codemods.fileio import read_source, write_source
+from codemods.lexer import lex
+from codemods.rules import RuleSet, describe_finding, load_rules
+from codemods.selectors import project_path
+
+
+def _ruleset(rules_path, only, artifact):
+    return load_artifact(artifact, lambda: RuleSet(load_rules(rules_path), only))
+
+
+def fix_file(filepath, rules_path, only, artifact, root=None):
+    """규칙 적용 - 규칙별 변경 수 반환 (변경 없으면 None)"""
+    ruleset = _ruleset(rules_path, only, artifact)
+    original_content = read_source(filepath)
+    path = project_path(filepath, root)
+
+    modified_content, counts, _ = converge(
+        lambda content: ruleset.apply(content, lex(content), path), original_content)
+
+    if modified_content != original_content:
+        write_source(filepath, modified_content)
+        return dict(counts)
+    return None
+
+
+def audit_file(filepath, rules_path, only, artifact, root=None, staged=False):
+    """규칙 위반 목록 [[rule id, 줄, 열, 메시지]] (파일은 수정하지 않음, staged면 스테이징된 내용)"""
+    ruleset = _ruleset(rules_path, only, artifact)
+    content = read_source(filepath, staged=staged)
+
+    issues = []
+    line_no, line_pos = 1, 0
+    findings = ruleset.findings(lex(content), project_path(filepath, root), content)
+    for finding in sorted(findings, key=lambda f: f[1]):
+        start = finding[1]
+        # 위치 순이므로 줄 번호를 이어서 계산
+        line_no += content.count('\n', line_pos, start)
+        line_pos = start
+        column = start - content.rfind('\n', 0, start)
+        issues.append([finding[0], line_no, column, describe_finding(content, finding)])
+    return issues
+
+
+def dark_mode_file(filepath, policy_path, artifact):
+    """다크모드 클래스 추가 - 추가한 수 반환 (변경 없으면 0)"""
+    engine = load_artifact(artifact, lambda: DarkModeEngine(load_policy(policy_path)))
+    content = read_source(filepath)
+
+    content, count, _ = converge(lambda text: engine.apply(text, lex(text)), content)
+
+    if count:
+        write_source(filepath, content)
+    return count
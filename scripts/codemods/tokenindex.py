@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+클래스 토큰 역색인 (파일 사전 선별)
+className 스팬의 클래스(변형 접두사를 뗀 utility)와 요소 태그마다 그것을 가진 파일 id 목록을
+array('I') posting list로 저장해, 규칙이 걸릴 수 있는 파일만 열도록 합니다.
+<button도 rounded-2xl도 다크모드 매핑 토큰도 없는 파일은 실행 전에 빠집니다.
+
+- 선별은 지연: 색인이 맞는 파일은 바로 거르고, (size, mtime)이 바뀐 파일은 후보로 넘겨
+  도구의 워커가 그 파일을 lex할 때 색인 항목도 함께 만듦 (따로 다시 lex하지 않고 첫 결과도 늦추지 않음)
+- 다시 색인한 파일은 새 id로 추가하고 옛 id는 비움
+- 빈 id가 많아지면 (1/4 이상) 살아 있는 파일만 남겨 id를 다시 매김
+- lexer/scanner 코드가 바뀌면 처음부터 다시 만듦
+- 색인하지 못한 파일(읽기 오류 등)은 낡은 채로 남아 다음 실행에도 후보 (도구가 오류를 보고)
+
+후보 조건(pattern)은 (클래스 집합 또는 None, 태그 집합 또는 None) 목록이고,
+하나라도 맞으면 후보입니다. None은 '아무거나' (클래스가 None이면 className 스팬이 있는 파일 전부).
+
+위치: <root>/.codemod-cache/token-index.pickle
+"""
+
+import hashlib
+import os
+from array import array
+from pathlib import Path
+
+from codemods.cache import CACHE_DIR_NAME
+
+INDEX_FILE_NAME = 'token-index.pickle'
+
+INDEX_VERSION = 1
+
+# 빈 id 비율이 이 이상이면 저장 전에 압축
+_COMPACT_RATIO = 0.25
+
+
+def add_index_argument(parser):
+    """--no-index 옵션 추가"""
+    parser.add_argument(
+        '--no-index', action='store_true',
+        help='토큰 색인으로 후보 파일을 고르지 않고 모든 파일을 검사',
+    )
+
+
+def index_path(root):
+    return Path(root) / CACHE_DIR_NAME / INDEX_FILE_NAME
+
+
+def _fingerprint():
+    """색인 버전과 lexer 엔진 소스의 해시 (바뀌면 재색인)"""
+    h = hashlib.sha256(str(INDEX_VERSION).encode())
+    engine_dir = Path(__file__).parent
+    for name in ('scanner.py', 'lexer.py', 'edits.py'):
+        h.update((engine_dir / name).read_bytes())
+    return h.hexdigest()[:16]
+
+
+def rule_patterns(rules):
+    """rules.json 규칙 목록 -> 후보 조건 (kinds/exclude_files는 무시해 넉넉하게 고름)
+
+    replace/add는 그 클래스가 있어야 걸리고, ensure와 patterns(정규식)는 태그만 맞으면 걸립니다.
+    select는 대상 요소의 태그만 보고, 조상 조건과 files glob은 무시합니다.
+    """
+    from codemods.edits import split_variant
+    from codemods.selectors import parse_selector
+    patterns = []
+    for rule in rules:
+        tags = rule.get('tags')
+        tags = frozenset(tags) if tags is not None else None
+        if 'select' in rule:
+            subjects = parse_selector(rule['select']).subject_tags()
+            if subjects is not None:
+                tags = subjects if tags is None else tags & subjects
+        if 'ensure' in rule or 'patterns' in rule:
+            patterns.append((None, tags))
+        else:
+            add = frozenset(split_variant(token)[1] for token in rule.get('add', ()))
+            patterns.append((frozenset(rule.get('replace', ())) | add, tags))
+    return patterns
+
+
+def token_patterns(tokens, tags=None):
+    """클래스 토큰(변형 접두사 포함 가능) 중 하나라도 있는 파일 -> 후보 조건"""
+    from codemods.edits import split_variant
+    return [(frozenset(split_variant(token)[1] for token in tokens), tags)]
+
+
+def _entry(stamp, spans):
+    """색인 항목 (stamp, utility 목록, 태그 목록, 스팬 유무)"""
+    from codemods.edits import split_variant
+    utilities = {split_variant(token)[1] for span in spans for token in span.text.split()}
+    tags = {span.tag for span in spans if span.tag is not None}
+    return stamp, sorted(utilities), sorted(tags), bool(spans)
+
+
+def index_file(filepath):
+    """파일 하나를 읽어 lex한 색인 항목"""
+    from codemods.fileio import read_source
+    from codemods.lexer import lex
+
+    st = os.stat(filepath)
+    return _entry((st.st_size, st.st_mtime_ns), lex(read_source(filepath)))
+
+
+def begin_record(filepath):
+    """워커: 작업 함수가 이 파일을 lex할 때 색인 항목도 만들도록 기록 시작 - 작업 전 stamp 반환"""
+    from codemods import lexer
+    lexer.begin_record()
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def end_record(filepath, stamp, discard=False):
+    """워커: 작업 전 내용의 색인 항목 (작업 함수가 lex하지 않았으면 여기서 lex, 실패하면 None)
+
+    작업 함수가 파일을 바로 고쳐 써도 항목은 작업 전 stamp로 남으므로 다음 실행에서 다시 색인됩니다.
+    """
+    from codemods import lexer
+    spans = lexer.end_record()
+    if discard or stamp is None:
+        return None
+    if spans is not None:
+        return _entry(stamp, spans)
+    try:
+        return index_file(filepath)
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+class TokenIndex:
+    """프로젝트 하나의 클래스/태그 -> 파일 id 역색인"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.path = index_path(root)
+        self.fingerprint = _fingerprint()
+        self.dirty = False
+        data = self._load()
+        if data is None:
+            data = {'files': [], 'stamps': [], 'classes': {}, 'tags': {}, 'spanned': array('I')}
+            self.dirty = True
+        self.files = data['files']          # id -> 상대 경로 (빈 id는 None)
+        self.stamps = data['stamps']        # id -> (size, mtime_ns)
+        self.classes = data['classes']      # utility -> array('I') 파일 id (오름차순)
+        self.tags = data['tags']            # 태그 -> array('I')
+        self.spanned = data['spanned']      # className 스팬이 하나라도 있는 파일 id
+        self.ids = {rel: file_id for file_id, rel in enumerate(self.files) if rel is not None}
+
+    def _load(self):
+        import pickle
+        try:
+            with open(self.path, 'rb') as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        if not isinstance(data, dict) or data.get('fingerprint') != self.fingerprint:
+            return None
+        return data
+
+    def _rel(self, path):
+        return os.path.relpath(path, self.root)
+
+    def is_fresh(self, path):
+        """path의 색인 항목이 지금 파일과 맞는지 (stat 한 번)"""
+        file_id = self.ids.get(self._rel(path))
+        if file_id is None:
+            return False
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        return self.stamps[file_id] == (st.st_size, st.st_mtime_ns)
+
+    def _store(self, rel, stamp, utilities, tags, has_spans):
+        """파일 하나를 새 id로 추가 (옛 id는 비움 - posting list는 id 오름차순 유지)"""
+        old = self.ids.get(rel)
+        if old is not None:
+            self.files[old] = None
+            self.stamps[old] = None
+        file_id = len(self.files)
+        self.files.append(rel)
+        self.stamps.append(stamp)
+        self.ids[rel] = file_id
+        for utility in utilities:
+            self.classes.setdefault(utility, array('I')).append(file_id)
+        for tag in tags:
+            self.tags.setdefault(tag, array('I')).append(file_id)
+        if has_spans:
+            self.spanned.append(file_id)
+        self.dirty = True
+
+    @staticmethod
+    def _union(postings, keys):
+        ids = set()
+        for key in keys:
+            ids.update(postings.get(key, ()))
+        return ids
+
+    def candidate_ids(self, patterns):
+        """후보 조건 중 하나라도 맞는 파일 id 집합"""
+        result = set()
+        for classes, tags in patterns:
+            ids = self._union(self.classes, classes) if classes is not None else set(self.spanned)
+            if tags is not None:
+                ids &= self._union(self.tags, tags)
+            result |= ids
+        return result
+
+    def _compact(self):
+        """빈 id와 사라진 파일을 지우고 id를 0부터 다시 매김"""
+        remap = {}
+        files, stamps = [], []
+        for file_id, rel in enumerate(self.files):
+            if rel is None or not (self.root / rel).exists():
+                continue
+            remap[file_id] = len(files)
+            files.append(rel)
+            stamps.append(self.stamps[file_id])
+
+        def rebuild(postings):
+            return array('I', [remap[i] for i in postings if i in remap])
+
+        self.classes = {key: ids for key, ids in ((k, rebuild(v)) for k, v in self.classes.items()) if ids}
+        self.tags = {key: ids for key, ids in ((k, rebuild(v)) for k, v in self.tags.items()) if ids}
+        self.spanned = rebuild(self.spanned)
+        self.files, self.stamps = files, stamps
+        self.ids = {rel: file_id for file_id, rel in enumerate(files)}
+
+    def save(self):
+        if not self.dirty:
+            return
+        import pickle
+        if self.files and (len(self.files) - len(self.ids)) >= len(self.files) * _COMPACT_RATIO:
+            self._compact()
+        data = {'fingerprint': self.fingerprint, 'files': self.files, 'stamps': self.stamps,
+                'classes': self.classes, 'tags': self.tags, 'spanned': self.spanned}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # 여러 도구가 동시에 저장할 수 있으므로 프로세스별 임시 파일에 쓰고 교체
+        tmp_path = self.path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+class Prefilter:
+    """실행 하나의 후보 선별 (run_files(index=...)) - 입력을 미리 다 읽지 않음
+
+    색인이 맞는 파일은 후보일 때만 내보내고, 낡은 파일은 내용을 모르므로 모두 후보로 내보내며
+    워커가 만든 색인 항목(FileResult.index)을 받아 색인을 고칩니다. 끝나면 저장하고 요약을 출력합니다.
+    """
+
+    def __init__(self, root, patterns, log=print):
+        self.index = TokenIndex(root)
+        self.ids = self.index.candidate_ids(patterns)
+        self.log = log
+        self.seen = 0
+        self.selected = 0
+        self.indexed = 0
+
+    def select(self, files):
+        """files 중 후보만 입력 순서대로 (경로, 다시 색인할지)"""
+        index = self.index
+        for path in files:
+            self.seen += 1
+            stale = not index.is_fresh(path)
+            if stale or index.ids[index._rel(path)] in self.ids:
+                self.selected += 1
+                yield path, stale
+
+    def add(self, result):
+        if result.index is not None:
+            self.index._store(self.index._rel(result.path), *result.index)
+            self.indexed += 1
+
+    def finish(self):
+        self.index.save()
+        reindexed = f", {self.indexed}개 재색인" if self.indexed else ''
+        self.log(f"🗂️  토큰 색인: {self.seen}개 중 {self.selected}개 파일만 검사{reindexed}")
+
+
+def open_index(args, root, patterns, log=print):
+    """--no-index가 아니면 후보 조건(patterns)으로 고르는 Prefilter (아니면 None)"""
+    if args.no_index:
+        return None
+    return Prefilter(root, patterns, log)
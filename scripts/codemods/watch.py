@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+파일 감시 (--watch)
+저장된 파일만 다시 검사할 수 있도록 바뀐 파일 묶음을 차례로 내보냅니다.
+
+- Linux: inotify (ctypes, 추가 패키지 없음). 디렉토리마다 watch를 걸고
+  새 디렉토리가 생기면 그 아래까지 watch 추가
+- 그 외 / inotify 실패 / --poll: 주기적으로 (size, mtime)을 비교하는 폴링
+- 이벤트는 WATCH_SETTLE 동안 조용해질 때까지 모아 한 묶음으로 (브랜치 전환처럼 한꺼번에 바뀌는 경우)
+- 큐가 넘치면 (IN_Q_OVERFLOW) 감시 디렉토리 전체를 다시 나열
+
+Watcher는 (files, dirs)를 yield합니다.
+files: 다시 검사할 파일 (지워진 파일 포함), dirs: 하위 전체를 다시 나열한 디렉토리
+(이전 결과 중 dirs 아래에 있지만 files에 없는 파일은 사라진 것)
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from codemods.discover import IgnoreCache, walk_files
+
+# 첫 이벤트 뒤 이만큼 조용하면 묶음을 내보냄 (초)
+WATCH_SETTLE = 0.02
+
+# 이벤트가 계속 와도 이 시간이 지나면 묶음을 내보냄 (초)
+MAX_BATCH_DELAY = 0.5
+
+# 폴링 간격 (초)
+POLL_INTERVAL = 0.5
+
+# <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (_IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+               | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR)
+
+_EVENT = struct.Struct('iIII')
+
+
+def add_watch_arguments(parser):
+    """--watch / --poll 옵션 추가"""
+    parser.add_argument('--watch', action='store_true',
+                        help='처음 검사 후 계속 실행하며 저장된 파일만 다시 검사')
+    parser.add_argument('--poll', action='store_true',
+                        help='--watch에서 inotify 대신 폴링 사용 (네트워크 파일시스템 등)')
+
+
+class _Inotify:
+    """inotify 파일 디스크립터와 watch 목록"""
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.dirs = {}      # wd -> 디렉토리 Path
+
+    def close(self):
+        os.close(self.fd)
+
+    def add(self, directory):
+        wd = self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f'inotify_add_watch: {os.strerror(errno)}', str(directory))
+        self.dirs[wd] = Path(directory)
+
+    def wait(self, timeout):
+        return bool(select.select([self.fd], [], [], timeout)[0])
+
+    def read(self):
+        """대기 중인 이벤트를 [(디렉토리, 이름, mask)]로 (없으면 빈 목록)"""
+        try:
+            data = os.read(self.fd, 1 << 16)
+        except BlockingIOError:
+            return []
+        events = []
+        pos = 0
+        while pos < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, pos)
+            pos += _EVENT.size
+            name = os.fsdecode(data[pos:pos + length].split(b'\0', 1)[0])
+            pos += length
+            if mask & _IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            events.append((self.dirs.get(wd), name, mask))
+        return events
+
+
+class Watcher:
+    """base_dir 아래의 suffixes 파일 변경을 묶음 단위로 yield"""
+
+    def __init__(self, base_dir, suffixes, root=None, poll=False):
+        self.base_dir = Path(base_dir)
+        self.suffixes = tuple(suffixes)
+        self.root = Path(root) if root is not None else self.base_dir
+        self.ignore = IgnoreCache(self.root)
+        self._inotify = None
+        self._previous = None
+        self.backend = 'polling'
+        if not poll and sys.platform.startswith('linux'):
+            try:
+                self._inotify = _Inotify()
+                self._watch_tree(self.base_dir)
+                self.backend = 'inotify'
+            except (OSError, AttributeError) as e:
+                # watch 수 제한(ENOSPC) 등: 폴링으로 전환
+                print(f"ℹ️  inotify를 사용할 수 없어 폴링으로 감시합니다 ({e})")
+                if self._inotify is not None:
+                    self._inotify.close()
+                self._inotify = None
+        if self._inotify is None:
+            # 감시 시작 시점의 상태 (첫 간격 안에 저장된 파일도 놓치지 않도록)
+            self._previous = self._snapshot()
+
+    def _walk(self, directory, dirs=False):
+        return walk_files(directory, self.suffixes, self.root, dirs=dirs)
+
+    def _watch_tree(self, directory):
+        """directory와 그 아래 (제외되지 않은) 디렉토리에 watch 추가, 아래 파일 목록 반환"""
+        self._inotify.add(directory)
+        files = []
+        for path in self._walk(directory, dirs=True):
+            if path.suffix in self.suffixes and not path.is_dir():
+                files.append(path)
+            else:
+                self._inotify.add(path)
+        return files
+
+    def __iter__(self):
+        if self._inotify is not None:
+            return self._inotify_batches()
+        return self._poll_batches()
+
+    def close(self):
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def _wanted(self, path, is_dir):
+        if not is_dir and not path.name.endswith(self.suffixes):
+            return False
+        return not self.ignore.ignored(path, is_dir)
+
+    def _inotify_batches(self):
+        inotify = self._inotify
+        while True:
+            inotify.wait(None)
+            files, dirs = set(), set()
+            started = time.monotonic()
+            # 조용해질 때까지 모음 (최대 MAX_BATCH_DELAY)
+            while True:
+                for directory, name, mask in inotify.read():
+                    self._collect(directory, name, mask, files, dirs)
+                remaining = MAX_BATCH_DELAY - (time.monotonic() - started)
+                if remaining <= 0 or not inotify.wait(min(WATCH_SETTLE, remaining)):
+                    break
+            for directory in dirs:
+                if directory.is_dir():
+                    files.update(self._watch_tree(directory))
+            if files or dirs:
+                yield files, dirs
+
+    def _collect(self, directory, name, mask, files, dirs):
+        if mask & _IN_Q_OVERFLOW or directory is None:
+            # 이벤트를 잃어버렸으므로 전체를 다시 나열
+            dirs.add(self.base_dir)
+            return
+        if mask & (_IN_DELETE_SELF | _IN_MOVE_SELF):
+            dirs.add(directory)
+            return
+        path = directory / name
+        if name == '.gitignore':
+            self.ignore.clear()
+            dirs.add(directory)
+        elif mask & _IN_ISDIR:
+            # 새 디렉토리 / 옮겨 온 디렉토리 / 사라진 디렉토리: 하위 전체를 다시 나열
+            if mask & (_IN_CREATE | _IN_MOVED_TO | _IN_MOVED_FROM) and self._wanted(path, True):
+                dirs.add(path)
+        elif mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_MOVED_FROM | _IN_DELETE):
+            if self._wanted(path, False):
+                files.add(path)
+
+    def _snapshot(self):
+        snapshot = {}
+        for path in self._walk(self.base_dir):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (st.st_size, st.st_mtime_ns)
+        return snapshot
+
+    def _poll_batches(self):
+        previous = self._previous
+        while True:
+            time.sleep(POLL_INTERVAL)
+            current = self._snapshot()
+            changed = {path for path, stamp in current.items() if previous.get(path) != stamp}
+            changed.update(path for path in previous if path not in current)
+            previous = current
+            if changed:
+                yield changed, set()
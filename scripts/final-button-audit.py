@@ -1,83 +1,255 @@
 #!/usr/bin/env python3
 """
 최종 버튼 감사 - 모든 button 태그에서 rounded-full이 아닌 것 찾기
+파일마다 검사가 끝나는 즉시 출력합니다 (--format ndjson/sarif: CI, 코드 스캐닝용).
 """
 
-import re
-from pathlib import Path
+import argparse
+import sys
+import time
+from collections import Counter
+from contextlib import nullcontext, redirect_stdout
+from functools import partial
 
-def audit_button_styles(filepath):
-    """버튼 스타일 감사"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Button.tsx 제외
-        if 'Button.tsx' in str(filepath) or 'button.tsx' in str(filepath):
-            return []
-
-        issues = []
-        lines = content.split('\n')
-
-        for i, line in enumerate(lines, 1):
-            # button 태그가 있는 라인
-            if '<button' in line and 'className' in line:
-                # rounded-full이 없고 다른 rounded가 있는 경우
-                if 'rounded-full' not in line and re.search(r'\brounded(?:-(?:sm|md|lg|xl|2xl|3xl))?\b', line):
-                    # className 속성 추출
-                    class_match = re.search(r'className="([^"]*)"', line)
-                    if class_match:
-                        classes = class_match.group(1)
-                        # rounded 관련 클래스만 추출
-                        rounded_classes = re.findall(r'\brounded(?:-(?:sm|md|lg|xl|2xl|3xl))?\b', classes)
-                        if rounded_classes:
-                            issues.append({
-                                'line': i,
-                                'content': line.strip()[:100],
-                                'rounded_class': rounded_classes
-                            })
-
-        return issues
-
-    except Exception as e:
+from codemods import stats
+from codemods.cache import add_cache_argument, open_manifest
+from codemods.discover import walk_files
+from codemods.edits import split_variant
+from codemods.fileio import read_source_if
+from codemods.gitfiles import add_git_arguments, find_project_root, reads_staged, select_files
+from codemods.guard import add_budget_argument
+from codemods.lexer import lex
+from codemods.report import Finding, add_format_arguments, open_report
+from codemods.runner import add_jobs_argument, run_files
+from codemods.stats import add_stats_arguments, open_stats
+from codemods.tokenindex import add_index_argument, open_index
+from codemods.watch import Watcher, add_watch_arguments
+
+ROUNDED_CLASSES = {'rounded', 'rounded-sm', 'rounded-md', 'rounded-lg', 'rounded-xl', 'rounded-2xl', 'rounded-3xl'}
+
+# 문제가 있는 파일에 반드시 들어 있는 바이트열 (스캐너는 '<' 바로 뒤의 이름만 태그로 봄)
+REQUIRED_BYTES = (b'<button', b'rounded')
+
+# --format ndjson/sarif에서 쓰는 규칙 id (rules.json의 버튼 규칙과 같은 이름)
+RULE_ID = 'button-rounded-full'
+RULE_DESCRIPTION = 'button은 rounded-full 사용 (rounded, rounded-sm ~ rounded-3xl 대신)'
+
+def _find_issues(content, spans):
+    """rounded-full이 아닌 button className 찾기"""
+    issues = []
+    line_no, line_pos = 1, 0
+
+    for span in spans:
+        if span.tag != 'button':
+            continue
+
+        # rounded-full이 없고 다른 rounded가 있는 경우
+        tokens = [split_variant(token)[1] for token in span.text.split()]
+        if 'rounded-full' in tokens:
+            continue
+        rounded_classes = [token for token in tokens if token in ROUNDED_CLASSES]
+        if not rounded_classes:
+            continue
+
+        # 스팬은 위치 순이므로 줄 번호를 이어서 계산
+        line_no += content.count('\n', line_pos, span.start)
+        line_pos = span.start
+        line_begin = content.rfind('\n', 0, span.start) + 1
+        line_end = content.find('\n', span.start)
+        line = content[line_begin:line_end if line_end >= 0 else len(content)]
+
+        issues.append({
+            'line': line_no,
+            'column': span.start - line_begin + 1,
+            'content': line.strip()[:100],
+            'rounded_class': rounded_classes
+        })
+
+    return issues
+
+def audit_button_styles(filepath, staged=False):
+    """버튼 스타일 감사 (staged면 스테이징된 내용)"""
+    # Button.tsx 제외
+    if 'Button.tsx' in str(filepath) or 'button.tsx' in str(filepath):
+        return []
+
+    # <button이나 rounded가 없는 파일은 디코딩과 lex 없이 넘어감
+    content = read_source_if(filepath, REQUIRED_BYTES, staged=staged)
+    if content is None:
         return []
 
+    spans = lex(content)
+    with stats.rule('audit-buttons'):
+        issues = _find_issues(content, spans)
+    stats.count('audit-buttons', len(issues))
+    return issues
+
+def _issue_keys(issues):
+    """줄 번호를 뺀 문제 목록 (위쪽을 고치면 줄 번호가 바뀌므로 내용으로 비교)"""
+    return Counter((issue['content'], tuple(issue['rounded_class'])) for issue in issues)
+
+def watch_issues(args, project_root, all_issues, manifest):
+    """저장된 파일만 다시 감사하며 새로 생긴 문제와 해결된 문제 출력 (Ctrl+C로 종료)"""
+    root = project_root.parent
+    watcher = Watcher(project_root, {'.tsx', '.jsx'}, root, poll=args.poll)
+    print(f"\n👀 {project_root} 감시 중 ({watcher.backend}) - Ctrl+C로 종료")
+
+    try:
+        for files, dirs in watcher:
+            started = time.perf_counter()
+            rel_dirs = [str(d.relative_to(root)) + '/' for d in dirs]
+            checked = {str(f.relative_to(root)) for f in files}
+            # 다시 나열한 디렉토리 아래에서 사라진 파일
+            gone = [path for path in all_issues
+                    if path not in checked and any(path.startswith(d) for d in rel_dirs)]
+
+            results = {path: [] for path in gone}
+            existing = sorted(f for f in files if f.is_file())
+            for f in files:
+                if not f.is_file():
+                    results[str(f.relative_to(root))] = []
+            for result in run_files(audit_button_styles, existing, jobs=args.jobs, manifest=manifest,
+                                    budget=args.rule_budget):
+                rel_path = str(result.path.relative_to(root))
+                if result.error:
+                    print(f"❌ 오류 발생 ({rel_path}): {result.error}")
+                    continue
+                results[rel_path] = result.value or []
+
+            reported = 0
+            for rel_path in sorted(results):
+                issues = results[rel_path]
+                old = _issue_keys(all_issues.get(rel_path, ()))
+                new = _issue_keys(issues)
+                if issues:
+                    all_issues[rel_path] = issues
+                else:
+                    all_issues.pop(rel_path, None)
+                added, resolved = new - old, old - new
+                if not added and not resolved:
+                    continue
+                reported += 1
+                print(f"\n📄 {rel_path}")
+                for issue in issues:
+                    key = (issue['content'], tuple(issue['rounded_class']))
+                    if added[key] > 0:
+                        added[key] -= 1
+                        print(f"  ❌ Line {issue['line']}: {issue['rounded_class']}")
+                        print(f"    {issue['content']}")
+                for (content, rounded_class), count in resolved.items():
+                    for _ in range(count):
+                        print(f"  ✅ 해결: {list(rounded_class)}")
+                        print(f"    {content}")
+
+            elapsed = (time.perf_counter() - started) * 1000
+            if reported:
+                total = sum(len(issues) for issues in all_issues.values())
+                print(f"⏱️  {len(results)}개 파일 재검사 ({elapsed:.0f}ms) - 남은 문제 {total}개 ({len(all_issues)}개 파일)")
+    except KeyboardInterrupt:
+        print("\n👋 감시 종료")
+    finally:
+        watcher.close()
+    return 0
+
+def _findings(issues):
+    """감사 결과 -> report.Finding 목록"""
+    return [Finding(RULE_ID, issue['line'], issue['column'],
+                    f"rounded-full 대신 {', '.join(issue['rounded_class'])}",
+                    {'rounded_class': issue['rounded_class'], 'content': issue['content']})
+            for issue in issues]
+
+def _print_issues(rel_path, issues, log):
+    log(f"\n📄 {rel_path}")
+    for issue in issues[:5]:  # 파일당 최대 5개만 표시
+        log(f"  Line {issue['line']}: {issue['rounded_class']}")
+        log(f"    {issue['content']}")
+    if len(issues) > 5:
+        log(f"  ... 외 {len(issues) - 5}개 더")
+
 def main():
     """메인 함수"""
-    project_root = Path('/Users/choihyodong/bs-learning-app-main/src')
+    parser = argparse.ArgumentParser(description='버튼 스타일 최종 감사')
+    add_jobs_argument(parser)
+    add_budget_argument(parser)
+    add_cache_argument(parser)
+    add_index_argument(parser)
+    add_git_arguments(parser)
+    add_stats_arguments(parser)
+    add_watch_arguments(parser)
+    add_format_arguments(parser)
+    args = parser.parse_args()
+    if args.watch and args.format != 'text':
+        parser.error('--watch는 --format text에서만 사용할 수 있습니다')
+    if args.watch and args.staged:
+        parser.error('--watch는 작업 트리를 감시하므로 --staged와 함께 쓸 수 없습니다')
+
+    project_root = find_project_root() / 'src'
+    # --staged: 인덱스의 내용을 검사하므로 stat 기반 캐시와 토큰 색인은 쓰지 않음
+    staged = reads_staged(args, writes=False)
+    manifest = None if staged else open_manifest(args, project_root.parent, 'audit-buttons', __file__,
+                                                 ROUNDED_CLASSES)
+    run_stats = open_stats(args, project_root.parent, 'audit-buttons')
+    report = open_report(args, project_root.parent, 'audit-buttons', {RULE_ID: RULE_DESCRIPTION})
+    # 결과를 stdout에 쓰면 진행 메시지와 통계 요약은 stderr
+    to_stderr = report is not None and args.output is None
+    log = partial(print, file=sys.stderr) if to_stderr else print
 
-    print("🔍 버튼 스타일 최종 감사...")
-    print("=" * 80)
+    log("🔍 버튼 스타일 최종 감사...")
+    log("=" * 80)
 
-    all_issues = {}
+    # 감시 모드에서만 전체 결과를 보관 (그 외에는 파일마다 출력하고 버림)
+    all_issues = {} if args.watch else None
+    issue_files = 0
+    issue_count = 0
+    errors = []
 
     # 모든 tsx, jsx 파일 검사
-    for filepath in project_root.rglob('*.tsx'):
-        issues = audit_button_styles(filepath)
-        if issues:
-            rel_path = filepath.relative_to(project_root.parent)
-            all_issues[str(rel_path)] = issues
-
-    for filepath in project_root.rglob('*.jsx'):
-        issues = audit_button_styles(filepath)
-        if issues:
-            rel_path = filepath.relative_to(project_root.parent)
-            all_issues[str(rel_path)] = issues
-
-    if all_issues:
-        print(f"\n⚠️  {len(all_issues)}개 파일에서 문제 발견:\n")
-        for filepath, issues in all_issues.items():
-            print(f"\n📄 {filepath}")
-            for issue in issues[:5]:  # 파일당 최대 5개만 표시
-                print(f"  Line {issue['line']}: {issue['rounded_class']}")
-                print(f"    {issue['content']}")
-            if len(issues) > 5:
-                print(f"  ... 외 {len(issues) - 5}개 더")
+    with run_stats.phase('discover'):
+        all_files = select_files(args, project_root.parent, project_root, {'.tsx', '.jsx'},
+                                 lambda: walk_files(project_root, {'.tsx', '.jsx'}, project_root.parent), writes=False)
+        index = None if staged else open_index(args, project_root.parent, [(ROUNDED_CLASSES, {'button'})], log=log)
+
+    for result in run_files(partial(audit_button_styles, staged=staged), all_files, jobs=args.jobs, manifest=manifest, stats=run_stats,
+                            index=index, budget=args.rule_budget):
+        rel_path = result.path.relative_to(project_root.parent)
+        if result.error:
+            errors.append((str(rel_path), result.error))
+            if report is not None:
+                report.error(rel_path, result.error)
+        elif result.value:
+            issue_files += 1
+            issue_count += len(result.value)
+            if report is not None:
+                report.add(rel_path, _findings(result.value))
+            else:
+                _print_issues(rel_path, result.value, log)
+            if all_issues is not None:
+                all_issues[str(rel_path)] = result.value
+
+    if report is not None:
+        report.close()
+
+    if issue_files:
+        log(f"\n⚠️  {issue_files}개 파일에서 {issue_count}개 문제 발견")
     else:
-        print("\n✅ 모든 버튼이 rounded-full 스타일을 사용합니다!")
+        log("\n✅ 모든 버튼이 rounded-full 스타일을 사용합니다!")
+
+    if errors:
+        log(f"\n❌ {len(errors)}개 파일 검사 실패:")
+        for filepath, error in errors:
+            log(f"  {filepath}: {error}")
+
+    log("\n" + "=" * 80)
+    log(f"검사 완료")
+
+    with redirect_stdout(sys.stderr) if to_stderr else nullcontext():
+        run_stats.finish()
+
+    if args.watch:
+        return watch_issues(args, project_root, all_issues, manifest)
 
-    print("\n" + "=" * 80)
-    print(f"검사 완료")
+    # pre-commit hook에서 문제가 있으면 커밋 중단
+    return 1 if issue_files or errors else 0
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -4,74 +4,91 @@ Admin 컴포넌트 버튼 스타일 최종 수정
 모든 button 태그의 rounded를 rounded-full로 변경
 """
 
-import os
-import re
+import argparse
+import sys
 from pathlib import Path
 
+from codemods import stats
+from codemods.cache import add_cache_argument, open_manifest
+from codemods.converge import converge
+from codemods.edits import map_tokens, rewrite_spans, split_variant
+from codemods.fileio import read_source, write_source
+from codemods.gitfiles import add_git_arguments, filter_changed, find_project_root
+from codemods.guard import add_budget_argument
+from codemods.journal import Transaction, add_undo_argument, undo_last_run
+from codemods.lexer import lex
+from codemods.patch import add_dry_run_arguments, open_preview
+from codemods.runner import add_jobs_argument, run_files
+from codemods.stats import add_stats_arguments, open_stats
+from codemods.tokenindex import add_index_argument, open_index
+
+# rounded, rounded-sm, rounded-md, rounded-lg를 rounded-full로 변경
+# rounded-2xl, rounded-3xl 등은 카드용이므로 제외하지만 버튼에는 없어야 함
+ROUNDED_TO_FULL = {'rounded-lg', 'rounded-md', 'rounded-sm', 'rounded'}
+
+def _to_rounded_full(token):
+    """rounded 계열 토큰을 rounded-full로 (변형 접두사 유지)"""
+    variant, utility = split_variant(token)
+    if utility in ROUNDED_TO_FULL:
+        stats.count(f'button-rounded-full: {utility}')
+        return variant + 'rounded-full'
+    return token
+
 def fix_all_button_rounded(content):
     """모든 버튼의 rounded를 rounded-full로 변경"""
     changes = []
-    modified_content = content
-
-    # 패턴: button 태그 내에서 rounded 관련 클래스를 모두 rounded-full로 변경
-    # 단, rounded-full은 그대로 유지
-
-    # 1. className 속성 내의 rounded 변경
-    def replace_rounded_in_button(match):
-        button_tag = match.group(0)
 
-        # 이미 rounded-full이면 그대로 반환
-        if 'rounded-full' in button_tag:
-            return button_tag
+    # button 태그의 className 스팬 (문자열, 템플릿, cn() 인자 모두)
+    button_spans = [span for span in lex(content) if span.tag == 'button']
 
-        # rounded, rounded-sm, rounded-md, rounded-lg를 rounded-full로 변경
-        # rounded-2xl, rounded-3xl 등은 카드용이므로 제외하지만 버튼에는 없어야 함
-        result = button_tag
-        result = re.sub(r'\brounded-lg\b', 'rounded-full', result)
-        result = re.sub(r'\brounded-md\b', 'rounded-full', result)
-        result = re.sub(r'\brounded-sm\b', 'rounded-full', result)
-        result = re.sub(r'\brounded\b(?!\-)', 'rounded-full', result)  # rounded만 있는 경우
+    # 이미 rounded-full이 있는 className 속성은 그대로 유지
+    full_attrs = {
+        span.attr_start for span in button_spans
+        if any(split_variant(token)[1] == 'rounded-full' for token in span.text.split())
+    }
 
-        if result != button_tag:
-            return result
-        return button_tag
+    def fix_span(span):
+        if span.attr_start in full_attrs:
+            return None
+        return map_tokens(span.text, _to_rounded_full)
 
-    # button 태그 전체를 찾아서 처리
-    pattern = r'<button[^>]*>.*?</button>'
-    new_content = re.sub(pattern, replace_rounded_in_button, modified_content, flags=re.DOTALL)
+    with stats.rule('button-rounded-full'):
+        modified_content, count = rewrite_spans(content, button_spans, fix_span)
 
-    if new_content != modified_content:
-        # 변경된 개수 카운트
-        original_roundeds = len(re.findall(r'<button[^>]*className="[^"]*\brounded(?!\-full)\b', modified_content))
-        changes.append(f"  - button rounded 수정: {original_roundeds}개")
-        modified_content = new_content
+    if count:
+        changes.append(f"  - button rounded 수정: {count}개")
 
     return modified_content, changes
 
 def process_file(filepath):
     """파일 처리"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+    original_content = read_source(filepath)
 
-        # Button.tsx 제외
-        if 'Button.tsx' in filepath or 'button.tsx' in filepath:
-            return None
+    # Button.tsx 제외
+    if 'Button.tsx' in filepath or 'button.tsx' in filepath:
+        return None
 
-        modified_content, changes = fix_all_button_rounded(original_content)
+    modified_content, changes, _ = converge(fix_all_button_rounded, original_content)
 
-        if modified_content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
-            return changes
+    if modified_content != original_content:
+        write_source(filepath, modified_content)
+        return changes
 
-        return None
-    except Exception as e:
-        print(f"❌ 오류 발생 ({filepath}): {e}")
-        return None
+    return None
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description='Admin 컴포넌트 버튼 스타일 최종 수정')
+    add_jobs_argument(parser)
+    add_budget_argument(parser)
+    add_cache_argument(parser)
+    add_index_argument(parser)
+    add_git_arguments(parser)
+    add_stats_arguments(parser)
+    add_undo_argument(parser)
+    add_dry_run_arguments(parser)
+    args = parser.parse_args()
+
     # Admin 컴포넌트 파일들
     admin_files = [
         'src/components/admin/UserPermissionManager.tsx',
@@ -84,22 +101,37 @@ def main():
         'src/components/admin/SubjectManagement.tsx',
     ]
 
-    project_root = Path('/Users/choihyodong/bs-learning-app-main')
+    project_root = find_project_root()
+    if args.undo:
+        return undo_last_run(project_root, 'fix-admin-buttons')
+    manifest = open_manifest(args, project_root, 'fix-admin-buttons', __file__, ROUNDED_TO_FULL)
+    run_stats = open_stats(args, project_root, 'fix-admin-buttons')
+    transaction = Transaction(project_root, 'fix-admin-buttons')
+    preview = open_preview(args, project_root)
 
     print("🔧 Admin 컴포넌트 버튼 스타일 최종 수정...")
     print("=" * 60)
 
     modified_files = []
 
-    for rel_path in admin_files:
-        filepath = project_root / rel_path
+    target_paths = {str(project_root / rel_path): rel_path for rel_path in admin_files}
+    existing = [path for path in target_paths if Path(path).exists()]
 
-        if not filepath.exists():
-            continue
+    # git 모드면 변경된 파일만
+    with run_stats.phase('discover'):
+        existing = filter_changed(args, project_root, existing)
+        index = open_index(args, project_root, [(ROUNDED_TO_FULL, {'button'})])
 
-        changes = process_file(str(filepath))
+    for result in run_files(process_file, existing, jobs=args.jobs,
+                            manifest=manifest, cacheable=lambda changes: not changes,
+                            stats=run_stats, transaction=transaction, preview=preview, index=index,
+                            budget=args.rule_budget):
+        rel_path = target_paths[result.path]
+        changes = result.value
 
-        if changes:
+        if result.error:
+            print(f"❌ 오류 발생 ({rel_path}): {result.error}")
+        elif changes:
             modified_files.append(rel_path)
             print(f"\n✅ {rel_path}")
             for change in changes:
@@ -113,5 +145,10 @@ def main():
         for filepath in modified_files:
             print(f"  - {filepath}")
 
+    if preview is not None:
+        preview.finish()
+    transaction.report(sys.argv[0])
+    run_stats.finish()
+
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
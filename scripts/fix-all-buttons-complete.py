@@ -5,100 +5,129 @@
 - onClick이 있는 div, span 등도 버튼처럼 동작하면 처리
 """
 
-import os
-import re
-from pathlib import Path
+import argparse
+import sys
+from collections import Counter
+
+from codemods import stats
+from codemods.cache import add_cache_argument, open_manifest
+from codemods.converge import converge
+from codemods.discover import walk_files
+from codemods.edits import map_tokens, rewrite_spans, split_variant
+from codemods.fileio import read_source, write_source
+from codemods.gitfiles import add_git_arguments, find_project_root, select_files
+from codemods.guard import add_budget_argument
+from codemods.journal import Transaction, add_undo_argument, undo_last_run
+from codemods.lexer import lex
+from codemods.patch import add_dry_run_arguments, open_preview
+from codemods.runner import add_jobs_argument, run_files
+from codemods.stats import add_stats_arguments, open_stats
+from codemods.tokenindex import add_index_argument, open_index
+
+# rounded, rounded-sm, rounded-md, rounded-lg -> rounded-full
+# 단, rounded-full은 그대로 유지, rounded-2xl/3xl은 카드용이므로 제외
+ROUNDED_TO_FULL = ('rounded-lg', 'rounded-md', 'rounded-sm', 'rounded')
 
 def fix_button_rounded(content, filepath):
     """버튼의 rounded 클래스를 rounded-full로 변경"""
     changes = []
-    modified_content = content
 
     # Button.tsx는 제외
     if 'Button.tsx' in filepath or 'button.tsx' in filepath:
         return content, changes
 
-    # 패턴 1: <button ... className="..." > 형태에서 rounded 변경
-    # rounded, rounded-sm, rounded-md, rounded-lg -> rounded-full
-    # 단, rounded-full은 그대로 유지, rounded-2xl/3xl은 카드용이므로 제외
-
-    patterns = [
-        # button 태그에서 rounded-lg -> rounded-full
-        (r'(<button\s+[^>]*className="[^"]*?)rounded-lg\b', r'\1rounded-full'),
-        # button 태그에서 rounded-md -> rounded-full
-        (r'(<button\s+[^>]*className="[^"]*?)rounded-md\b', r'\1rounded-full'),
-        # button 태그에서 rounded-sm -> rounded-full
-        (r'(<button\s+[^>]*className="[^"]*?)rounded-sm\b', r'\1rounded-full'),
-        # button 태그에서 rounded만 있는 경우 -> rounded-full
-        (r'(<button\s+[^>]*className="[^"]*?)rounded\b(?!-)', r'\1rounded-full'),
-    ]
-
-    for pattern, replacement in patterns:
-        new_content = re.sub(pattern, replacement, modified_content, flags=re.MULTILINE)
-        if new_content != modified_content:
-            count = len(re.findall(pattern, modified_content, flags=re.MULTILINE))
-            changes.append(f"  - {pattern.split('rounded')[1][:10]}: {count}개 변경")
-            modified_content = new_content
+    counts = Counter()
 
-    return modified_content, changes
+    def replace_token(token):
+        variant, utility = split_variant(token)
+        if utility in ROUNDED_TO_FULL:
+            counts[utility] += 1
+            return variant + 'rounded-full'
+        return token
 
-def process_file(filepath):
-    """파일 처리"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+    def fix_span(span):
+        # <button ... className="..." > 형태만 처리
+        if span.tag != 'button' or span.kind != 'literal':
+            return None
+        return map_tokens(span.text, replace_token)
 
-        modified_content, changes = fix_button_rounded(original_content, str(filepath))
+    spans = lex(content)
+    with stats.rule('button-rounded-full'):
+        modified_content, _ = rewrite_spans(content, spans, fix_span)
 
-        if modified_content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
-            return changes
+    for name in ROUNDED_TO_FULL:
+        if counts[name]:
+            stats.count(f'button-rounded-full: {name}', counts[name])
+            changes.append(f"  - {name}: {counts[name]}개 변경")
 
-        return None
-    except Exception as e:
-        print(f"❌ 오류 ({filepath}): {e}")
-        return None
+    return modified_content, changes
 
-def find_all_files(base_path):
-    """모든 tsx, jsx, ts, js 파일 찾기"""
-    files = []
-    for ext in ['**/*.tsx', '**/*.jsx', '**/*.ts', '**/*.js']:
-        files.extend(Path(base_path).glob(ext))
+def process_file(filepath):
+    """파일 처리"""
+    original_content = read_source(filepath)
+
+    modified_content, changes, _ = converge(
+        lambda content: fix_button_rounded(content, str(filepath)), original_content)
 
-    # node_modules, .next 등 제외
-    filtered = []
-    for f in files:
-        path_str = str(f)
-        if 'node_modules' not in path_str and '.next' not in path_str:
-            filtered.append(f)
+    if modified_content != original_content:
+        write_source(filepath, modified_content)
+        return changes
 
-    return filtered
+    return None
 
 def main():
     """메인 함수"""
-    project_root = Path('/Users/choihyodong/bs-learning-app-main')
+    parser = argparse.ArgumentParser(description='전체 프로젝트 버튼 스타일 완전 수정')
+    add_jobs_argument(parser)
+    add_budget_argument(parser)
+    add_cache_argument(parser)
+    add_index_argument(parser)
+    add_git_arguments(parser)
+    add_stats_arguments(parser)
+    add_undo_argument(parser)
+    add_dry_run_arguments(parser)
+    args = parser.parse_args()
+
+    project_root = find_project_root()
+    if args.undo:
+        return undo_last_run(project_root, 'fix-buttons-complete')
+    manifest = open_manifest(args, project_root, 'fix-buttons-complete', __file__, ROUNDED_TO_FULL)
+    run_stats = open_stats(args, project_root, 'fix-buttons-complete')
+    transaction = Transaction(project_root, 'fix-buttons-complete')
+    preview = open_preview(args, project_root)
     src_path = project_root / 'src'
 
     print("🔧 전체 프로젝트 버튼 스타일 완전 수정...")
     print("=" * 80)
 
-    all_files = find_all_files(src_path)
+    # node_modules, .next, .gitignore 대상은 내려가지 않음
+    suffixes = {'.tsx', '.jsx', '.ts', '.js'}
+    with run_stats.phase('discover'):
+        all_files = select_files(args, project_root, src_path, suffixes,
+                                 lambda: walk_files(src_path, suffixes, project_root))
+        index = open_index(args, project_root, [(ROUNDED_TO_FULL, {'button'})])
+    checked = 0
     modified_files = []
 
-    print(f"\n📁 {len(all_files)}개 파일 검사 중...\n")
-
-    for filepath in all_files:
-        changes = process_file(filepath)
-        if changes:
-            rel_path = filepath.relative_to(project_root)
+    print(f"\n📁 {src_path} 검사 중...\n")
+
+    for result in run_files(process_file, all_files, jobs=args.jobs,
+                            manifest=manifest, cacheable=lambda changes: not changes,
+                            stats=run_stats, transaction=transaction, preview=preview, index=index,
+                            budget=args.rule_budget):
+        checked += 1
+        changes = result.value
+        if result.error:
+            print(f"❌ 오류 ({result.path}): {result.error}")
+        elif changes:
+            rel_path = result.path.relative_to(project_root)
             modified_files.append(str(rel_path))
             print(f"✅ {rel_path}")
             for change in changes:
                 print(change)
 
     print("\n" + "=" * 80)
-    print(f"✨ 완료: {len(modified_files)}개 파일 수정됨")
+    print(f"✨ 완료: {checked}개 파일 중 {len(modified_files)}개 파일 수정됨")
 
     if modified_files:
         print(f"\n수정된 파일 ({len(modified_files)}개):")
@@ -107,5 +136,10 @@ def main():
         if len(modified_files) > 30:
             print(f"  ... 외 {len(modified_files) - 30}개 파일")
 
+    if preview is not None:
+        preview.finish()
+    transaction.report(sys.argv[0])
+    run_stats.finish()
+
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -5,8 +5,34 @@
 - button 태그의 rounded-*, rounded를 rounded-full로 변경
 """
 
-import re
-from pathlib import Path
+import argparse
+import sys
+
+from codemods import stats
+from codemods.cache import add_cache_argument, open_manifest
+from codemods.converge import converge
+from codemods.discover import walk_files
+from codemods.edits import map_tokens, rewrite_spans, split_variant
+from codemods.fileio import read_source, write_source
+from codemods.gitfiles import add_git_arguments, find_project_root, select_files
+from codemods.guard import add_budget_argument
+from codemods.journal import Transaction, add_undo_argument, undo_last_run
+from codemods.lexer import lex
+from codemods.patch import add_dry_run_arguments, open_preview
+from codemods.runner import add_jobs_argument, run_files
+from codemods.stats import add_stats_arguments, open_stats
+from codemods.tokenindex import add_index_argument, open_index
+
+# rounded-full로 바꿀 클래스
+ROUNDED_TO_FULL = {'rounded', 'rounded-sm', 'rounded-md', 'rounded-lg', 'rounded-xl'}
+
+def _to_rounded_full(token):
+    """rounded, rounded-sm ... -> rounded-full (md: 등 변형 접두사 유지)"""
+    variant, utility = split_variant(token)
+    if utility in ROUNDED_TO_FULL:
+        stats.count(f'button-rounded-full: {utility}')
+        return variant + 'rounded-full'
+    return token
 
 def fix_button_styles(content, filepath):
     """버튼 스타일 수정"""
@@ -15,91 +41,102 @@ def fix_button_styles(content, filepath):
         return content, []
 
     changes = []
-    lines = content.split('\n')
-    modified_lines = []
-
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        original_line = line
-
-        # button 태그가 있는 라인 처리
-        if '<button' in line and 'className' in line:
-            # 이미 rounded-full이 있으면 그대로
-            if 'rounded-full' in line:
-                modified_lines.append(line)
-                i += 1
-                continue
-
-            # className 속성 찾기
-            class_match = re.search(r'className="([^"]*)"', line)
-            if class_match:
-                classes = class_match.group(1)
-
-                # rounded-* 패턴이 있으면 rounded-full로 변경
-                if re.search(r'\brounded(-\w+)?\b', classes):
-                    # rounded, rounded-sm, rounded-md, rounded-lg 등을 rounded-full로
-                    new_classes = re.sub(r'\brounded(-(?:sm|md|lg|xl))?\b', 'rounded-full', classes)
-                    line = line.replace(f'className="{classes}"', f'className="{new_classes}"')
-                    if line != original_line:
-                        changes.append('rounded 변경')
-                else:
-                    # rounded가 전혀 없으면 추가
-                    # className의 끝에 rounded-full 추가
-                    new_classes = classes.strip() + ' rounded-full' if classes.strip() else 'rounded-full'
-                    line = line.replace(f'className="{classes}"', f'className="{new_classes}"')
-                    if line != original_line:
-                        changes.append('rounded 추가')
-
-        modified_lines.append(line)
-        i += 1
-
-    return '\n'.join(modified_lines), changes
+
+    def fix_span(span):
+        # button 태그의 className="..." 만 처리
+        if span.tag != 'button' or span.kind != 'literal':
+            return None
+
+        classes = span.text
+        utilities = [split_variant(token)[1] for token in classes.split()]
+
+        # 이미 rounded-full이 있으면 그대로
+        if 'rounded-full' in utilities:
+            return None
+
+        # rounded-* 패턴이 있으면 rounded-full로 변경
+        if any(u == 'rounded' or u.startswith('rounded-') for u in utilities):
+            new_classes = map_tokens(classes, _to_rounded_full)
+            if new_classes != classes:
+                changes.append('rounded 변경')
+            return new_classes
+
+        # rounded가 전혀 없으면 className의 끝에 rounded-full 추가
+        stats.count('button-rounded-full: 추가')
+        changes.append('rounded 추가')
+        return classes.strip() + ' rounded-full' if classes.strip() else 'rounded-full'
+
+    spans = lex(content)
+    with stats.rule('button-rounded-full'):
+        modified_content, _ = rewrite_spans(content, spans, fix_span)
+    return modified_content, changes
 
 def process_file(filepath):
     """파일 처리"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+    original_content = read_source(filepath)
 
-        modified_content, changes = fix_button_styles(original_content, str(filepath))
+    modified_content, changes, _ = converge(
+        lambda content: fix_button_styles(content, str(filepath)), original_content)
 
-        if modified_content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
-            return len(changes)
+    if modified_content != original_content:
+        write_source(filepath, modified_content)
+        return len(changes)
 
-        return 0
-    except Exception as e:
-        print(f"❌ 오류 ({filepath}): {e}")
-        return 0
+    return 0
 
 def main():
     """메인 함수"""
-    project_root = Path('/Users/choihyodong/bs-learning-app-main')
+    parser = argparse.ArgumentParser(description='모든 버튼에 rounded-full 적용')
+    add_jobs_argument(parser)
+    add_budget_argument(parser)
+    add_cache_argument(parser)
+    add_index_argument(parser)
+    add_git_arguments(parser)
+    add_stats_arguments(parser)
+    add_undo_argument(parser)
+    add_dry_run_arguments(parser)
+    args = parser.parse_args()
+
+    project_root = find_project_root()
+    if args.undo:
+        return undo_last_run(project_root, 'fix-buttons-final')
+    manifest = open_manifest(args, project_root, 'fix-buttons-final', __file__, ROUNDED_TO_FULL)
+    run_stats = open_stats(args, project_root, 'fix-buttons-final')
+    transaction = Transaction(project_root, 'fix-buttons-final')
+    preview = open_preview(args, project_root)
     src_path = project_root / 'src'
 
     print("🔧 모든 버튼에 rounded-full 적용...")
     print("=" * 80)
 
-    # 모든 tsx, jsx 파일 찾기
-    all_files = list(src_path.rglob('*.tsx')) + list(src_path.rglob('*.jsx'))
-    all_files = [f for f in all_files if 'node_modules' not in str(f) and '.next' not in str(f)]
+    # 모든 tsx, jsx 파일 찾기 (node_modules, .next, .gitignore 제외)
+    with run_stats.phase('discover'):
+        all_files = select_files(args, project_root, src_path, {'.tsx', '.jsx'},
+                                 lambda: walk_files(src_path, {'.tsx', '.jsx'}, project_root))
+        # rounded가 없는 버튼에도 추가하므로 클래스와 무관하게 button이 있는 파일 전부
+        index = open_index(args, project_root, [(None, {'button'})])
 
-    print(f"\n📁 {len(all_files)}개 파일 검사 중...\n")
+    print(f"\n📁 {src_path} 검사 중...\n")
 
+    checked = 0
     modified_files = []
     total_changes = 0
 
-    for filepath in all_files:
-        changes_count = process_file(filepath)
-        if changes_count > 0:
-            rel_path = filepath.relative_to(project_root)
+    for result in run_files(process_file, all_files, jobs=args.jobs,
+                            manifest=manifest, cacheable=lambda changes: not changes,
+                            stats=run_stats, transaction=transaction, preview=preview, index=index,
+                            budget=args.rule_budget):
+        checked += 1
+        changes_count = result.value
+        if result.error:
+            print(f"❌ 오류 ({result.path}): {result.error}")
+        elif changes_count > 0:
+            rel_path = result.path.relative_to(project_root)
             modified_files.append((str(rel_path), changes_count))
             total_changes += changes_count
 
     print("\n" + "=" * 80)
-    print(f"✨ 완료: {len(modified_files)}개 파일, 총 {total_changes}개 버튼 수정")
+    print(f"✨ 완료: {checked}개 파일 중 {len(modified_files)}개 파일, 총 {total_changes}개 버튼 수정")
 
     if modified_files:
         print(f"\n수정된 파일:")
@@ -108,5 +145,10 @@ def main():
         if len(modified_files) > 50:
             print(f"  ... 외 {len(modified_files) - 50}개 파일")
 
+    if preview is not None:
+        preview.finish()
+    transaction.report(sys.argv[0])
+    run_stats.finish()
+
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
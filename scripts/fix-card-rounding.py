@@ -4,9 +4,27 @@
 rounded-2xl, rounded-3xl -> rounded-lg 변경 (버튼 제외)
 """
 
-import os
-import re
-from pathlib import Path
+import argparse
+import sys
+from collections import Counter
+
+from codemods import stats
+from codemods.cache import add_cache_argument, open_manifest
+from codemods.converge import converge
+from codemods.edits import map_tokens, rewrite_spans, split_variant
+from codemods.fileio import read_source, write_source
+from codemods.gitfiles import add_git_arguments, filter_changed, find_project_root
+from codemods.guard import add_budget_argument
+from codemods.journal import Transaction, add_undo_argument, undo_last_run
+from codemods.lexer import lex
+from codemods.patch import add_dry_run_arguments, open_preview
+from codemods.runner import add_jobs_argument, run_files
+from codemods.stats import add_stats_arguments, open_stats
+from codemods.tokenindex import add_index_argument, open_index
+
+# 카드 컨테이너 태그와 지나치게 둥근 클래스
+CARD_TAGS = {'div', 'section', 'article', 'main'}
+CARD_ROUNDED = {'rounded-2xl', 'rounded-3xl'}
 
 def should_process_file(filepath):
     """처리할 파일인지 확인"""
@@ -15,59 +33,61 @@ def should_process_file(filepath):
 def fix_card_rounding(content):
     """카드 컨테이너의 border radius 수정"""
     changes = []
+    counts = Counter()
 
     # 패턴: rounded-2xl 또는 rounded-3xl을 rounded-lg로 변경
     # 단, 버튼이 아닌 div, section, article 등의 컨테이너만 대상
+    def replace_token(token, tag):
+        variant, utility = split_variant(token)
+        if utility in CARD_ROUNDED:
+            counts[(tag, utility)] += 1
+            return variant + 'rounded-lg'
+        return token
+
+    def fix_span(span):
+        if span.tag not in CARD_TAGS or span.kind != 'literal':
+            return None
+        return map_tokens(span.text, lambda token: replace_token(token, span.tag))
 
-    # 1. div, section, article 등의 className에서 rounded-2xl/3xl -> rounded-lg
-    patterns = [
-        # div className="... rounded-2xl ..."
-        (r'(<div[^>]*className="[^"]*)\brounded-2xl\b([^"]*"[^>]*>)', r'\1rounded-lg\2'),
-        (r'(<div[^>]*className="[^"]*)\brounded-3xl\b([^"]*"[^>]*>)', r'\1rounded-lg\2'),
-
-        # section, article, main 등
-        (r'(<section[^>]*className="[^"]*)\brounded-2xl\b([^"]*"[^>]*>)', r'\1rounded-lg\2'),
-        (r'(<section[^>]*className="[^"]*)\brounded-3xl\b([^"]*"[^>]*>)', r'\1rounded-lg\2'),
-        (r'(<article[^>]*className="[^"]*)\brounded-2xl\b([^"]*"[^>]*>)', r'\1rounded-lg\2'),
-        (r'(<article[^>]*className="[^"]*)\brounded-3xl\b([^"]*"[^>]*>)', r'\1rounded-lg\2'),
-        (r'(<main[^>]*className="[^"]*)\brounded-2xl\b([^"]*"[^>]*>)', r'\1rounded-lg\2'),
-        (r'(<main[^>]*className="[^"]*)\brounded-3xl\b([^"]*"[^>]*>)', r'\1rounded-lg\2'),
-    ]
+    spans = lex(content)
+    with stats.rule('card-rounded-lg'):
+        modified_content, _ = rewrite_spans(content, spans, fix_span)
 
-    modified_content = content
-    for pattern, replacement in patterns:
-        new_content = re.sub(pattern, replacement, modified_content)
-        if new_content != modified_content:
-            count = len(re.findall(pattern, modified_content))
-            changes.append(f"  - {pattern[:50]}... : {count}개 변경")
-            modified_content = new_content
+    for (tag, utility), count in counts.items():
+        stats.count(f'card-rounded-lg: {utility}', count)
+        changes.append(f"  - <{tag}> {utility} -> rounded-lg : {count}개 변경")
 
     return modified_content, changes
 
 def process_file(filepath):
     """파일 처리"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+    original_content = read_source(filepath)
 
-        # 버튼 관련 파일은 스킵
-        if 'Button.tsx' in filepath or 'button.tsx' in filepath:
-            return None
+    # 버튼 관련 파일은 스킵
+    if 'Button.tsx' in filepath or 'button.tsx' in filepath:
+        return None
 
-        modified_content, changes = fix_card_rounding(original_content)
+    modified_content, changes, _ = converge(fix_card_rounding, original_content)
 
-        if modified_content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
-            return changes
+    if modified_content != original_content:
+        write_source(filepath, modified_content)
+        return changes
 
-        return None
-    except Exception as e:
-        print(f"❌ 오류 발생 ({filepath}): {e}")
-        return None
+    return None
 
 def main():
     """메인 함수"""
+    parser = argparse.ArgumentParser(description='카드 border radius 수정')
+    add_jobs_argument(parser)
+    add_budget_argument(parser)
+    add_cache_argument(parser)
+    add_index_argument(parser)
+    add_git_arguments(parser)
+    add_stats_arguments(parser)
+    add_undo_argument(parser)
+    add_dry_run_arguments(parser)
+    args = parser.parse_args()
+
     # 타겟 파일들
     target_files = [
         'src/components/performance/PerformanceTracking.tsx',
@@ -80,13 +100,21 @@ def main():
         'src/components/users/UserManagement.tsx',
     ]
 
-    project_root = Path('/Users/choihyodong/bs-learning-app-main')
+    project_root = find_project_root()
+    if args.undo:
+        return undo_last_run(project_root, 'fix-card-rounding')
+    manifest = open_manifest(args, project_root, 'fix-card-rounding', __file__, CARD_TAGS, CARD_ROUNDED)
+    run_stats = open_stats(args, project_root, 'fix-card-rounding')
+    transaction = Transaction(project_root, 'fix-card-rounding')
+    preview = open_preview(args, project_root)
 
     print("🔧 카드 border radius 수정 시작...")
     print("=" * 60)
 
     modified_files = []
 
+    target_paths = {}
+
     for rel_path in target_files:
         filepath = project_root / rel_path
 
@@ -94,12 +122,24 @@ def main():
             print(f"⚠️  파일 없음: {rel_path}")
             continue
 
-        if not should_process_file(str(filepath)):
-            continue
+        if should_process_file(str(filepath)):
+            target_paths[str(filepath)] = rel_path
 
-        changes = process_file(str(filepath))
+    # git 모드면 변경된 파일만
+    with run_stats.phase('discover'):
+        changed_paths = filter_changed(args, project_root, target_paths)
+        index = open_index(args, project_root, [(CARD_ROUNDED, CARD_TAGS)])
 
-        if changes:
+    for result in run_files(process_file, changed_paths, jobs=args.jobs,
+                            manifest=manifest, cacheable=lambda changes: not changes,
+                            stats=run_stats, transaction=transaction, preview=preview, index=index,
+                            budget=args.rule_budget):
+        rel_path = target_paths[result.path]
+        changes = result.value
+
+        if result.error:
+            print(f"❌ 오류 발생 ({rel_path}): {result.error}")
+        elif changes:
             modified_files.append(rel_path)
             print(f"\n✅ {rel_path}")
             for change in changes:
@@ -113,5 +153,10 @@ def main():
         for filepath in modified_files:
             print(f"  - {filepath}")
 
+    if preview is not None:
+        preview.finish()
+    transaction.report(sys.argv[0])
+    run_stats.finish()
+
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
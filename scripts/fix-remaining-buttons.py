@@ -5,35 +5,55 @@
 - 모든 버튼 요소 완벽하게 처리
 """
 
-import os
-import re
+import argparse
+import sys
+from collections import Counter
 from pathlib import Path
 
+from codemods import stats
+from codemods.cache import add_cache_argument, open_manifest
+from codemods.converge import converge
+from codemods.discover import walk_files
+from codemods.edits import map_tokens, rewrite_spans, split_variant
+from codemods.fileio import read_source, write_source
+from codemods.gitfiles import add_git_arguments, find_project_root, select_files
+from codemods.guard import add_budget_argument
+from codemods.journal import Transaction, add_undo_argument, undo_last_run
+from codemods.lexer import lex
+from codemods.patch import add_dry_run_arguments, open_preview
+from codemods.runner import add_jobs_argument, run_files
+from codemods.stats import add_stats_arguments, open_stats
+from codemods.tokenindex import add_index_argument, open_index
+
+# button 태그에서 rounded, rounded-md, rounded-lg, rounded-sm -> rounded-full
+ROUNDED_TO_FULL = ('rounded', 'rounded-md', 'rounded-lg', 'rounded-sm')
+
 def fix_button_styles(content):
     """버튼의 border radius를 rounded-full로 변경"""
     changes = []
-    modified_content = content
-
-    # 패턴 1: button 태그에서 rounded, rounded-md, rounded-lg -> rounded-full
-    # className="... rounded ..." 형태
-    patterns = [
-        # rounded만 있는 경우 (가장 많이 누락됨)
-        (r'(<button[^>]*className="[^"]*)\brounded\b(?!\-)', r'\1rounded-full'),
-        # rounded-md
-        (r'(<button[^>]*className="[^"]*)\brounded-md\b', r'\1rounded-full'),
-        # rounded-lg
-        (r'(<button[^>]*className="[^"]*)\brounded-lg\b', r'\1rounded-full'),
-        # rounded-sm
-        (r'(<button[^>]*className="[^"]*)\brounded-sm\b', r'\1rounded-full'),
-    ]
-
-    for pattern, replacement in patterns:
-        before = modified_content
-        modified_content = re.sub(pattern, replacement, modified_content)
-        if modified_content != before:
-            count = len(re.findall(pattern, before))
-            pattern_name = pattern.split(r'\b')[1] if r'\b' in pattern else 'rounded'
-            changes.append(f"  - {pattern_name}: {count}개 변경")
+    counts = Counter()
+
+    def replace_token(token):
+        variant, utility = split_variant(token)
+        if utility in ROUNDED_TO_FULL:
+            counts[utility] += 1
+            return variant + 'rounded-full'
+        return token
+
+    def fix_span(span):
+        # className="... rounded ..." 형태
+        if span.tag != 'button' or span.kind != 'literal':
+            return None
+        return map_tokens(span.text, replace_token)
+
+    spans = lex(content)
+    with stats.rule('button-rounded-full'):
+        modified_content, _ = rewrite_spans(content, spans, fix_span)
+
+    for name in ROUNDED_TO_FULL:
+        if counts[name]:
+            stats.count(f'button-rounded-full: {name}', counts[name])
+            changes.append(f"  - {name}: {counts[name]}개 변경")
 
     return modified_content, changes
 
@@ -46,44 +66,58 @@ def should_process_file(filepath):
 
 def process_file(filepath):
     """파일 처리"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            original_content = f.read()
-
-        modified_content, changes = fix_button_styles(original_content)
+    original_content = read_source(filepath)
 
-        if modified_content != original_content:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(modified_content)
-            return changes
+    modified_content, changes, _ = converge(fix_button_styles, original_content)
 
-        return None
-    except Exception as e:
-        print(f"❌ 오류 발생 ({filepath}): {e}")
-        return None
+    if modified_content != original_content:
+        write_source(filepath, modified_content)
+        return changes
 
-def find_all_component_files(base_path):
-    """모든 컴포넌트 파일 찾기"""
-    files = []
-    for ext in ['**/*.tsx', '**/*.ts', '**/*.jsx', '**/*.js']:
-        files.extend(Path(base_path).glob(ext))
-    return [str(f) for f in files if should_process_file(str(f))]
+    return None
 
 def main():
     """메인 함수"""
-    project_root = Path('/Users/choihyodong/bs-learning-app-main')
+    parser = argparse.ArgumentParser(description='누락된 버튼 스타일 수정')
+    add_jobs_argument(parser)
+    add_budget_argument(parser)
+    add_cache_argument(parser)
+    add_index_argument(parser)
+    add_git_arguments(parser)
+    add_stats_arguments(parser)
+    add_undo_argument(parser)
+    add_dry_run_arguments(parser)
+    args = parser.parse_args()
+
+    project_root = find_project_root()
+    if args.undo:
+        return undo_last_run(project_root, 'fix-remaining-buttons')
+    manifest = open_manifest(args, project_root, 'fix-remaining-buttons', __file__, ROUNDED_TO_FULL)
+    run_stats = open_stats(args, project_root, 'fix-remaining-buttons')
+    transaction = Transaction(project_root, 'fix-remaining-buttons')
+    preview = open_preview(args, project_root)
     src_path = project_root / 'src'
 
     print("🔧 누락된 버튼 스타일 수정 시작...")
     print("=" * 60)
 
-    all_files = find_all_component_files(src_path)
+    suffixes = {'.tsx', '.ts', '.jsx', '.js'}
+    with run_stats.phase('discover'):
+        all_files = select_files(args, project_root, src_path, suffixes,
+                                 lambda: walk_files(src_path, suffixes, project_root))
+        index = open_index(args, project_root, [(ROUNDED_TO_FULL, {'button'})])
+    all_files = (str(f) for f in all_files if should_process_file(str(f)))
     modified_files = []
 
-    for filepath in all_files:
-        changes = process_file(filepath)
-        if changes:
-            rel_path = Path(filepath).relative_to(project_root)
+    for result in run_files(process_file, all_files, jobs=args.jobs,
+                            manifest=manifest, cacheable=lambda changes: not changes,
+                            stats=run_stats, transaction=transaction, preview=preview, index=index,
+                            budget=args.rule_budget):
+        changes = result.value
+        if result.error:
+            print(f"❌ 오류 발생 ({result.path}): {result.error}")
+        elif changes:
+            rel_path = Path(result.path).relative_to(project_root)
             modified_files.append(str(rel_path))
             print(f"\n✅ {rel_path}")
             for change in changes:
@@ -99,5 +133,10 @@ def main():
         if len(modified_files) > 20:
             print(f"  ... 외 {len(modified_files) - 20}개 파일")
 
+    if preview is not None:
+        preview.finish()
+    transaction.report(sys.argv[0])
+    run_stats.finish()
+
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
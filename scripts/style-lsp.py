@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+스타일 규칙 LSP 서버 (stdio)
+- 열린 파일의 버튼/카드/다크모드 규칙 위반을 진단으로 표시
+- 규칙별 quickfix와 파일 전체 수정(source.fixAll.style-rules)을 code action으로 제공
+- 편집하면 바뀐 여는 태그만 다시 분석
+
+편집기 설정 예 (명령): python3 scripts/style-lsp.py
+점검: cd scripts && python3 -m codemods.lspcheck ../src
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from codemods.lsp import Server
+from codemods.rules import DEFAULT_RULES_PATH
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description='스타일 규칙 LSP 서버 (stdio)')
+    parser.add_argument('--rules', type=Path, default=DEFAULT_RULES_PATH,
+                        help=f'규칙 파일 (기본: {DEFAULT_RULES_PATH.name})')
+    parser.add_argument('--log', type=Path, help='오류 로그 파일 (기본: stderr)')
+    parser.add_argument('--stdio', action='store_true', help='stdio 사용 (기본값, 편집기 호환용)')
+    args = parser.parse_args()
+
+    if args.log:
+        sys.stderr = open(args.log, 'a', encoding='utf-8', buffering=1)
+
+    server = Server(sys.stdin.buffer, sys.stdout.buffer, args.rules)
+    return server.serve()
+
+
+if __name__ == '__main__':
+    sys.exit(main())